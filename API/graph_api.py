@@ -20,7 +20,7 @@ load_dotenv()
 # Import Neo4j functions only
 from src.graph.ops.topic import get_topic_by_id
 from src.analysis.utils.report_aggregator import aggregate_reports
-from src.graph.neo4j_client import run_cypher
+from src.graph.neo4j_client import run_cypher, close_driver
 
 # Initialize FastAPI
 app = FastAPI(
@@ -38,6 +38,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.on_event("shutdown")
+def close_neo4j_pool():
+    """Release pooled Neo4j connections on shutdown"""
+    close_driver()
+
 # Models - No LLM needed anymore!
 
 
@@ -286,10 +292,14 @@ def build_context(request: ContextRequest):
         
         # If full content requested, load article files
         if include_full and articles:
-            from src.storage.article_loader import load_article
+            from src.articles.load_article import load_articles
+            try:
+                full_articles = load_articles(article["id"] for article in articles)
+            except Exception:
+                full_articles = {}
             for article in articles:
                 try:
-                    full_article = load_article(article["id"])
+                    full_article = full_articles.get(article["id"])
                     if full_article:
                         # Add full content fields
                         article["content"] = full_article.get("content", "")
@@ -23,19 +23,22 @@ load_env()
 
 import datetime
 from typing import Dict, Any
-import time
 import math
 from dateutil import parser as date_parser
 # Fixed article count for all topics (no importance-based variation)
 DEFAULT_ARTICLES_PER_QUERY = 20
+# Longest the loop waits for a due topic before re-running the daily checks
+SCHEDULER_MAX_WAIT_S = 1800
 
 # Import from V1 using absolute imports
 from src.graph.ops.topic import get_all_topics
 from src.clients.perigon.news_ingestion_orchestrator import NewsIngestionOrchestrator
 from utils import app_logging
 from src.observability.stats_client import track
-from src.graph.scheduling.query_overdue import query_overdue_seconds
+from src.graph.scheduling.topic_claims import WORKER_ID, claim_next, release
+from src.graph.scheduling.topic_scheduler import get_topic_scheduler
 from src.graph.neo4j_client import run_cypher
+from src.vector.indexer import index_changes
 from worker.workflows.topic_enrichment import backfill_topic_from_storage
 from src.strategy_agents.orchestrator import analyze_user_strategy
 from src.api.backend_client import get_user_strategies, get_all_users
@@ -100,6 +103,8 @@ def run_pipeline() -> Dict[str, Any]:
         logger.info("✅ Bootstrap complete! Starting pipeline...")
         just_bootstrapped = True
 
+    scheduler = get_topic_scheduler(names=[ASSET] if ASSET else None)
+
     while True:
         loop_start_time = datetime.datetime.now()
         logger.info(
@@ -170,141 +175,116 @@ def run_pipeline() -> Dict[str, Any]:
         # Market data update (3x daily: 6am, 10am, 4pm)
         run_market_data_if_needed()
 
-        # Fresh fetch and selection each iteration
-        topics = get_all_topics(
-            fields=[
-                "id",
-                "name",
-                "type",
-                "query",
-                "queries",
-                "last_queried",
-                "last_updated",
-                "last_analyzed",
-            ]
+        # Wait for the next due topic (event-driven; bounded so the daily
+        # analysis / market data checks above still run)
+        due_ids = scheduler.wait_due(n=1, timeout=SCHEDULER_MAX_WAIT_S)
+        sched_stats = scheduler.stats()
+        logger.info(
+            f"Scheduler: topics={sched_stats['topics']} queue_depth={sched_stats['queue_depth']} "
+            f"lag={sched_stats['lag_s']}s next_due_in={sched_stats['next_due_in_s']}s"
         )
-        assert topics, "No Topic topics found in graph."
-
-        # Optional filter to a single asset
-        if ASSET:
-            topics = [n for n in topics if n["name"] == ASSET]
-            assert topics, f"No Topic topic found for ASSET={ASSET}"
+        if not due_ids:
+            continue
 
-        # Log all topic IDs for diagnostics
-        logger.info(f"📋 Loaded {len(topics)} topics from database")
-        logger.debug(f"Topic IDs: {[t['id'] for t in topics[:10]]}...")  # Show first 10
-        
-        # Compute SLA overdue seconds and select only overdue topics
-        overdues = [(n, query_overdue_seconds(n)) for n in topics]
-        overdue_topics = [(n, o) for n, o in overdues if o > 0]
-
-        if not overdue_topics:
-            # All topics are within their SLA windows. Sleep until the earliest topic becomes due (clamped 60s..30m).
-            next_due_in = min(-o for _, o in overdues) if overdues else 300
-            sleep_seconds = min(max(60, int(next_due_in)), 1800)
-            logger.info(
-                f"All topics within SLA. Next due in {sleep_seconds // 60}m {sleep_seconds % 60}s. Sleeping {sleep_seconds}s..."
-            )
-            time.sleep(sleep_seconds)
+        # Claim under a lease: one atomic query, so several ingest workers
+        # never pick the same topic, and never one another worker has queried
+        # since our schedule last saw it
+        claimed = claim_next(n=1, ids=due_ids, seen_queried=scheduler.last_queried_snapshot(due_ids))
+        if not claimed:
+            # Another worker queried or leased it - reschedule from the graph
+            logger.info(f"Topic(s) {due_ids} already claimed elsewhere, rescheduling")
+            scheduler.resync(due_ids)
             continue
 
-        # Pick the most overdue topic
-        topic, topic_overdue = max(overdue_topics, key=lambda x: x[1])
+        topic = claimed[0]
+        topic_overdue = topic["overdue_seconds"]
         topic_id = topic["id"]
         topic_name = topic["name"]
-        topic_type = topic["type"]
-
-        # Log what we're trying to claim
-        logger.info(f"🎯 Attempting to claim topic: id='{topic_id}', name='{topic_name}'")
+        logger.info(f"🎯 Claimed topic: id='{topic_id}', name='{topic_name}' (worker={WORKER_ID})")
         logger.debug(f"Topic data: {topic}")
-        
-        # Immediately claim by setting last_queried
-        claim_res = run_cypher(
-            "MATCH (t:Topic {id: $id}) SET t.last_queried = datetime() RETURN t.id AS id",
-            {"id": topic_id},
-        )
-        
-        # Skip if claim fails (topic might have been deleted or race condition)
-        if not claim_res or not claim_res[0] or claim_res[0].get("id") != topic_id:
-            logger.error(f"❌ CLAIM FAILED for topic id='{topic_id}' name='{topic_name}'")
-            logger.error(f"Claim query returned: {claim_res}")
-            logger.error(f"Expected id: '{topic_id}' (type: {type(topic_id).__name__})")
-            
-            # Try to find if topic exists with different query
-            check_res = run_cypher(
-                "MATCH (t:Topic) WHERE t.id = $id OR t.name = $name RETURN t.id AS id, t.name AS name",
-                {"id": topic_id, "name": topic_name},
-            )
-            logger.error(f"Topic existence check: {check_res}")
-            
-            continue  # Skip to next topic in the loop
 
-        logger.info(
-            "================================================================================================="
-        )
-        logger.info(
-            "================================================================================================="
-        )
-        logger.info(f"Processing topic        : {topic_name}")
-        logger.info(f"Processing type        : {topic_type}")
-        logger.info(f"Processing last_queried: {topic['last_queried']}")
-        logger.info(f"Processing last_analyzed: {format_time_delta(topic.get('last_analyzed', 'Never'))}")
-
-        if not math.isfinite(topic_overdue):
-            # Missing or invalid last_queried -> treat as first run
-            logger.info("Overdue by             : first run (no last_queried)")
-        else:
-            odelta = int(topic_overdue // 60)
-            if odelta >= 0:
-                # Overdue by
-                if odelta >= 1440:
-                    logger.info(
-                        f"Overdue by             : {odelta // 1440}d {(odelta % 1440) // 60}h {odelta % 60}m"
-                    )
-                elif odelta >= 60:
-                    logger.info(
-                        f"Overdue by             : {odelta // 60}h {odelta % 60}m"
-                    )
-                else:
-                    logger.info(f"Overdue by             : {odelta}m")
-            else:
-                # Due in
-                mins = -odelta
-                if mins >= 1440:
-                    logger.info(
-                        f"Due in                 : {mins // 1440}d {(mins % 1440) // 60}h {mins % 60}m"
-                    )
-                elif mins >= 60:
-                    logger.info(f"Due in                 : {mins // 60}h {mins % 60}m")
-                else:
-                    logger.info(f"Due in                 : {mins}m")
-
-        query = topic["query"]
-        orchestrator.run_query(topic_name, query, max_articles=DEFAULT_ARTICLES_PER_QUERY)
+        try:
+            _process_claimed_topic(orchestrator, topic, topic_overdue)
+        finally:
+            release(topic_id)
+            scheduler.mark_queried(topic_id, queried_at=topic.get("queried_at"))
 
-        # Increment queries after successful processing
-        res = run_cypher(
-            "MATCH (t:Topic {id: $id}) SET t.queries = coalesce(t.queries, 0) + 1 RETURN t.queries AS queries",
-            {"id": topic_id},
-        )
-        assert res, f"Failed to increment queries for topic id={topic_id}"
-        logger.info(f"topic updated | id={topic_id} | queries={res[0]['queries']}")
-
-        # Opportunistic enrichment: backfill this asset from cold storage to build graph faster
-        added_cnt = backfill_topic_from_storage(
-            topic_id=topic_id,
-            test=False,
-        )
-        logger.info(
-            f"Backfill completed for id={topic_id} | added_articles={added_cnt}"
-        )
-        # NOTE: Analysis is now triggered in add_article() when Level 2/3 articles are added
+        # Keep Qdrant in step with ABOUT edges re-tiered, archived or removed since the last sync
+        try:
+            index_changes()
+        except Exception as e:
+            logger.error(f"Vector index sync failed (retried next cycle): {e}")
 
         logger.info("Pipeline run complete.")
         track("pipeline_run_completed")
 
-        # Scheduler: no fixed cycle sleep; loop continues. Sleeping is handled when no topics are overdue.
-        logger.info("SLEEPING FUNCTION IS MISSING!!")
+
+def _process_claimed_topic(orchestrator: NewsIngestionOrchestrator, topic: Dict[str, Any], topic_overdue: int) -> None:
+    """Query, count and backfill one topic this worker holds the lease for."""
+    topic_id = topic["id"]
+    topic_name = topic["name"]
+    topic_type = topic["type"]
+
+    logger.info(
+        "================================================================================================="
+    )
+    logger.info(
+        "================================================================================================="
+    )
+    logger.info(f"Processing topic        : {topic_name}")
+    logger.info(f"Processing type        : {topic_type}")
+    logger.info(f"Processing last_queried: {topic['last_queried']}")
+    logger.info(f"Processing last_analyzed: {format_time_delta(topic.get('last_analyzed', 'Never'))}")
+
+    if not math.isfinite(topic_overdue):
+        # Missing or invalid last_queried -> treat as first run
+        logger.info("Overdue by             : first run (no last_queried)")
+    else:
+        odelta = int(topic_overdue // 60)
+        if odelta >= 0:
+            # Overdue by
+            if odelta >= 1440:
+                logger.info(
+                    f"Overdue by             : {odelta // 1440}d {(odelta % 1440) // 60}h {odelta % 60}m"
+                )
+            elif odelta >= 60:
+                logger.info(
+                    f"Overdue by             : {odelta // 60}h {odelta % 60}m"
+                )
+            else:
+                logger.info(f"Overdue by             : {odelta}m")
+        else:
+            # Due in
+            mins = -odelta
+            if mins >= 1440:
+                logger.info(
+                    f"Due in                 : {mins // 1440}d {(mins % 1440) // 60}h {mins % 60}m"
+                )
+            elif mins >= 60:
+                logger.info(f"Due in                 : {mins // 60}h {mins % 60}m")
+            else:
+                logger.info(f"Due in                 : {mins}m")
+
+    query = topic["query"]
+    orchestrator.run_query(topic_name, query, max_articles=DEFAULT_ARTICLES_PER_QUERY)
+
+    # Increment queries after successful processing
+    res = run_cypher(
+        "MATCH (t:Topic {id: $id}) SET t.queries = coalesce(t.queries, 0) + 1 RETURN t.queries AS queries",
+        {"id": topic_id},
+    )
+    assert res, f"Failed to increment queries for topic id={topic_id}"
+    logger.info(f"topic updated | id={topic_id} | queries={res[0]['queries']}")
+
+    # Opportunistic enrichment: backfill this asset from cold storage to build graph faster
+    added_cnt = backfill_topic_from_storage(
+        topic_id=topic_id,
+        test=False,
+    )
+    logger.info(
+        f"Backfill completed for id={topic_id} | added_articles={added_cnt}"
+    )
+    # NOTE: Analysis is now triggered in add_article() when Level 2/3 articles are added
 
 
 if __name__ == "__main__":
@@ -55,7 +55,7 @@ from src.api.backend_client import get_user_strategies, get_all_users, get_strat
 from src.graph.neo4j_client import run_cypher
 from src.config.worker_mode import get_mode_description
 from src.observability.stats_client import track
-from src.analysis.rewrite_policy import should_rewrite_topic
+from src.analysis.rewrite_policy import plan_rewrites, next_rewrite, record_rewrite_failure
 from src.maintenance.orphan_cleanup import run_orphan_cleanup
 from utils import app_logging
 from dateutil import parser as date_parser
@@ -69,7 +69,39 @@ _last_strategy_date = None
 _last_orphan_cleanup_date = None
 
 
-def strategy_needs_update(username: str, strategy_id: str) -> tuple[bool, str]:
+def get_topics_last_analyzed() -> dict:
+    """{topic_id: last_analyzed} for every analyzed topic, in one query."""
+    query = """
+    MATCH (t:Topic)
+    WHERE t.last_analyzed IS NOT NULL
+    RETURN t.id AS topic_id, t.last_analyzed AS last_analyzed
+    """
+    return {row["topic_id"]: row["last_analyzed"] for row in run_cypher(query) or []}
+
+
+def get_topic_last_analyzed(topic_id: str):
+    """A topic's last_analyzed (None if never analyzed or missing)."""
+    rows = run_cypher(
+        "MATCH (t:Topic {id: $topic_id}) RETURN t.last_analyzed AS last_analyzed",
+        {"topic_id": topic_id},
+    )
+    return rows[0]["last_analyzed"] if rows else None
+
+
+def _back_off_rewrite(topic_id: str) -> None:
+    """Record a failed/no-progress rewrite so the planner moves on to the next topic."""
+    try:
+        record_rewrite_failure(topic_id)
+    except Exception as record_error:
+        logger.warning(f"Could not record rewrite failure for {topic_id}: {record_error}")
+
+
+def strategy_needs_update(
+    username: str,
+    strategy_id: str,
+    strategy: Optional[dict] = None,
+    topics_last_analyzed: Optional[dict] = None,
+) -> tuple[bool, str]:
     """
     Check if strategy needs reanalysis.
 
@@ -83,12 +115,16 @@ def strategy_needs_update(username: str, strategy_id: str) -> tuple[bool, str]:
     Args:
         username: User who owns the strategy
         strategy_id: Strategy ID to check
+        strategy: Strategy dict if the caller already has it (skips one API call)
+        topics_last_analyzed: {topic_id: last_analyzed} from get_topics_last_analyzed()
+            when checking many strategies (skips one query per strategy)
 
     Returns:
         Tuple of (needs_update: bool, reason: str)
     """
     # Get strategy details
-    strategy = get_strategy(username, strategy_id)
+    if strategy is None or "latest_analysis" not in strategy:
+        strategy = get_strategy(username, strategy_id)
     if not strategy:
         return False, "strategy_not_found"
 
@@ -122,13 +158,19 @@ def strategy_needs_update(username: str, strategy_id: str) -> tuple[bool, str]:
         return True, "needs_topic_discovery"
 
     # Check if any linked topic has newer analysis via Neo4j
-    query = """
-    UNWIND $topic_ids AS topic_id
-    MATCH (t:Topic {id: topic_id})
-    WHERE t.last_analyzed IS NOT NULL
-    RETURN t.id AS topic_id, t.last_analyzed AS last_analyzed
-    """
-    result = run_cypher(query, {"topic_ids": topic_ids})
+    if topics_last_analyzed is not None:
+        result = [
+            {"topic_id": tid, "last_analyzed": topics_last_analyzed[tid]}
+            for tid in dict.fromkeys(topic_ids) if tid in topics_last_analyzed
+        ]
+    else:
+        query = """
+        UNWIND $topic_ids AS topic_id
+        MATCH (t:Topic {id: topic_id})
+        WHERE t.last_analyzed IS NOT NULL
+        RETURN t.id AS topic_id, t.last_analyzed AS last_analyzed
+        """
+        result = run_cypher(query, {"topic_ids": topic_ids})
 
     for row in result or []:
         topic_last_analyzed = row.get("last_analyzed")
@@ -206,14 +248,25 @@ def write_single_topic(topic_id: str, new_article_ids: Optional[List[str]] = Non
         logger.info(f"🎯 Writing analysis for: {topic_id}")
         if new_article_ids:
             logger.info(f"   📰 Highlighting {len(new_article_ids)} NEW articles to agents")
+        last_analyzed_before = get_topic_last_analyzed(topic_id)
 
         # Pass new_article_ids to orchestrator so agents know what's new
         analysis_rewriter_with_agents(topic_id, new_article_ids=new_article_ids)
+
+        # No section saved (no material) or the last_analyzed write failed: the plan would
+        # pick this topic again on every loop, so treat it like a failure and back off
+        if get_topic_last_analyzed(topic_id) == last_analyzed_before:
+            logger.warning(f"No progress for {topic_id}: last_analyzed did not advance")
+            track("agent_analysis_no_progress", f"{topic_id}")
+            _back_off_rewrite(topic_id)
+            return False
+
         logger.info(f"✅ Completed: {topic_id}")
         track("agent_analysis_completed", f"{topic_id}")
         return True
     except Exception as e:
         logger.error(f"Failed {topic_id}: {e}")
+        _back_off_rewrite(topic_id)
         return False
 
 
@@ -227,48 +280,42 @@ def write_all_topics(shuffle: bool = True, force: bool = False) -> dict:
     - Highlights new articles to agents for focused analysis
 
     Args:
-        shuffle: Randomize topic order for balanced coverage
+        shuffle: Randomize topic order (force mode only; otherwise topics are
+            written in the planner's ranked order, see rewrite_policy._rank_key)
         force: If True, skip rewrite checks and write all topics
 
     Returns:
         dict with success/failure/skipped counts
     """
-    all_topics = get_all_topics(fields=["id", "name"])
-    topic_ids = [t["id"] for t in all_topics]
+    if force:
+        # Force mode doesn't track new articles
+        plan = []
+        work = [(t["id"], None) for t in get_all_topics(fields=["id"])]
+        if shuffle:
+            random.shuffle(work)
+            logger.info("🎲 Shuffled order for balanced coverage")
+    else:
+        # Smart rewrite check: one planner query, already ranked (no shuffle needed)
+        plan = plan_rewrites()
+        work = [(c["topic_id"], c["new_article_ids"]) for c in plan if c["should_rewrite"]]
 
     logger.info(f"{'='*60}")
-    logger.info(f"📊 WRITE ALL TOPICS - Checking {len(topic_ids)} topics")
+    logger.info(f"📊 WRITE ALL TOPICS - {len(work)} topics to write")
     if force:
         logger.info("⚠️  FORCE MODE: Skipping rewrite checks")
     logger.info(f"{'='*60}")
 
-    if shuffle:
-        random.shuffle(topic_ids)
-        logger.info("🎲 Shuffled order for balanced coverage")
-
     stats = {
         "success": 0,
         "failed": 0,
-        "skipped_no_new": 0,
-        "skipped_cooldown": 0,
-        "total": len(topic_ids)
+        "skipped_no_new": sum(1 for c in plan if c["reason"] == "no_new_articles"),
+        "skipped_cooldown": sum(1 for c in plan if c["reason"] == "cooldown"),
+        "skipped_failed": sum(1 for c in plan if c["reason"] == "failure_cooldown"),
+        "total": len(plan) if plan else len(work)
     }
 
-    for i, topic_id in enumerate(topic_ids, 1):
-        logger.info(f"[{i}/{len(topic_ids)}] Checking {topic_id}")
-
-        # Smart rewrite check (unless force mode)
-        if not force:
-            should_write, reason, new_article_ids = should_rewrite_topic(topic_id)
-
-            if not should_write:
-                if reason == "no_new_articles":
-                    stats["skipped_no_new"] += 1
-                elif reason == "cooldown":
-                    stats["skipped_cooldown"] += 1
-                continue
-        else:
-            new_article_ids = None  # Force mode doesn't track new articles
+    for i, (topic_id, new_article_ids) in enumerate(work, 1):
+        logger.info(f"[{i}/{len(work)}] Writing {topic_id}")
 
         # Rewrite with highlighted new articles
         if write_single_topic(topic_id, new_article_ids=new_article_ids):
@@ -282,6 +329,7 @@ def write_all_topics(shuffle: bool = True, force: bool = False) -> dict:
     logger.info(f"   ❌ Failed: {stats['failed']}")
     logger.info(f"   ⏭️  Skipped (no new articles): {stats['skipped_no_new']}")
     logger.info(f"   ⏸️  Skipped (cooldown): {stats['skipped_cooldown']}")
+    logger.info(f"   🔁 Skipped (recent failure): {stats['skipped_failed']}")
     logger.info(f"{'='*60}")
 
     return stats
@@ -310,6 +358,9 @@ def write_all_strategies() -> dict:
 
     stats = {"success": 0, "failed": 0, "skipped": 0, "total": 0}
 
+    # One query for every topic's last_analyzed instead of one per strategy
+    topics_last_analyzed = get_topics_last_analyzed()
+
     for username in all_users:
         user_strategies = get_user_strategies(username)
         stats["total"] += len(user_strategies)
@@ -319,7 +370,9 @@ def write_all_strategies() -> dict:
             strategy_id = strategy['id']
 
             # Check if strategy needs update
-            needs_update, reason = strategy_needs_update(username, strategy_id)
+            needs_update, reason = strategy_needs_update(
+                username, strategy_id, strategy=strategy, topics_last_analyzed=topics_last_analyzed
+            )
 
             if not needs_update:
                 logger.info(f"  ⏭️  Skip {username}/{strategy_id}: {reason}")
@@ -434,20 +487,12 @@ def should_run_orphan_cleanup() -> bool:
 
 def find_topic_needing_rewrite() -> Optional[tuple[str, List[str]]]:
     """
-    Find ONE topic that needs rewriting.
+    Find ONE topic that needs rewriting (one planner query over all topics).
     Returns (topic_id, new_article_ids) or None if nothing needs rewriting.
     """
-    from src.analysis.rewrite_policy import should_rewrite_topic
-
-    all_topics = get_all_topics(fields=["id"])
-    random.shuffle(all_topics)  # Randomize for balanced coverage
-
-    for topic in all_topics:
-        topic_id = topic["id"]
-        should_write, reason, new_article_ids = should_rewrite_topic(topic_id)
-        if should_write:
-            return (topic_id, new_article_ids)
-
+    candidate = next_rewrite()
+    if candidate:
+        return (candidate["topic_id"], candidate["new_article_ids"])
     return None
 
 
@@ -688,7 +733,7 @@ def main():
     parser.add_argument("--strategies-explore", action="store_true", help="Run strategies + exploration (skip topic rewrites)")
     parser.add_argument("--topics-only", action="store_true", help="Run topics only (no strategies)")
     parser.add_argument("--loop", action="store_true", help="Run continuously")
-    parser.add_argument("--no-shuffle", action="store_true", help="Don't randomize topic order")
+    parser.add_argument("--no-shuffle", action="store_true", help="Don't randomize topic order (--force only; planned rewrites are ranked)")
     parser.add_argument("--delay", type=int, default=60, help="Seconds between loops (default: 60)")
     parser.add_argument("--force", action="store_true", help="Force rewrite all topics (skip cooldown/new article checks)")
 
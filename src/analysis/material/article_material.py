@@ -1,6 +1,6 @@
 """
 Builds formatted SOURCE MATERIAL for analysis rewriting, using summaries-only plus minimal metadata.
-- Loads full article JSON via load_article
+- Loads full article JSON via load_articles (one cached bulk fetch)
 - Uses argos_summary, falls back to summary, then description
 - Per-article output includes exactly: Title, Published, optional Source, and Summary.
 """
@@ -12,7 +12,7 @@ from utils import app_logging
 
 logger = app_logging.get_logger("analysis.material.article_material")
 
-from src.articles.load_article import load_article
+from src.articles.load_article import load_articles
 
 
 def build_material_for_section(topic_id: str, section: str) -> Tuple[str, List[str]]:
@@ -206,6 +206,7 @@ def build_material_for_synthesis_section(
     material_parts.append("=" * 80)
 
     # Load and format each article WITH motivation and implications
+    loaded_articles = load_articles(article_ids)
     section_counts = {}
     new_count = 0
     for i, row in enumerate(articles_result, 1):
@@ -221,7 +222,7 @@ def build_material_for_synthesis_section(
             new_count += 1
 
         try:
-            loaded = load_article(article_id)
+            loaded = loaded_articles.get(article_id)
             # Try argos_summary first, fallback to summary, then description
             summary = None
             if loaded:
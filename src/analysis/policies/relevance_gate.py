@@ -8,7 +8,7 @@ from src.graph.ops.topic import get_topic_by_id
 from src.graph.neo4j_client import run_cypher
 from utils.app_logging import get_logger
 import time
-from src.articles.load_article import load_article
+from src.articles.load_article import load_articles
 from src.llm.prompts.relevance_gate_llm import relevance_gate_llm_prompt
 from src.llm.sanitizer import run_llm_decision, RelevanceGate
 
@@ -45,13 +45,18 @@ def _fetch_existing_section_summaries(
         "========== Done performing cypher for getting all connected nodes =========="
     )
 
+    try:
+        articles = load_articles(r["id"] for r in rows)
+    except Exception as e:
+        logger.warning(f"Cold storage load failed | topic={topic_id} | err={e}")
+        articles = {}
+
     out: list[tuple[str, str]] = []
     for r in rows:
         aid = r["id"]
-        try:
-            art = load_article(aid)
-        except Exception as e:
-            logger.warning(f"Cold storage load failed | id={aid} | err={e}")
+        art = articles.get(aid)
+        if art is None:
+            logger.warning(f"Cold storage load failed | id={aid} | err=not found")
             continue
         # Prefer argos_summary; fallback to summary, then description
         if art:
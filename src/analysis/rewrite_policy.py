@@ -5,12 +5,19 @@ Core Rules:
 1. Only rewrite if there are NEW Tier 3 articles since last analysis
 2. Never rewrite more than once per MIN_REWRITE_INTERVAL_HOURS
 3. When rewriting, provide list of NEW article IDs to highlight
+4. After a failed rewrite - or one that didn't advance last_analyzed (no
+   section written) - wait REWRITE_FAILURE_COOLDOWN_HOURS before retrying
+   (otherwise the topic stays at the head of the plan and blocks every other rewrite)
 
 This prevents wasteful rewrites when no new information exists.
+
+plan_rewrites() evaluates these rules for every topic in one aggregate query
+and returns a ranked work list; next_rewrite() takes its head.
 """
 
 from datetime import datetime
-from typing import Tuple, List
+from typing import Any, Dict, Optional, Tuple, List
+from src.analysis_agents.section_config import AGENT_SECTIONS
 from src.graph.neo4j_client import run_cypher
 from src.observability.stats_client import track
 from utils import app_logging
@@ -19,6 +26,154 @@ logger = app_logging.get_logger(__name__)
 
 # Configuration - can be reduced later: 24h -> 12h -> 4h -> 1h
 MIN_REWRITE_INTERVAL_HOURS = 24
+# Back-off after a failed rewrite (set via record_rewrite_failure)
+REWRITE_FAILURE_COOLDOWN_HOURS = 2
+
+# One row per topic: everything the policy needs, for all topics in one pass.
+# Note: ABOUT relationships use importance_* fields (1-3), not a single "tier" field
+# Tier 3 = any importance field equals 3
+# Note: r.created_at may be NULL on older ABOUT relationships (property added later)
+# When r.created_at IS NULL, comparison with last_analyzed returns NULL (falsy)
+# So we treat NULL created_at as "new" to ensure these articles get analyzed
+_PLAN_QUERY = """
+MATCH (t:Topic)
+WHERE $topic_ids IS NULL OR t.id IN $topic_ids
+OPTIONAL MATCH (t)<-[r:ABOUT]-(a:Article)
+WHERE (r.importance_risk = 3 OR r.importance_opportunity = 3
+       OR r.importance_trend = 3 OR r.importance_catalyst = 3)
+  AND (t.last_analyzed IS NULL
+       OR r.created_at IS NULL
+       OR r.created_at > t.last_analyzed)
+WITH t, collect(DISTINCT a.id) AS new_article_ids
+RETURN
+    t.id AS topic_id,
+    t.last_analyzed AS last_analyzed,
+    t.last_rewrite_failed_at AS last_failed,
+    new_article_ids,
+    [s IN $sections WHERE t[s] IS NULL] AS missing_sections
+"""
+
+
+def _hours_since(last_analyzed: Any) -> Optional[float]:
+    """Hours since a Neo4j datetime or ISO string; None if never analyzed. Raises if unparseable."""
+    if not last_analyzed:
+        return None
+    # Handle both string and datetime types from Neo4j
+    if isinstance(last_analyzed, str):
+        last_analyzed_dt = datetime.fromisoformat(last_analyzed.replace('Z', '+00:00'))
+        last_analyzed_dt = last_analyzed_dt.replace(tzinfo=None)
+    else:
+        # Neo4j datetime object
+        last_analyzed_dt = datetime(
+            last_analyzed.year, last_analyzed.month, last_analyzed.day,
+            last_analyzed.hour, last_analyzed.minute, last_analyzed.second
+        )
+    return (datetime.utcnow() - last_analyzed_dt).total_seconds() / 3600
+
+
+def _evaluate(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply the rewrite rules to one planner row."""
+    topic_id = row["topic_id"]
+    new_article_ids = [aid for aid in row.get("new_article_ids", []) if aid]  # Filter None values
+    candidate = {
+        "topic_id": topic_id,
+        "should_rewrite": False,
+        "reason": "",
+        "new_article_ids": new_article_ids,
+        "hours_since_analyzed": None,
+        "hours_since_failed": None,
+        "missing_sections": row.get("missing_sections") or [],
+    }
+
+    # RULE 1: No new articles -> SKIP
+    if not new_article_ids:
+        candidate["reason"] = "no_new_articles"
+        candidate["new_article_ids"] = []
+        return candidate
+
+    # RULE 2: Check cooldown (have we rewritten recently?)
+    try:
+        hours_since = _hours_since(row.get("last_analyzed"))
+        candidate["hours_since_analyzed"] = hours_since
+        if hours_since is not None and hours_since < MIN_REWRITE_INTERVAL_HOURS:
+            candidate["reason"] = "cooldown"
+            return candidate
+    except Exception as e:
+        logger.warning(f"Could not parse last_analyzed for {topic_id}: {e}")
+        # Continue to rewrite if we can't parse the timestamp
+
+    # RULE 4: Failed recently -> SKIP so the next topic gets its turn
+    try:
+        hours_since_failed = _hours_since(row.get("last_failed"))
+        candidate["hours_since_failed"] = hours_since_failed
+        if hours_since_failed is not None and hours_since_failed < REWRITE_FAILURE_COOLDOWN_HOURS:
+            candidate["reason"] = "failure_cooldown"
+            return candidate
+    except Exception as e:
+        logger.warning(f"Could not parse last_rewrite_failed_at for {topic_id}: {e}")
+
+    # RULE 3: New articles exist AND cooldown passed -> REWRITE
+    candidate["should_rewrite"] = True
+    candidate["reason"] = "new_articles"
+    return candidate
+
+
+def _rank_key(candidate: Dict[str, Any]) -> tuple:
+    # Topics missing sections first, then longest since analyzed (never = first), then most new articles.
+    # Oldest-first keeps every due topic moving instead of starving small ones.
+    hours = candidate["hours_since_analyzed"]
+    return (
+        -len(candidate["missing_sections"]),
+        -(hours if hours is not None else float("inf")),
+        -len(candidate["new_article_ids"]),
+    )
+
+
+def plan_rewrites(topic_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Evaluate the rewrite policy for every topic (or topic_ids) in one query.
+
+    Returns:
+        One candidate per topic, ranked: topics to rewrite first (most stale
+        first, see _rank_key), then cooldown / failure_cooldown, then
+        no-new-article topics. Each is
+        {"topic_id", "should_rewrite", "reason", "new_article_ids",
+         "hours_since_analyzed", "hours_since_failed", "missing_sections"}.
+    """
+    rows = run_cypher(_PLAN_QUERY, {"topic_ids": topic_ids, "sections": AGENT_SECTIONS}) or []
+    candidates = [_evaluate(row) for row in rows]
+    order = {"new_articles": 0, "cooldown": 1, "failure_cooldown": 1, "no_new_articles": 2}
+    candidates.sort(key=lambda c: (order.get(c["reason"], 3),) + _rank_key(c))
+
+    due = sum(1 for c in candidates if c["should_rewrite"])
+    cooldown = sum(1 for c in candidates if c["reason"] == "cooldown")
+    failed = sum(1 for c in candidates if c["reason"] == "failure_cooldown")
+    logger.info(
+        f"Rewrite plan: {len(candidates)} topics | due={due} cooldown={cooldown} "
+        f"failed={failed} no_new={len(candidates) - due - cooldown - failed}"
+    )
+    return candidates
+
+
+def next_rewrite() -> Optional[Dict[str, Any]]:
+    """The highest-ranked topic due for a rewrite, or None."""
+    for candidate in plan_rewrites():
+        if candidate["should_rewrite"]:
+            track(
+                "analysis.triggered.new_articles",
+                f"{candidate['topic_id']}: {len(candidate['new_article_ids'])} new articles",
+            )
+            return candidate
+        break  # ranked: nothing due after the first non-due topic
+    return None
+
+
+def record_rewrite_failure(topic_id: str) -> None:
+    """Mark a failed rewrite so the planner backs off this topic (RULE 4)."""
+    run_cypher(
+        "MATCH (t:Topic {id: $topic_id}) SET t.last_rewrite_failed_at = datetime()",
+        {"topic_id": topic_id},
+    )
 
 
 def should_rewrite_topic(topic_id: str) -> Tuple[bool, str, List[str]]:
@@ -30,7 +185,11 @@ def should_rewrite_topic(topic_id: str) -> Tuple[bool, str, List[str]]:
     2. Get NEW Tier 3 articles linked since last_analyzed
     3. If no new articles -> SKIP (no new information)
     4. If new articles exist BUT we rewrote < MIN_REWRITE_INTERVAL_HOURS ago -> SKIP (cooldown)
-    5. If new articles exist AND cooldown passed -> REWRITE with highlighted article IDs
+    5. If the last rewrite failed < REWRITE_FAILURE_COOLDOWN_HOURS ago -> SKIP (failure_cooldown)
+    6. If new articles exist AND cooldowns passed -> REWRITE with highlighted article IDs
+
+    For many topics at once use plan_rewrites(), which applies the same rules
+    in one query.
 
     Args:
         topic_id: The topic to check
@@ -41,69 +200,37 @@ def should_rewrite_topic(topic_id: str) -> Tuple[bool, str, List[str]]:
         - reason: str - Why we're rewriting or skipping (for logging/stats)
         - new_article_ids: List[str] - Article IDs that are NEW since last analysis
     """
-    # Get topic's last_analyzed timestamp and new articles in one query
-    # Note: ABOUT relationships use importance_* fields (1-3), not a single "tier" field
-    # Tier 3 = any importance field equals 3
-    # Note: r.created_at may be NULL on older ABOUT relationships (property added later)
-    # When r.created_at IS NULL, comparison with last_analyzed returns NULL (falsy)
-    # So we treat NULL created_at as "new" to ensure these articles get analyzed
-    query = """
-    MATCH (t:Topic {id: $topic_id})
-    OPTIONAL MATCH (t)<-[r:ABOUT]-(a:Article)
-    WHERE (r.importance_risk = 3 OR r.importance_opportunity = 3
-           OR r.importance_trend = 3 OR r.importance_catalyst = 3)
-      AND (t.last_analyzed IS NULL
-           OR r.created_at IS NULL
-           OR r.created_at > t.last_analyzed)
-    RETURN
-        t.last_analyzed AS last_analyzed,
-        collect(DISTINCT a.id) AS new_article_ids
-    """
-    result = run_cypher(query, {"topic_id": topic_id})
+    rows = run_cypher(_PLAN_QUERY, {"topic_ids": [topic_id], "sections": AGENT_SECTIONS})
 
-    if not result:
+    if not rows:
         logger.warning(f"Topic {topic_id} not found in graph")
         return False, "topic_not_found", []
 
-    row = result[0]
-    last_analyzed = row.get("last_analyzed")
-    new_article_ids = [aid for aid in row.get("new_article_ids", []) if aid]  # Filter None values
+    candidate = _evaluate(rows[0])
+    new_article_ids = candidate["new_article_ids"]
 
-    # RULE 1: No new articles -> SKIP
-    if not new_article_ids:
+    if candidate["reason"] == "no_new_articles":
         track("analysis.skipped.no_new_articles", f"{topic_id}")
         logger.info(f"SKIP {topic_id}: No new Tier 3 articles since last analysis")
         return False, "no_new_articles", []
 
-    # RULE 2: Check cooldown (have we rewritten recently?)
-    if last_analyzed:
-        try:
-            # Handle both string and datetime types from Neo4j
-            if isinstance(last_analyzed, str):
-                last_analyzed_dt = datetime.fromisoformat(last_analyzed.replace('Z', '+00:00'))
-                last_analyzed_dt = last_analyzed_dt.replace(tzinfo=None)
-            else:
-                # Neo4j datetime object
-                last_analyzed_dt = datetime(
-                    last_analyzed.year, last_analyzed.month, last_analyzed.day,
-                    last_analyzed.hour, last_analyzed.minute, last_analyzed.second
-                )
-
-            hours_since = (datetime.utcnow() - last_analyzed_dt).total_seconds() / 3600
-
-            if hours_since < MIN_REWRITE_INTERVAL_HOURS:
-                track("analysis.skipped.cooldown", f"{topic_id}: {len(new_article_ids)} new articles waiting")
-                logger.info(
-                    f"SKIP {topic_id}: Cooldown active "
-                    f"({hours_since:.1f}h < {MIN_REWRITE_INTERVAL_HOURS}h) - "
-                    f"{len(new_article_ids)} new articles waiting"
-                )
-                return False, "cooldown", new_article_ids
-        except Exception as e:
-            logger.warning(f"Could not parse last_analyzed for {topic_id}: {e}")
-            # Continue to rewrite if we can't parse the timestamp
+    if candidate["reason"] == "cooldown":
+        track("analysis.skipped.cooldown", f"{topic_id}: {len(new_article_ids)} new articles waiting")
+        logger.info(
+            f"SKIP {topic_id}: Cooldown active "
+            f"({candidate['hours_since_analyzed']:.1f}h < {MIN_REWRITE_INTERVAL_HOURS}h) - "
+            f"{len(new_article_ids)} new articles waiting"
+        )
+        return False, "cooldown", new_article_ids
+
+    if candidate["reason"] == "failure_cooldown":
+        track("analysis.skipped.failure_cooldown", f"{topic_id}")
+        logger.info(
+            f"SKIP {topic_id}: Last rewrite failed "
+            f"{candidate['hours_since_failed']:.1f}h ago (< {REWRITE_FAILURE_COOLDOWN_HOURS}h)"
+        )
+        return False, "failure_cooldown", new_article_ids
 
-    # RULE 3: New articles exist AND cooldown passed -> REWRITE
     track("analysis.triggered.new_articles", f"{topic_id}: {len(new_article_ids)} new articles")
     logger.info(
         f"REWRITE {topic_id}: {len(new_article_ids)} new articles found, cooldown passed"
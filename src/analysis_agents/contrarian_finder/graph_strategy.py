@@ -8,10 +8,14 @@ GRAPH EXPLORATION:
 2. Fall back to hardcoded pairs if no HEDGES relationships exist
 3. Get their executive_summary and relevant analysis
 4. Return for contrarian angle detection
+(all read from the shared TopicGraphSnapshot)
 """
 
 from typing import Dict, List
-from src.graph.neo4j_client import run_cypher
+from src.analysis_agents.topic_snapshot import TopicGraphSnapshot, get_topic_snapshot
+from utils import app_logging
+
+logger = app_logging.get_logger(__name__)
 
 
 # Legacy fallback - only used if no HEDGES relationships exist in graph
@@ -30,19 +34,12 @@ _LEGACY_CONTRARIAN_PAIRS = {
 }
 
 
-def _get_hedges_from_graph(topic_id: str) -> List[str]:
+def _get_hedges_from_graph(snapshot: TopicGraphSnapshot) -> List[str]:
     """
     Get contrarian/hedge topics from HEDGES relationships in graph.
     HEDGES = inverse/risk-offset relationship (e.g., gold hedges inflation).
     """
-    query = """
-    MATCH (t:Topic {id: $topic_id})-[:HEDGES]-(hedge:Topic)
-    RETURN DISTINCT hedge.id as hedge_id
-    """
-    result = run_cypher(query, {"topic_id": topic_id})
-    if result:
-        return [r["hedge_id"] for r in result if r.get("hedge_id")]
-    return []
+    return list(dict.fromkeys(entry["id"] for entry, _, _ in snapshot.edges(["HEDGES"])))
 
 
 def explore_graph(topic_id: str, section: str) -> Dict:
@@ -51,6 +48,8 @@ def explore_graph(topic_id: str, section: str) -> Dict:
 
     Uses HEDGES relationships from graph (dynamically discovered).
     Falls back to legacy hardcoded pairs if no HEDGES exist.
+    Reads the shared TopicGraphSnapshot; legacy pairs outside the topic's
+    neighborhood are loaded into it once.
 
     Returns:
         {
@@ -58,100 +57,64 @@ def explore_graph(topic_id: str, section: str) -> Dict:
             "contrarian_assets": List[dict with articles]
         }
     """
+    snapshot = get_topic_snapshot(topic_id)
 
     # Step 1: Try to get contrarian assets from HEDGES relationships (preferred)
-    contrarian_ids = _get_hedges_from_graph(topic_id)
+    contrarian_ids = _get_hedges_from_graph(snapshot)
 
     # Step 2: Fall back to legacy hardcoded pairs if no HEDGES found
     if not contrarian_ids:
         contrarian_ids = _LEGACY_CONTRARIAN_PAIRS.get(topic_id, [])
         if contrarian_ids:
-            print(f"[ContrarianFinder] Using legacy pairs for {topic_id} (no HEDGES in graph)")
+            logger.info(f"[ContrarianFinder] Using legacy pairs for {topic_id} (no HEDGES in graph)")
 
     if not contrarian_ids:
-        print(f"[ContrarianFinder] No contrarian assets for {topic_id} (no HEDGES or legacy pairs)")
+        logger.info(f"[ContrarianFinder] No contrarian assets for {topic_id} (no HEDGES or legacy pairs)")
         return {
             "topic_name": topic_id,
             "topic_id": topic_id,
             "contrarian_assets": []
         }
     
-    # Get contrarian topics' executive summaries
-    query = """
-    MATCH (contrarian:Topic)
-    WHERE contrarian.id IN $contrarian_ids
-    RETURN 
-        contrarian.id as topic_id,
-        contrarian.name as topic_name,
-        contrarian.executive_summary as executive_summary
-    """
-    
-    result = run_cypher(query, {"contrarian_ids": contrarian_ids})
+    # Contrarian topics' executive summaries
+    contrarians = snapshot.topics(contrarian_ids)
     
-    if not result:
-        print(f"[ContrarianFinder] No contrarian topics found in graph")
+    if not contrarians:
+        logger.info(f"[ContrarianFinder] No contrarian topics found in graph")
         return {
             "topic_name": topic_id,
             "topic_id": topic_id,
             "contrarian_assets": []
         }
     
-    # Get tier 3 articles (risk OR opportunity) from each contrarian asset
+    # Tier 3 articles (risk OR opportunity) in this timeframe from each contrarian asset
     contrarian_assets = []
-    assets_with_articles = []
-    
-    for contrarian in result:
-        contrarian_id = contrarian['topic_id']
-        
-        query_articles = """
-        MATCH (art:Article)-[r:ABOUT]->(t:Topic {id: $contrarian_id})
-        WHERE r.timeframe = $section
-          AND (r.importance_risk = 3 OR r.importance_opportunity = 3)
-        RETURN 
-            art.id as id,
-            art.summary as summary,
-            r.importance_risk as risk,
-            r.importance_opportunity as opportunity
-        """
-        
-        articles = run_cypher(query_articles, {
-            "contrarian_id": contrarian_id,
-            "section": section
-        })
-        
+    for contrarian in contrarians:
+        articles = [
+            {
+                "id": a["id"],
+                "summary": a.get("summary"),
+                "risk": a.get("importance_risk"),
+                "opportunity": a.get("importance_opportunity"),
+            }
+            for a in contrarian["articles"]
+            if a.get("timeframe") == section
+            and (a.get("importance_risk") == 3 or a.get("importance_opportunity") == 3)
+        ]
         contrarian_assets.append({
-            "topic_id": contrarian['topic_id'],
-            "topic_name": contrarian['topic_name'],
-            "executive_summary": contrarian.get('executive_summary', ''),
-            "articles": articles if articles else []
+            "topic_id": contrarian["id"],
+            "topic_name": contrarian.get("name"),
+            "executive_summary": contrarian.get("executive_summary", ""),
+            "articles": articles
         })
-        
-        if articles:
-            sample_ids = [a['id'] for a in articles[:2]]
-            assets_with_articles.append({
-                'name': contrarian['topic_name'],
-                'count': len(articles),
-                'sample': ', '.join(sample_ids)
-            })
     
-    # Summary
-    if assets_with_articles:
-        print(f"[ContrarianFinder] Contrarian assets with tier-3 articles:")
-        for asset in assets_with_articles:
-            print(f"   • {asset['name']}: {asset['count']} articles ({asset['sample']})")
-    else:
-        print(f"[ContrarianFinder] No tier-3 articles found in contrarian assets")
-    
-    # Get THIS topic's name
-    topic_query = """
-    MATCH (t:Topic {id: $topic_id})
-    RETURN t.name as name
-    """
-    topic_result = run_cypher(topic_query, {"topic_id": topic_id})
-    topic_name = topic_result[0]['name'] if topic_result else topic_id
+    logger.info(
+        f"[ContrarianFinder] {topic_id}: tier-3 articles per contrarian asset | "
+        + " ".join(f"{a['topic_id']}={len(a['articles'])}" for a in contrarian_assets)
+    )
     
     return {
-        "topic_name": topic_name,
+        "topic_name": snapshot.name,
         "topic_id": topic_id,
         "contrarian_assets": contrarian_assets
     }
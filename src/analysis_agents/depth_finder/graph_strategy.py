@@ -10,78 +10,59 @@ GRAPH EXPLORATION:
 """
 
 from typing import Dict, List
-from src.graph.neo4j_client import run_cypher
+from src.analysis_agents.topic_snapshot import get_topic_snapshot
+from utils import app_logging
+
+logger = app_logging.get_logger(__name__)
+
+TIMEFRAME_ORDER = {"fundamental": 1, "medium": 2, "current": 3}
 
 
 def explore_graph(topic_id: str, section: str) -> Dict:
     """
     Get tier 3 articles across ALL timeframes for depth analysis.
     
+    Reads the shared TopicGraphSnapshot (no queries of its own).
+    
     Returns:
         {
             "topic_name": str,
             "articles": List[dict grouped by timeframe]
         }
     """
+    snapshot = get_topic_snapshot(topic_id)
     
-    # Get tier 3 articles across ALL timeframes (not just the requested section)
-    # Only risk OR trend perspectives
-    query = """
-    MATCH (t:Topic {id: $topic_id})
-    MATCH (art:Article)-[r:ABOUT]->(t)
-    WHERE (r.importance_risk = 3 OR r.importance_trend = 3)
-    RETURN 
-        t.name as topic_name,
-        r.timeframe as timeframe,
-        art.id as id,
-        art.summary as summary,
-        art.published_at as published_at,
-        r.importance_risk as risk,
-        r.importance_trend as trend
-    ORDER BY 
-        CASE r.timeframe 
-            WHEN 'fundamental' THEN 1
-            WHEN 'medium' THEN 2
-            WHEN 'current' THEN 3
-            ELSE 4
-        END,
-        art.published_at DESC
-    LIMIT 45
-    """
+    # Tier 3 articles across ALL timeframes (not just the requested section)
+    # Only risk OR trend perspectives; timeframe order, newest first within one
+    selected = [
+        a for a in snapshot.articles
+        if a.get("importance_risk") == 3 or a.get("importance_trend") == 3
+    ]
+    selected.sort(key=lambda a: TIMEFRAME_ORDER.get(a.get("timeframe"), 4))
+    selected = selected[:45]
     
-    result = run_cypher(query, {"topic_id": topic_id})
-    
-    print(f"[DepthFinder] Query returned {len(result) if result else 0} rows")
-    
-    if not result:
+    if not selected:
+        logger.info(f"[DepthFinder] {topic_id}: no tier-3 risk/trend articles")
         return {
-            "topic_name": topic_id,
+            "topic_name": snapshot.name,
             "topic_id": topic_id,
             "articles": []
         }
     
-    topic_name = result[0].get("topic_name", topic_id) if result else topic_id
-    
-    # Group by timeframe for logging
-    by_timeframe = {}
-    for row in result:
-        tf = row['timeframe']
-        if tf not in by_timeframe:
-            by_timeframe[tf] = []
-        by_timeframe[tf].append({
-            'id': row['id'],
-            'summary': row['summary'],
-            'published_at': row['published_at'],
-            'risk': row['risk'],
-            'trend': row['trend']
+    by_timeframe: Dict[str, List[dict]] = {}
+    for a in selected:
+        by_timeframe.setdefault(a.get("timeframe"), []).append({
+            "id": a["id"],
+            "summary": a.get("summary"),
+            "published_at": a.get("published_at"),
+            "risk": a.get("importance_risk"),
+            "trend": a.get("importance_trend")
         })
     
-    print(f"[DepthFinder] Cross-timeframe articles (tier 3, risk/trend):")
-    for tf in ['fundamental', 'medium', 'current']:
-        if tf in by_timeframe:
-            articles = by_timeframe[tf]
-            sample_ids = [art['id'] for art in articles[:2]]
-            print(f"   {tf.upper()}: {len(articles)} articles ({', '.join(sample_ids)}{'...' if len(articles) > 2 else ''})")
+    logger.info(
+        f"[DepthFinder] {topic_id}: cross-timeframe tier-3 articles | "
+        + " ".join(f"{tf}={len(by_timeframe[tf])}" for tf in TIMEFRAME_ORDER if tf in by_timeframe)
+    )
     
     # Flatten for return
     all_articles = []
@@ -89,7 +70,7 @@ def explore_graph(topic_id: str, section: str) -> Dict:
         all_articles.extend(articles)
     
     return {
-        "topic_name": topic_name,
+        "topic_name": snapshot.name,
         "topic_id": topic_id,
         "articles": all_articles
     }
@@ -9,17 +9,29 @@ GRAPH EXPLORATION:
 3. Get articles used in last analysis (before timestamp)
 4. Get NEW articles (after timestamp)
 5. Return for comparison
+(all read from the shared TopicGraphSnapshot)
 """
 
 from typing import Dict, List
-from src.graph.neo4j_client import run_cypher
-from datetime import datetime, timezone
+from src.analysis_agents.topic_snapshot import get_topic_snapshot
+
+
+def _is_older(published_at, last_updated) -> bool:
+    """published_at < last_updated; unknown or incomparable counts as new (as in Cypher, where it is null)."""
+    if published_at is None or last_updated is None:
+        return False
+    try:
+        return published_at < last_updated
+    except TypeError:
+        return False
 
 
 def explore_graph(topic_id: str, section: str) -> Dict:
     """
     Compare old vs. new articles.
     
+    Reads the shared TopicGraphSnapshot (no queries of its own).
+    
     Returns:
         {
             "topic_name": str,
@@ -39,65 +51,31 @@ def explore_graph(topic_id: str, section: str) -> Dict:
     analysis_field = field_map.get(section, "fundamental_analysis")
     updated_field = f"{analysis_field}_updated_at"
     
-    query = f"""
-    MATCH (t:Topic {{id: $topic_id}})
-    
-    // Get existing analysis and last update time
-    WITH t, 
-         t.{analysis_field} as existing_analysis,
-         t.{updated_field} as last_updated
-    
-    // Get all articles for this section
-    MATCH (art:Article)-[r:ABOUT]->(t)
-    WHERE r.timeframe = $section
-    
-    // Separate old vs. new based on last_updated
-    WITH t, existing_analysis, last_updated, art, r,
-         CASE 
-             WHEN last_updated IS NULL THEN 'new'
-             WHEN art.published_at < last_updated THEN 'old'
-             ELSE 'new'
-         END as article_age
+    snapshot = get_topic_snapshot(topic_id)
+    existing_analysis = snapshot.field(analysis_field)
+    last_updated = snapshot.field(updated_field)
     
-    RETURN 
-        t.name as topic_name,
-        existing_analysis,
-        last_updated,
-        collect(CASE WHEN article_age = 'old' THEN {{
-            id: art.id,
-            summary: art.summary,
-            published_at: art.published_at
-        }} END) as old_articles,
-        collect(CASE WHEN article_age = 'new' THEN {{
-            id: art.id,
-            summary: art.summary,
-            published_at: art.published_at
-        }} END) as new_articles
-    """
-    
-    result = run_cypher(query, {"topic_id": topic_id, "section": section})
-    
-    if not result:
-        return {
-            "topic_name": topic_id,
-            "topic_id": topic_id,
-            "existing_analysis": "",
-            "last_updated": None,
-            "old_articles": [],
-            "new_articles": []
+    # All articles for this section, separated old vs. new based on last_updated
+    old_articles: List[dict] = []
+    new_articles: List[dict] = []
+    for art in snapshot.articles:
+        if art.get("timeframe") != section:
+            continue
+        item = {
+            "id": art["id"],
+            "summary": art.get("summary"),
+            "published_at": art.get("published_at")
         }
-    
-    data = result[0]
-    
-    # Filter out None values from CASE statements
-    old_articles = [a for a in data.get("old_articles", []) if a is not None]
-    new_articles = [a for a in data.get("new_articles", []) if a is not None]
+        if _is_older(art.get("published_at"), last_updated):
+            old_articles.append(item)
+        else:
+            new_articles.append(item)
     
     return {
-        "topic_name": data.get("topic_name", topic_id),
+        "topic_name": snapshot.name,
         "topic_id": topic_id,
-        "existing_analysis": data.get("existing_analysis", ""),
-        "last_updated": data.get("last_updated"),
+        "existing_analysis": existing_analysis or "",
+        "last_updated": last_updated,
         "old_articles": old_articles,
         "new_articles": new_articles
     }
@@ -10,6 +10,7 @@ Usage:
     python -m src.analysis_agents.orchestrator all                       # Full pipeline (all 8 sections)
 """
 
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
 from typing import Dict, Any, List, Tuple, Optional, Set
 from src.analysis_agents.source_registry import SourceRegistry
 from src.analysis_agents.synthesis_scout.agent import SynthesisScoutAgent
@@ -18,23 +19,30 @@ from src.analysis_agents.depth_finder.agent import DepthFinderAgent
 from src.analysis_agents.writer.agent import WriterAgent
 from src.analysis_agents.critic.agent import CriticAgent
 from src.analysis_agents.source_checker.agent import SourceCheckerAgent
-from src.analysis_agents.section_config import AGENT_SECTIONS, AGENT_SECTION_CONFIGS
+from src.analysis_agents.section_config import AGENT_SECTIONS, AGENT_SECTION_CONFIGS, SECTION_DEPENDENCIES
+from src.analysis_agents.section_scheduler import run_section_dag
+from src.analysis_agents.topic_snapshot import drop_topic_snapshot, get_topic_snapshot, peek_topic_snapshot
 from src.citations import validate_citations
 from src.llm.llm_router import get_llm, ModelTier
 from src.llm.prompts.system_prompts import SYSTEM_MISSION, SYSTEM_CONTEXT
 from src.market_data.loader import get_market_context_for_prompt
 from utils import app_logging
+import os
+import threading
 import time
 
 logger = app_logging.get_logger(__name__)
 
+# Per-agent budget for one section's pre-writing agents (they run concurrently)
+AGENT_TIMEOUT_S = float(os.getenv("ANALYSIS_AGENT_TIMEOUT_S", "300"))
+
 # =============================================================================
 # SECTION CONFIGURATION (imported from section_config.py - SINGLE SOURCE OF TRUTH)
 # =============================================================================
 
 SECTION_AGENT_CONFIG = AGENT_SECTION_CONFIGS
 
-# Execution order - CUMULATIVE BUILDING (each section uses all prior sections)
+# Execution order (prior-section context per section: SECTION_DEPENDENCIES)
 # NOTE: This MUST match AGENT_SECTIONS from section_config.py
 EXECUTION_ORDER = AGENT_SECTIONS
 
@@ -50,18 +58,6 @@ assert EXECUTION_ORDER == [
     "risk_monitor"
 ], "EXECUTION_ORDER must match AGENT_SECTIONS in section_config.py"
 
-# Section dependencies - defines what prior sections each section needs
-SECTION_DEPENDENCIES = {
-    "chain_reaction_map": [],  # Foundation - articles only
-    "structural_threats": ["chain_reaction_map"],
-    "tactical_scenarios": ["chain_reaction_map", "structural_threats"],
-    "immediate_intelligence": ["chain_reaction_map", "structural_threats", "tactical_scenarios"],
-    "macro_cascade": ["chain_reaction_map", "structural_threats", "tactical_scenarios", "immediate_intelligence"],
-    "trade_intelligence": ["chain_reaction_map", "structural_threats", "tactical_scenarios", "immediate_intelligence", "macro_cascade"],
-    "house_view": ["chain_reaction_map", "structural_threats", "tactical_scenarios", "immediate_intelligence", "macro_cascade", "trade_intelligence"],
-    "risk_monitor": ["chain_reaction_map", "structural_threats", "tactical_scenarios", "immediate_intelligence", "macro_cascade", "trade_intelligence", "house_view"]
-}
-
 # Which sections use NEW articles vs. prior sections only
 SECTIONS_USING_ARTICLES = [
     "chain_reaction_map",
@@ -163,8 +159,8 @@ SECTION_FOCUS = {
         "MISSION: 3-6 month scenario trees (bull/bear/base) with tactical opportunities.\n"
         "Risk-weighted scenarios. Probability trees. Where does risk create mispricing?\n"
         "═══════════════════════════════════════════════════════════════════════════════\n\n"
-        "CONTEXT: You have chain_reaction_map + structural_threats.\n"
-        "Ask: Which chain reactions could trigger in 3-6 months? How do structural risks play out tactically? Where's the asymmetric bet?\n\n"
+        "CONTEXT: You have chain_reaction_map as foundation (the other timeframe sections are written alongside this one).\n"
+        "Ask: Which chain reactions could trigger in 3-6 months? How do the slower-moving chains play out tactically? Where's the asymmetric bet?\n\n"
         "FOCUS: Scenario matrix with probabilities. Not 'could happen' but 'probability-weighted paths'.\n\n"
         "DEEP RISK PATH ANALYSIS (CRITICAL):\n"
         "For each scenario, show the FULL cascade - not just 'Fed hikes → stocks down' but:\n"
@@ -197,15 +193,15 @@ SECTION_FOCUS = {
         "OUTPUT: Write DETAILED scenario analysis - each scenario deserves thorough exploration of the risk path,\n"
         "transmission mechanisms, second-order effects, and tactical implications. Don't rush through scenarios.\n"
         "AUTHORITY: Decisive, probability-weighted, actionable. If you see asymmetric setup, call it with conviction.\n"
-        "CITATIONS: 9-character IDs. Reference chain_reaction_map and structural_threats insights."
+        "CITATIONS: 9-character IDs. Reference chain_reaction_map insights."
     ),
     "immediate_intelligence": (
         "═══════════════════════════════════════════════════════════════════════════════\n"
         "MISSION: 0-3 week urgent threats + immediate opportunities + catalysts.\n"
         "What's hitting NOW? Where's the contrarian edge? What's the market missing?\n"
         "═══════════════════════════════════════════════════════════════════════════════\n\n"
-        "CONTEXT: You have chain_reaction_map + structural_threats + tactical_scenarios.\n"
-        "Ask: Which chain reactions are triggering NOW? Which tactical scenarios are playing out? Where's the immediate edge?\n\n"
+        "CONTEXT: You have chain_reaction_map as foundation (the other timeframe sections are written alongside this one).\n"
+        "Ask: Which chain reactions are triggering NOW? Which of their paths are already playing out? Where's the immediate edge?\n\n"
         "FOCUS: URGENT, trade-ready intelligence. Not 'watch this' but 'act on this NOW'.\n\n"
         "HUNT FOR WHAT'S NOT PRICED:\n"
         "→ **Catalyst Asymmetry**: Which catalyst is UNDERPRICED vs OVERPRICED by the market?\n"
@@ -234,7 +230,7 @@ SECTION_FOCUS = {
         "• Everyone sees [OBVIOUS_RISK], but missing [HIDDEN_CATALYST]. Setup: [CONTRARIAN_TRADE].\n\n"
         "OUTPUT: Write DETAILED immediate intelligence - thoroughly explore each catalyst, its pricing, and positioning dynamics.\n"
         "AUTHORITY: Urgent, conviction-driven, timing-precise. If you see immediate edge, call it NOW.\n"
-        "CITATIONS: 9-character IDs. Reference prior sections where relevant."
+        "CITATIONS: 9-character IDs. Reference chain_reaction_map where relevant."
     ),
     "macro_cascade": (
         "═══════════════════════════════════════════════════════════════════════════════\n"
@@ -424,79 +420,94 @@ class AnalysisAgentOrchestrator:
     def _get_agent(self, agent_name: str):
         return self.agents.get(agent_name)
     
-    def run_agents_for_section(self, topic_id: str, section: str) -> Tuple[Dict[str, Any], SourceRegistry]:
+    def run_agents_for_section(
+        self, topic_id: str, section: str, timeout_s: float = AGENT_TIMEOUT_S
+    ) -> Tuple[Dict[str, Any], SourceRegistry]:
         """
-        Run all agents configured for a section.
+        Run all agents configured for a section, concurrently.
+        
+        Each agent explores the graph and makes its own LLM call, so they are
+        independent; wall time is the slowest agent rather than the sum. An
+        agent that fails or exceeds timeout_s yields None and the others'
+        results are still returned (the writer handles missing agent output).
         
         Args:
             topic_id: Topic to analyze
             section: Analysis section (chain_reaction_map, structural_threats, etc.)
+            timeout_s: Per-agent time budget, measured from when the section's agents start
             
         Returns:
             Tuple of (agent results dict, source registry)
         """
         config = SECTION_AGENT_CONFIG.get(section, SECTION_AGENT_CONFIG["chain_reaction_map"])
         agent_names = config["agents"]
-        description = config["description"]
-        priority = config.get("priority", "MEDIUM")
         
         # Get section focus for context-aware analysis
         section_focus = SECTION_FOCUS.get(section, "")
         
-        print(f"\n{'='*70}")
-        print(f"RUNNING AGENTS FOR: {topic_id} / {section}")
-        print(f"Description: {description}")
-        print(f"Agents: {', '.join(agent_names)}")
-        print(f"{'='*70}\n")
+        logger.info(
+            f"Agents start | topic={topic_id} section={section} | "
+            f"agents={','.join(agent_names)} priority={config.get('priority', 'MEDIUM')}"
+        )
         
-        results = {}
+        results: Dict[str, Any] = {name: None for name in agent_names}
+        timings: Dict[str, str] = {}
         source_registry = SourceRegistry()
+        started = time.monotonic()
         
-        for agent_name in agent_names:
-            print(f"\n{'='*80}")
-            print(f"🔍 {agent_name.upper()} AGENT")
-            print(f"{'='*80}")
-            agent = self._get_agent(agent_name)
-            
-            try:
-                result = agent.run(topic_id, section, section_focus=section_focus)
+        def run_agent(agent_name: str) -> Tuple[Any, float]:
+            t0 = time.monotonic()
+            result = self._get_agent(agent_name).run(topic_id, section, section_focus=section_focus)
+            return result, time.monotonic() - t0
+        
+        # Not a context manager: a timed-out agent's thread cannot be killed, so don't wait on it
+        pool = ThreadPoolExecutor(max_workers=len(agent_names), thread_name_prefix=f"agent-{section}")
+        futures = {pool.submit(run_agent, name): name for name in agent_names}
+        try:
+            for future in as_completed(futures, timeout=timeout_s):
+                agent_name = futures[future]
+                try:
+                    result, elapsed = future.result()
+                except Exception as e:
+                    timings[agent_name] = f"error:{time.monotonic() - started:.1f}s"
+                    logger.warning(f"Agent {agent_name} failed | topic={topic_id} section={section} | err={e}")
+                    continue
                 results[agent_name] = result
-                
-                # Display results immediately
-                if hasattr(result, '__dict__'):
-                    result_dict = result.__dict__
-                    # Log what this agent found and will pass forward
-                    print(f"\n📋 Output Summary:")
-                    for key, value in result_dict.items():
-                        if key == 'article_ids_used' and value:
-                            print(f"   • {key}: {len(value)} IDs ({', '.join(value[:3])}{'...' if len(value) > 3 else ''})")
-                        elif isinstance(value, list):
-                            print(f"   • {key}: {len(value)} items")
-                        elif value:
-                            print(f"   • {key}: present")
-                    
-                    # Show detailed results
-                    print(f"\n📊 Detailed Results:")
-                    for key, value in result_dict.items():
-                        if isinstance(value, list) and value:
-                            print(f"\n   {key.replace('_', ' ').title()}:")
-                            for i, item in enumerate(value[:5], 1):
-                                if isinstance(item, str):
-                                    # Truncate long strings
-                                    display = item[:200] + "..." if len(item) > 200 else item
-                                    print(f"      {i}. {display}")
-                                else:
-                                    print(f"      {i}. {item}")
-                            if len(value) > 5:
-                                print(f"      ... and {len(value) - 5} more")
-                
-                print(f"\n✅ {agent_name.upper()} complete")
-            except Exception as e:
-                print(f"❌ {agent_name.upper()} failed: {e}")
-                results[agent_name] = None
+                timings[agent_name] = f"ok:{elapsed:.1f}s"
+                logger.info(
+                    f"Agent {agent_name} done | topic={topic_id} section={section} | "
+                    f"{elapsed:.1f}s | {self._summarize_result(result)}"
+                )
+        except FuturesTimeout:
+            for future, agent_name in futures.items():
+                if agent_name not in timings:
+                    future.cancel()
+                    timings[agent_name] = f"timeout:{timeout_s:.0f}s"
+                    logger.warning(f"Agent {agent_name} timed out | topic={topic_id} section={section} | {timeout_s:.0f}s")
+        finally:
+            pool.shutdown(wait=False)
         
+        wall = time.monotonic() - started
+        ok = sum(1 for r in results.values() if r is not None)
+        logger.info(
+            f"Agents done | topic={topic_id} section={section} | {ok}/{len(agent_names)} ok | "
+            f"wall={wall:.1f}s | " + " ".join(f"{name}={timings.get(name, '?')}" for name in agent_names)
+        )
         return results, source_registry
     
+    @staticmethod
+    def _summarize_result(result: Any) -> str:
+        """One-line item counts of an agent's output, for logs."""
+        if not hasattr(result, "__dict__"):
+            return type(result).__name__
+        parts = []
+        for key, value in result.__dict__.items():
+            if isinstance(value, list):
+                parts.append(f"{key}={len(value)}")
+            elif value:
+                parts.append(f"{key}=present")
+        return " ".join(parts)
+    
     def format_results_for_display(self, results: Dict[str, Any]) -> str:
         """Format agent results for human-readable display"""
         output = []
@@ -545,17 +556,20 @@ def analysis_rewriter_with_agents(
 
     This is the GOD-TIER entry point that REPLACES the old analysis_rewriter.
 
-    CUMULATIVE BUILDING FLOW:
+    BUILDING FLOW (SECTION_DEPENDENCIES in section_config.py):
     1. chain_reaction_map (articles only) → Foundation
-    2. structural_threats (articles + chain_reaction_map) → Long-term
-    3. tactical_scenarios (articles + chain + structural) → Medium-term
-    4. immediate_intelligence (articles + all 3 prior) → Short-term
+    2. structural_threats (articles + chain_reaction_map) → Long-term     ┐
+    3. tactical_scenarios (articles + chain_reaction_map) → Medium-term   ├ concurrent
+    4. immediate_intelligence (articles + chain_reaction_map) → Short-term┘
     5. macro_cascade (articles + all 4 prior) → Cross-topic
     6. trade_intelligence (NO articles, uses all 5 prior) → Actionable
     7. house_view (NO articles, uses all 6 prior) → Executive synthesis
     8. risk_monitor (NO articles, uses all 7 prior) → Watch list
 
-    Each section gets progressively MORE context. By house_view, we have 6 prior analyses!
+    The timeframe sections each build on the cascade map only; from
+    macro_cascade on, each section gets all prior sections as context.
+    Sections are scheduled by section_scheduler.run_section_dag, so a full
+    rewrite takes the longest dependency chain rather than the sum of all sections.
 
     Args:
         topic_id: Topic to analyze
@@ -583,6 +597,9 @@ def analysis_rewriter_with_agents(
         })
         if not result:
             raise Exception(f"Failed to save {section} for topic {topic_id}")
+        snapshot = peek_topic_snapshot(topic_id)
+        if snapshot is not None:
+            snapshot.set_field(section, analysis_text)
     
     print("\n" + "="*100)
     print("🚀 AGENT-BASED ANALYSIS PIPELINE - RISK & CHAIN REACTION FOCUSED")
@@ -592,15 +609,16 @@ def analysis_rewriter_with_agents(
     # Determine which sections to run
     sections_to_run = [analysis_type] if analysis_type else EXECUTION_ORDER
     
-    # Track completed sections for cumulative building
+    # Track completed sections for cumulative building (shared by concurrent sections)
     completed_sections = {}
+    completed_lock = threading.Lock()
     
     orchestrator = AnalysisAgentOrchestrator()
     writer = WriterAgent()
     
-    for i, section in enumerate(sections_to_run, 1):
+    def run_section(section: str) -> Optional[str]:
         print(f"\n{'='*100}")
-        print(f"📊 SECTION {i}/{len(sections_to_run)}: {section.upper()}")
+        print(f"📊 SECTION {sections_to_run.index(section) + 1}/{len(sections_to_run)}: {section.upper()}")
         print(f"{'='*100}")
         
         try:
@@ -610,15 +628,19 @@ def analysis_rewriter_with_agents(
             
             if deps:
                 print(f"📦 Loading {len(deps)} prior sections...")
+                # Deps in this run finished before the scheduler started us; others come from the graph
+                prior = {}
                 for dep in deps:
-                    if dep not in completed_sections:
+                    with completed_lock:
+                        dep_content = completed_sections.get(dep)
+                    if dep_content is None:
                         dep_content = get_topic_analysis_field(topic_id, dep)
-                        if dep_content:
-                            completed_sections[dep] = dep_content
+                    if dep_content:
+                        prior[dep] = dep_content
                 
                 prior_context = "\n\n".join([
-                    f"═══ {dep.upper()} ═══\n{completed_sections[dep]}"
-                    for dep in deps if dep in completed_sections
+                    f"═══ {dep.upper()} ═══\n{prior[dep]}"
+                    for dep in deps if dep in prior
                 ])
             
             # STEP 2: Run agents
@@ -662,7 +684,7 @@ def analysis_rewriter_with_agents(
                 )
                 from src.observability.stats_client import track
                 track("agent_section_skipped_no_articles", f"Topic {topic_id}: {section}")
-                continue
+                return None
             
             # STEP 4: Load existing analysis (if any) for incremental updates
             existing_analysis = get_topic_analysis_field(topic_id, section)
@@ -737,14 +759,28 @@ def analysis_rewriter_with_agents(
             from src.observability.stats_client import track
             track("agent_section_written", f"Topic {topic_id}: {section}")
             
-            completed_sections[section] = analysis_text
+            with completed_lock:
+                completed_sections[section] = analysis_text
             print(f"✅ COMPLETE\n")
+            return analysis_text
             
         except Exception as e:
             logger.error(f"Failed {section}: {e}", exc_info=True)
             print(f"❌ FAILED: {e}")
             raise
     
+    # One graph read for all agents of all sections, fresh for this rewrite
+    get_topic_snapshot(topic_id, refresh=True)
+    try:
+        # Independent sections run concurrently; each starts once its dependencies are written
+        run_section_dag(sections_to_run, run_section)
+    finally:
+        drop_topic_snapshot(topic_id)
+        if completed_sections:
+            # Saved sections change the topic's shortlist embedding (see topic_index._topic_text)
+            from src.vector.topic_index import refresh_topic
+            refresh_topic(topic_id)
+    
     # After all sections: print a consolidated view of all generated sections
     if completed_sections:
         print("\n" + "=" * 80)
@@ -954,7 +990,7 @@ def run_analysis_agents(topic_id: str, section: str) -> Dict[str, Any]:
         Dict with results from each agent
     """
     orchestrator = AnalysisAgentOrchestrator()
-    results = orchestrator.run_agents_for_section(topic_id, section)
+    results, _ = orchestrator.run_agents_for_section(topic_id, section)
     
     # Print formatted results
     print(orchestrator.format_results_for_display(results))
@@ -53,6 +53,22 @@ AGENT_SECTION_CONFIGS = {
 # Execution order (list of keys from AGENT_SECTION_CONFIGS)
 AGENT_SECTIONS = list(AGENT_SECTION_CONFIGS.keys())
 
+# Prior sections each section is built on. This is the DAG the section
+# scheduler runs: sections with no path between them are written concurrently.
+# The three timeframe sections each read the cascade map, not each other
+# (their prompts in orchestrator.SECTION_FOCUS only promise that context);
+# risk_monitor monitors the house_view, so it still waits for it.
+SECTION_DEPENDENCIES = {
+    "chain_reaction_map": [],  # Foundation - articles only
+    "structural_threats": ["chain_reaction_map"],
+    "tactical_scenarios": ["chain_reaction_map"],
+    "immediate_intelligence": ["chain_reaction_map"],
+    "macro_cascade": ["chain_reaction_map", "structural_threats", "tactical_scenarios", "immediate_intelligence"],
+    "trade_intelligence": ["chain_reaction_map", "structural_threats", "tactical_scenarios", "immediate_intelligence", "macro_cascade"],
+    "house_view": ["chain_reaction_map", "structural_threats", "tactical_scenarios", "immediate_intelligence", "macro_cascade", "trade_intelligence"],
+    "risk_monitor": ["chain_reaction_map", "structural_threats", "tactical_scenarios", "immediate_intelligence", "macro_cascade", "trade_intelligence", "house_view"],
+}
+
 # =============================================================================
 # LEGACY ANALYSIS SECTIONS (Old Pipeline)
 # =============================================================================
@@ -0,0 +1,144 @@
+"""
+Dependency-driven section scheduler.
+
+Builds the DAG from SECTION_DEPENDENCIES (section_config.py) and runs every
+section as soon as all of its dependencies that are part of this run have
+finished, up to max_workers sections at a time. Independent sections (e.g.
+the three timeframe sections) run concurrently, so a full rewrite takes
+roughly the longest dependency chain instead of the sum of all sections.
+
+Dependencies outside the run (single-section rewrites) are not waited on;
+the section loads their saved text from the graph as before.
+
+Usage:
+    report = run_section_dag(sections, run_section)
+    # run_section(section) does the work; its return value lands in report["results"]
+"""
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from src.analysis_agents.section_config import SECTION_DEPENDENCIES
+from utils import app_logging
+
+logger = app_logging.get_logger(__name__)
+
+# Sections written at the same time (LLM calls are further capped per tier in llm/config.py)
+ANALYSIS_SECTION_CONCURRENCY = int(os.getenv("ANALYSIS_SECTION_CONCURRENCY", "3"))
+
+
+def build_section_dag(
+    sections: List[str], dependencies: Mapping[str, List[str]] = SECTION_DEPENDENCIES
+) -> Dict[str, List[str]]:
+    """Dependencies of each section restricted to the sections being run. Raises ValueError on a cycle."""
+    selected = set(sections)
+    dag = {s: [d for d in dependencies.get(s, []) if d in selected] for s in sections}
+
+    # Kahn's algorithm, only to reject cycles before any section is started
+    remaining = {s: len(deps) for s, deps in dag.items()}
+    ready = [s for s, n in remaining.items() if n == 0]
+    seen = 0
+    while ready:
+        section = ready.pop()
+        seen += 1
+        for other, deps in dag.items():
+            if section in deps:
+                remaining[other] -= 1
+                if remaining[other] == 0:
+                    ready.append(other)
+    if seen != len(dag):
+        raise ValueError(f"Section dependencies contain a cycle: {sorted(s for s, n in remaining.items() if n)}")
+    return dag
+
+
+def critical_path(dag: Mapping[str, List[str]], durations: Mapping[str, float]) -> tuple[float, List[str]]:
+    """Longest chain of section durations through the DAG: (seconds, sections in order)."""
+    memo: Dict[str, tuple[float, List[str]]] = {}
+
+    def longest(section: str) -> tuple[float, List[str]]:
+        if section not in memo:
+            best = max((longest(d) for d in dag[section]), default=(0.0, []), key=lambda r: r[0])
+            memo[section] = (best[0] + durations.get(section, 0.0), best[1] + [section])
+        return memo[section]
+
+    return max((longest(s) for s in dag), default=(0.0, []), key=lambda r: r[0])
+
+
+def run_section_dag(
+    sections: List[str],
+    run_section: Callable[[str], Any],
+    dependencies: Mapping[str, List[str]] = SECTION_DEPENDENCIES,
+    max_workers: int = ANALYSIS_SECTION_CONCURRENCY,
+) -> Dict[str, Any]:
+    """
+    Run sections in dependency order, independent ones concurrently.
+
+    Sections are started in the order given whenever several are ready. If a
+    section raises, no new sections are started, the running ones finish, and
+    the first error is re-raised.
+
+    Returns:
+        {"results": {section: return value}, "durations": {section: seconds},
+         "wall_s", "serial_s" (sum of durations), "critical_path_s", "critical_path"}
+    """
+    dag = build_section_dag(sections, dependencies)
+    order = {s: i for i, s in enumerate(sections)}
+    pending = {s: set(deps) for s, deps in dag.items()}
+    results: Dict[str, Any] = {}
+    durations: Dict[str, float] = {}
+    lock = threading.Lock()
+    error: Optional[BaseException] = None
+    started_at = time.monotonic()
+
+    def timed(section: str) -> Any:
+        t0 = time.monotonic()
+        try:
+            return run_section(section)
+        finally:
+            with lock:
+                durations[section] = time.monotonic() - t0
+
+    running: Dict[Future, str] = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="section") as pool:
+        while True:
+            if error is None:
+                ready = sorted((s for s, deps in pending.items() if not deps), key=order.get)
+                for section in ready:
+                    del pending[section]
+                    logger.info(f"Section {section} started | running={len(running) + 1}")
+                    running[pool.submit(timed, section)] = section
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                section = running.pop(future)
+                try:
+                    results[section] = future.result()
+                except BaseException as e:
+                    logger.error(f"Section {section} failed: {e}")
+                    error = error or e
+                    continue
+                for deps in pending.values():
+                    deps.discard(section)
+
+    wall_s = time.monotonic() - started_at
+    path_s, path = critical_path(
+        {s: [d for d in dag[s] if d in durations] for s in durations}, durations
+    )
+    report = {
+        "results": results,
+        "durations": durations,
+        "wall_s": wall_s,
+        "serial_s": sum(durations.values()),
+        "critical_path_s": path_s,
+        "critical_path": path,
+    }
+    logger.info(
+        f"Sections done: {len(results)}/{len(sections)} | wall={wall_s:.1f}s "
+        f"serial={report['serial_s']:.1f}s critical_path={path_s:.1f}s ({' -> '.join(path)})"
+    )
+    if error is not None:
+        raise error
+    return report
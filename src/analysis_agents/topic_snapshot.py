@@ -0,0 +1,205 @@
+"""
+Topic Graph Snapshot - one read of a topic's neighborhood for all agents.
+
+The agents' graph strategies (synthesis_scout, contrarian_finder,
+depth_finder, improvement_analyzer, writer) all look at the same data: the
+topic's ABOUT articles, its 1-hop related topics and their analysis fields.
+Instead of each issuing its own Cypher per section, a snapshot loads it in
+two queries and the strategies filter/rank in Python:
+
+1. The topic's properties + every ABOUT article with its relationship properties
+2. Related topics over the canonical edges (INFLUENCES, CORRELATES_WITH,
+   PEERS, COMPONENT_OF, HEDGES) with their properties, edge types/directions
+   and their tier-3 ABOUT articles
+
+Snapshots are cached per topic. analysis_rewriter_with_agents loads a fresh
+one at the start of a rewrite and drops it at the end; outside a rewrite the
+cached copy is reused for up to TOPIC_SNAPSHOT_TTL_S.
+
+Usage:
+    snapshot = get_topic_snapshot(topic_id)
+    tier3 = [a for a in snapshot.articles if a["importance_risk"] == 3]
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.graph.neo4j_client import run_cypher
+from utils import app_logging
+
+logger = app_logging.get_logger(__name__)
+
+# Reuse window for snapshots loaded outside a rewrite (a rewrite always reloads)
+TOPIC_SNAPSHOT_TTL_S = float(os.getenv("TOPIC_SNAPSHOT_TTL_S", "600"))
+TOPIC_SNAPSHOT_CACHE_SIZE = int(os.getenv("TOPIC_SNAPSHOT_CACHE_SIZE", "32"))
+
+RELATED_EDGE_TYPES = ["INFLUENCES", "CORRELATES_WITH", "PEERS", "COMPONENT_OF", "HEDGES"]
+PERSPECTIVES = ["risk", "opportunity", "trend", "catalyst"]
+
+_ARTICLE_PROJECTION = """art {
+        .id, .summary, .argos_summary, .source, .published_at,
+        timeframe: r.timeframe,
+        importance_risk: r.importance_risk,
+        importance_opportunity: r.importance_opportunity,
+        importance_trend: r.importance_trend,
+        importance_catalyst: r.importance_catalyst,
+        motivation: r.motivation,
+        implications: r.implications
+    }"""
+
+_TOPIC_QUERY = f"""
+MATCH (t:Topic {{id: $topic_id}})
+OPTIONAL MATCH (art:Article)-[r:ABOUT]->(t)
+RETURN properties(t) AS topic,
+       collect({_ARTICLE_PROJECTION}) AS articles
+"""
+
+# $ids: extra topics outside the neighborhood (e.g. legacy contrarian pairs)
+_NEIGHBORS_QUERY = f"""
+MATCH (t:Topic {{id: $topic_id}})-[rel:{'|'.join(RELATED_EDGE_TYPES)}]-(related:Topic)
+WITH related, collect(DISTINCT {{
+    relationship_type: type(rel),
+    direction: CASE
+        WHEN type(rel) = 'INFLUENCES' AND startNode(rel) = t THEN 'outgoing'
+        WHEN type(rel) = 'INFLUENCES' AND endNode(rel) = t THEN 'incoming'
+        WHEN type(rel) = 'COMPONENT_OF' AND startNode(rel) = t THEN 'parent'
+        WHEN type(rel) = 'COMPONENT_OF' AND endNode(rel) = t THEN 'child'
+        ELSE 'bidirectional'
+    END
+}}) AS edges
+RETURN properties(related) AS topic, edges,
+       [(art:Article)-[r:ABOUT]->(related)
+        WHERE r.importance_risk = 3 OR r.importance_opportunity = 3
+           OR r.importance_trend = 3 OR r.importance_catalyst = 3
+        | {_ARTICLE_PROJECTION}] AS articles
+"""
+
+_EXTRA_TOPICS_QUERY = f"""
+MATCH (related:Topic)
+WHERE related.id IN $ids
+RETURN properties(related) AS topic, [] AS edges,
+       [(art:Article)-[r:ABOUT]->(related)
+        WHERE r.importance_risk = 3 OR r.importance_opportunity = 3
+           OR r.importance_trend = 3 OR r.importance_catalyst = 3
+        | {_ARTICLE_PROJECTION}] AS articles
+"""
+
+
+def overall_importance(article: Dict[str, Any]) -> int:
+    """Highest perspective score of an ABOUT link (0 if unscored)."""
+    return max(article.get(f"importance_{p}") or 0 for p in PERSPECTIVES)
+
+
+def newest_first(articles: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # published_at is an ISO string or a neo4j DateTime; both order correctly as str
+    return sorted(articles, key=lambda a: str(a.get("published_at") or ""), reverse=True)
+
+
+class TopicGraphSnapshot:
+    """A topic, its ABOUT articles and its 1-hop related topics, read once."""
+
+    def __init__(self, topic_id: str, topic: Dict[str, Any], articles: List[Dict[str, Any]],
+                 related: List[Dict[str, Any]]):
+        self.topic_id = topic_id
+        self.topic = topic
+        # Newest first, so strategies only need to re-sort by their own score
+        self.articles = newest_first(articles)
+        # One entry per related topic: its properties plus "edges" and tier-3 "articles"
+        self.related = related
+        self._extra: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, topic_id: str) -> "TopicGraphSnapshot":
+        started = time.monotonic()
+        rows = run_cypher(_TOPIC_QUERY, {"topic_id": topic_id}) or []
+        topic = rows[0]["topic"] if rows else {}
+        articles = rows[0]["articles"] if rows else []
+        related = [cls._related_entry(row) for row in run_cypher(_NEIGHBORS_QUERY, {"topic_id": topic_id}) or []]
+        snapshot = cls(topic_id, topic, articles, related)
+        logger.info(
+            f"Topic snapshot | topic={topic_id} | articles={len(articles)} related={len(related)} | "
+            f"{time.monotonic() - started:.2f}s"
+        )
+        return snapshot
+
+    @staticmethod
+    def _related_entry(row: Dict[str, Any]) -> Dict[str, Any]:
+        entry = dict(row["topic"])
+        entry["edges"] = row.get("edges") or []
+        entry["articles"] = newest_first(row.get("articles") or [])
+        return entry
+
+    @property
+    def name(self) -> str:
+        return self.topic.get("name") or self.topic_id
+
+    def field(self, name: str) -> Any:
+        return self.topic.get(name)
+
+    def set_field(self, name: str, value: Any) -> None:
+        """Keep the snapshot current after the rewrite saves a section."""
+        self.topic[name] = value
+
+    def edges(self, types: Optional[List[str]] = None) -> List[tuple]:
+        """(related topic entry, relationship_type, direction) per distinct edge."""
+        out = []
+        for entry in self.related:
+            for edge in entry["edges"]:
+                if types is None or edge["relationship_type"] in types:
+                    out.append((entry, edge["relationship_type"], edge["direction"]))
+        return out
+
+    def topics(self, topic_ids: List[str]) -> List[Dict[str, Any]]:
+        """Related-topic entries for ids, loading any outside the neighborhood (once)."""
+        by_id = {entry["id"]: entry for entry in self.related}
+        with self._lock:
+            missing = [tid for tid in topic_ids if tid not in by_id and tid not in self._extra]
+            if missing:
+                rows = run_cypher(_EXTRA_TOPICS_QUERY, {"ids": missing}) or []
+                for row in rows:
+                    entry = self._related_entry(row)
+                    self._extra[entry["id"]] = entry
+                for tid in missing:
+                    self._extra.setdefault(tid, None)
+            by_id.update({tid: e for tid, e in self._extra.items() if e is not None})
+        return [by_id[tid] for tid in topic_ids if tid in by_id]
+
+
+_cache_lock = threading.Lock()
+_snapshots: "OrderedDict[str, tuple[float, TopicGraphSnapshot]]" = OrderedDict()
+_load_locks: Dict[str, threading.Lock] = {}
+
+
+def get_topic_snapshot(topic_id: str, refresh: bool = False) -> TopicGraphSnapshot:
+    """Cached snapshot for a topic; concurrent callers share one load."""
+    with _cache_lock:
+        lock = _load_locks.setdefault(topic_id, threading.Lock())
+    with lock:
+        with _cache_lock:
+            entry = _snapshots.get(topic_id)
+            if entry is not None and not refresh and time.monotonic() - entry[0] < TOPIC_SNAPSHOT_TTL_S:
+                _snapshots.move_to_end(topic_id)
+                return entry[1]
+        snapshot = TopicGraphSnapshot.load(topic_id)
+        with _cache_lock:
+            _snapshots[topic_id] = (time.monotonic(), snapshot)
+            _snapshots.move_to_end(topic_id)
+            while len(_snapshots) > TOPIC_SNAPSHOT_CACHE_SIZE:
+                _snapshots.popitem(last=False)
+        return snapshot
+
+
+def peek_topic_snapshot(topic_id: str) -> Optional[TopicGraphSnapshot]:
+    """The cached snapshot if there is one, without loading."""
+    with _cache_lock:
+        entry = _snapshots.get(topic_id)
+        return entry[1] if entry is not None else None
+
+
+def drop_topic_snapshot(topic_id: str) -> None:
+    with _cache_lock:
+        _snapshots.pop(topic_id, None)
+        _load_locks.pop(topic_id, None)
@@ -14,16 +14,66 @@ SMART ARTICLE SELECTION:
 - Timeframe sections (fundamental/medium/current): ALL tier 3+2 articles (importance >= 2) for that timeframe, max 15
 - Synthesis sections (drivers/executive_summary): 5 articles each from fundamental/medium/current (15 total)
 - Perspective sections (risk/opportunity/trend/catalyst): ALL tier 3+2 articles (perspective score >= 2), max 15
+
+All data comes from the shared TopicGraphSnapshot.
 """
 
 from typing import Dict, List
-from src.graph.neo4j_client import run_cypher
+from src.analysis_agents.topic_snapshot import (
+    RELATED_EDGE_TYPES,
+    get_topic_snapshot,
+    overall_importance,
+)
+
+# Section type detection
+TIMEFRAME_SECTIONS = ["fundamental", "medium", "current"]
+SYNTHESIS_SECTIONS = ["drivers", "movers_scenarios", "swing_trade_or_outlook", "executive_summary"]
+PERSPECTIVE_SECTIONS = ["risk_analysis", "opportunity_analysis", "trend_analysis", "catalyst_analysis"]
+
+PERSPECTIVE_MAP = {
+    "risk_analysis": "importance_risk",
+    "opportunity_analysis": "importance_opportunity",
+    "trend_analysis": "importance_trend",
+    "catalyst_analysis": "importance_catalyst"
+}
+
+EXISTING_ANALYSIS_FIELDS = {
+    "fundamental": "fundamental_analysis",
+    "medium": "medium_analysis",
+    "current": "current_analysis",
+    "drivers": "drivers",
+    "executive_summary": "executive_summary",
+    "risk_analysis": "risk_analysis",
+    "opportunity_analysis": "opportunity_analysis",
+    "trend_analysis": "trend_analysis",
+    "catalyst_analysis": "catalyst_analysis",
+}
+
+
+def _article_material(art: Dict) -> Dict:
+    return {
+        "id": art["id"],
+        "summary": art.get("summary"),
+        "full_summary": art.get("argos_summary"),
+        "source": art.get("source"),
+        "published_at": art.get("published_at"),
+        "motivation": art.get("motivation"),
+        "implications": art.get("implications"),
+        "risk": art.get("importance_risk"),
+        "opportunity": art.get("importance_opportunity"),
+        "trend": art.get("importance_trend"),
+        "catalyst": art.get("importance_catalyst")
+    }
 
 
 def explore_graph(topic_id: str, section: str) -> Dict:
     """
     Get COMPREHENSIVE material for writing analysis.
     
+    Reads the shared TopicGraphSnapshot (no queries of its own). Snapshot
+    articles are newest first, so a stable sort by score keeps recency as
+    the tie-breaker.
+    
     Returns:
         {
             "topic_name": str,
@@ -34,258 +84,83 @@ def explore_graph(topic_id: str, section: str) -> Dict:
             "cross_topic_drivers": List[dict]  # Driver articles from other topics
         }
     """
-    
-    # Section type detection
-    TIMEFRAME_SECTIONS = ["fundamental", "medium", "current"]
-    SYNTHESIS_SECTIONS = ["drivers", "movers_scenarios", "swing_trade_or_outlook", "executive_summary"]
-    PERSPECTIVE_SECTIONS = ["risk_analysis", "opportunity_analysis", "trend_analysis", "catalyst_analysis"]
+    snapshot = get_topic_snapshot(topic_id)
+    edges = snapshot.edges(RELATED_EDGE_TYPES)
     
     # STEP 1: Get articles with SMART SELECTION based on section type
     if section in TIMEFRAME_SECTIONS:
-        # Timeframe sections: ALL tier 3 + tier 2 articles (max 4+3 per perspective = 28 total)
-        # Use timeframe AND perspective filters, limit to 15 for safety
-        articles_query = """
-        MATCH (t:Topic {id: $topic_id})
-        OPTIONAL MATCH (art:Article)-[r:ABOUT]->(t)
-        WHERE r.timeframe = $section
-          AND (
-            coalesce(r.importance_risk, 0) >= 2 OR 
-            coalesce(r.importance_opportunity, 0) >= 2 OR 
-            coalesce(r.importance_trend, 0) >= 2 OR 
-            coalesce(r.importance_catalyst, 0) >= 2
-          )
-        WITH t, art, r,
-             CASE 
-               WHEN coalesce(r.importance_risk, 0) >= coalesce(r.importance_opportunity, 0) 
-                    AND coalesce(r.importance_risk, 0) >= coalesce(r.importance_trend, 0)
-                    AND coalesce(r.importance_risk, 0) >= coalesce(r.importance_catalyst, 0)
-               THEN coalesce(r.importance_risk, 0)
-               WHEN coalesce(r.importance_opportunity, 0) >= coalesce(r.importance_trend, 0)
-                    AND coalesce(r.importance_opportunity, 0) >= coalesce(r.importance_catalyst, 0)
-               THEN coalesce(r.importance_opportunity, 0)
-               WHEN coalesce(r.importance_trend, 0) >= coalesce(r.importance_catalyst, 0)
-               THEN coalesce(r.importance_trend, 0)
-               ELSE coalesce(r.importance_catalyst, 0)
-             END as overall_importance
-        ORDER BY overall_importance DESC, art.published_at DESC
-        LIMIT 15
-        WITH t, collect({
-            id: art.id,
-            summary: art.summary,
-            full_summary: art.argos_summary,
-            source: art.source,
-            published_at: art.published_at,
-            motivation: r.motivation,
-            implications: r.implications,
-            risk: r.importance_risk,
-            opportunity: r.importance_opportunity,
-            trend: r.importance_trend,
-            catalyst: r.importance_catalyst
-        }) as articles
+        # Timeframe sections: tier 3 + tier 2 articles in this timeframe, limit to 15 for safety
+        selected = [
+            a for a in snapshot.articles
+            if a.get("timeframe") == section and overall_importance(a) >= 2
+        ]
+        selected.sort(key=overall_importance, reverse=True)
+        articles = [_article_material(a) for a in selected[:15]]
         
-        // Get related topics for synthesis WITH direction info
-        OPTIONAL MATCH (t)-[rel:INFLUENCES|CORRELATES_WITH|PEERS|COMPONENT_OF|HEDGES]-(related:Topic)
-        WITH t, articles, collect(DISTINCT {
-            id: related.id,
-            name: related.name,
-            relationship: type(rel),
-            direction: CASE
-                WHEN type(rel) = 'INFLUENCES' AND startNode(rel) = t THEN 'outgoing'
-                WHEN type(rel) = 'INFLUENCES' AND endNode(rel) = t THEN 'incoming'
-                WHEN type(rel) = 'COMPONENT_OF' AND startNode(rel) = t THEN 'parent'
-                WHEN type(rel) = 'COMPONENT_OF' AND endNode(rel) = t THEN 'child'
-                ELSE 'bidirectional'
-            END,
-            fundamental: related.fundamental_analysis,
-            medium: related.medium_analysis,
-            current: related.current_analysis
-        }) as related_topics
-        
-        RETURN 
-            t.name as topic_name,
-            t.id as topic_id,
-            articles,
-            related_topics,
+        # Related topics for synthesis WITH direction info
+        related_topics = [
             {
-                fundamental: t.fundamental_analysis,
-                medium: t.medium_analysis,
-                current: t.current_analysis,
-                drivers: t.drivers,
-                executive_summary: t.executive_summary,
-                risk_analysis: t.risk_analysis,
-                opportunity_analysis: t.opportunity_analysis,
-                trend_analysis: t.trend_analysis,
-                catalyst_analysis: t.catalyst_analysis
-            } as existing_analysis
-        """
-        params = {"topic_id": topic_id, "section": section}
+                "id": rel["id"],
+                "name": rel.get("name"),
+                "relationship": rel_type,
+                "direction": direction,
+                "fundamental": rel.get("fundamental_analysis"),
+                "medium": rel.get("medium_analysis"),
+                "current": rel.get("current_analysis")
+            }
+            for rel, rel_type, direction in edges
+        ]
         
     elif section in PERSPECTIVE_SECTIONS:
         # Perspective sections: 10 articles with perspective score >= 2
-        perspective_map = {
-            "risk_analysis": "importance_risk",
-            "opportunity_analysis": "importance_opportunity",
-            "trend_analysis": "importance_trend",
-            "catalyst_analysis": "importance_catalyst"
-        }
-        perspective_field = perspective_map.get(section, "importance_risk")
+        perspective_field = PERSPECTIVE_MAP.get(section, "importance_risk")
         
-        articles_query = f"""
-        MATCH (t:Topic {{id: $topic_id}})
-        OPTIONAL MATCH (art:Article)-[r:ABOUT]->(t)
-        WHERE coalesce(r.{perspective_field}, 0) >= 2
-        WITH t, art, r,
-             coalesce(r.{perspective_field}, 0) as perspective_score,
-             CASE 
-               WHEN coalesce(r.importance_risk, 0) >= coalesce(r.importance_opportunity, 0) 
-                    AND coalesce(r.importance_risk, 0) >= coalesce(r.importance_trend, 0)
-                    AND coalesce(r.importance_risk, 0) >= coalesce(r.importance_catalyst, 0)
-               THEN coalesce(r.importance_risk, 0)
-               WHEN coalesce(r.importance_opportunity, 0) >= coalesce(r.importance_trend, 0)
-                    AND coalesce(r.importance_opportunity, 0) >= coalesce(r.importance_catalyst, 0)
-               THEN coalesce(r.importance_opportunity, 0)
-               WHEN coalesce(r.importance_trend, 0) >= coalesce(r.importance_catalyst, 0)
-               THEN coalesce(r.importance_trend, 0)
-               ELSE coalesce(r.importance_catalyst, 0)
-             END as overall_importance
-        ORDER BY perspective_score DESC, overall_importance DESC, art.published_at DESC
-        LIMIT 10
-        WITH t, collect({
-            id: art.id,
-            summary: art.summary,
-            full_summary: art.argos_summary,
-            source: art.source,
-            published_at: art.published_at,
-            motivation: r.motivation,
-            implications: r.implications,
-            risk: r.importance_risk,
-            opportunity: r.importance_opportunity,
-            trend: r.importance_trend,
-            catalyst: r.importance_catalyst,
-            perspective_score: perspective_score
-        }) as articles
+        def perspective_score(a: Dict) -> int:
+            return a.get(perspective_field) or 0
         
-        // Get related topics WITH direction info
-        OPTIONAL MATCH (t)-[rel:INFLUENCES|CORRELATES_WITH|PEERS|COMPONENT_OF|HEDGES]-(related:Topic)
-        WITH t, articles, collect(DISTINCT {{
-            id: related.id,
-            name: related.name,
-            relationship: type(rel),
-            direction: CASE
-                WHEN type(rel) = 'INFLUENCES' AND startNode(rel) = t THEN 'outgoing'
-                WHEN type(rel) = 'INFLUENCES' AND endNode(rel) = t THEN 'incoming'
-                WHEN type(rel) = 'COMPONENT_OF' AND startNode(rel) = t THEN 'parent'
-                WHEN type(rel) = 'COMPONENT_OF' AND endNode(rel) = t THEN 'child'
-                ELSE 'bidirectional'
-            END,
-            {section}: related.{section}
-        }}) as related_topics
+        selected = [a for a in snapshot.articles if perspective_score(a) >= 2]
+        selected.sort(key=lambda a: (perspective_score(a), overall_importance(a)), reverse=True)
+        articles = [
+            {**_article_material(a), "perspective_score": perspective_score(a)}
+            for a in selected[:10]
+        ]
         
-        RETURN 
-            t.name as topic_name,
-            t.id as topic_id,
-            articles,
-            related_topics,
-            {{
-                fundamental: t.fundamental_analysis,
-                medium: t.medium_analysis,
-                current: t.current_analysis,
-                drivers: t.drivers,
-                executive_summary: t.executive_summary,
-                risk_analysis: t.risk_analysis,
-                opportunity_analysis: t.opportunity_analysis,
-                trend_analysis: t.trend_analysis,
-                catalyst_analysis: t.catalyst_analysis
-            }} as existing_analysis
-        """
-        params = {"topic_id": topic_id}
+        # Related topics WITH direction info
+        related_topics = [
+            {
+                "id": rel["id"],
+                "name": rel.get("name"),
+                "relationship": rel_type,
+                "direction": direction,
+                section: rel.get(section)
+            }
+            for rel, rel_type, direction in edges
+        ]
         
     else:
         # Synthesis sections: 5 articles each from fundamental/medium/current (15 total)
-        articles_query = """
-        MATCH (t:Topic {id: $topic_id})
-        
-        // Get 5 best from each timeframe
-        OPTIONAL MATCH (art:Article)-[r:ABOUT]->(t)
-        WHERE r.timeframe IN ['fundamental', 'medium', 'current']
-        WITH t, art, r,
-             CASE 
-               WHEN coalesce(r.importance_risk, 0) >= coalesce(r.importance_opportunity, 0) 
-                    AND coalesce(r.importance_risk, 0) >= coalesce(r.importance_trend, 0)
-                    AND coalesce(r.importance_risk, 0) >= coalesce(r.importance_catalyst, 0)
-               THEN coalesce(r.importance_risk, 0)
-               WHEN coalesce(r.importance_opportunity, 0) >= coalesce(r.importance_trend, 0)
-                    AND coalesce(r.importance_opportunity, 0) >= coalesce(r.importance_catalyst, 0)
-               THEN coalesce(r.importance_opportunity, 0)
-               WHEN coalesce(r.importance_trend, 0) >= coalesce(r.importance_catalyst, 0)
-               THEN coalesce(r.importance_trend, 0)
-               ELSE coalesce(r.importance_catalyst, 0)
-             END as overall_importance
-        ORDER BY r.timeframe, overall_importance DESC, art.published_at DESC
-        WITH t, r.timeframe as timeframe, collect(art)[0..5] as timeframe_articles
-        WITH t, collect({timeframe: timeframe, articles: timeframe_articles}) as grouped
-        
-        // Flatten articles from all timeframes
-        UNWIND grouped as group
-        UNWIND group.articles as art
-        MATCH (art)-[r:ABOUT]->(t)
-        WITH t, collect({
-            id: art.id,
-            summary: art.summary,
-            full_summary: art.argos_summary,
-            source: art.source,
-            published_at: art.published_at,
-            motivation: r.motivation,
-            implications: r.implications,
-            risk: r.importance_risk,
-            opportunity: r.importance_opportunity,
-            trend: r.importance_trend,
-            catalyst: r.importance_catalyst,
-            timeframe: r.timeframe
-        }) as articles
+        articles = []
+        for timeframe in sorted(TIMEFRAME_SECTIONS):
+            selected = [a for a in snapshot.articles if a.get("timeframe") == timeframe]
+            selected.sort(key=overall_importance, reverse=True)
+            articles.extend({**_article_material(a), "timeframe": timeframe} for a in selected[:5])
         
-        // Get related topics for synthesis (all 5 canonical relationship types)
-        OPTIONAL MATCH (t)-[rel:INFLUENCES|CORRELATES_WITH|PEERS|COMPONENT_OF|HEDGES]-(related:Topic)
-        WITH t, articles, collect(DISTINCT {
-            id: related.id,
-            name: related.name,
-            relationship_type: type(rel),
-            direction: CASE
-                WHEN type(rel) = 'INFLUENCES' AND startNode(rel) = t THEN 'outgoing'
-                WHEN type(rel) = 'INFLUENCES' AND endNode(rel) = t THEN 'incoming'
-                WHEN type(rel) = 'COMPONENT_OF' AND startNode(rel) = t THEN 'parent'
-                WHEN type(rel) = 'COMPONENT_OF' AND endNode(rel) = t THEN 'child'
-                ELSE 'bidirectional'
-            END,
-            fundamental: related.fundamental_analysis,
-            medium: related.medium_analysis,
-            current: related.current_analysis,
-            drivers: related.drivers
-        }) as related_topics
-        
-        RETURN 
-            t.name as topic_name,
-            t.id as topic_id,
-            articles,
-            related_topics,
+        # Related topics for synthesis (all 5 canonical relationship types)
+        related_topics = [
             {
-                fundamental: t.fundamental_analysis,
-                medium: t.medium_analysis,
-                current: t.current_analysis,
-                drivers: t.drivers,
-                executive_summary: t.executive_summary,
-                risk_analysis: t.risk_analysis,
-                opportunity_analysis: t.opportunity_analysis,
-                trend_analysis: t.trend_analysis,
-                catalyst_analysis: t.catalyst_analysis
-            } as existing_analysis
-        """
-        params = {"topic_id": topic_id}
-    
-    # Execute query
-    result = run_cypher(articles_query, params)
+                "id": rel["id"],
+                "name": rel.get("name"),
+                "relationship_type": rel_type,
+                "direction": direction,
+                "fundamental": rel.get("fundamental_analysis"),
+                "medium": rel.get("medium_analysis"),
+                "current": rel.get("current_analysis"),
+                "drivers": rel.get("drivers")
+            }
+            for rel, rel_type, direction in edges
+        ]
     
-    if not result:
+    if not snapshot.topic:
         return {
             "topic_name": topic_id,
             "topic_id": topic_id,
@@ -294,16 +169,10 @@ def explore_graph(topic_id: str, section: str) -> Dict:
             "related_topics": []
         }
     
-    data = result[0]
-    
-    # Filter out None articles
-    articles = [a for a in data.get("articles", []) if a and a.get("id")]
-    related_topics = [r for r in data.get("related_topics", []) if r and r.get("id")]
-    
     return {
-        "topic_name": data.get("topic_name", topic_id),
-        "topic_id": data.get("topic_id", topic_id),
+        "topic_name": snapshot.name,
+        "topic_id": topic_id,
         "articles": articles,
-        "existing_analysis": data.get("existing_analysis", {}),
+        "existing_analysis": {key: snapshot.field(field) for key, field in EXISTING_ANALYSIS_FIELDS.items()},
         "related_topics": related_topics
     }
@@ -13,13 +13,25 @@ ARCHITECTURE:
 """
 import os
 import socket
+import threading
 import requests
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Any
 
 # Backend API configuration
 BACKEND_URL = os.getenv("BACKEND_API_URL", "http://localhost:8000")
 BACKEND_API_KEY = os.getenv("BACKEND_API_KEY", "")
 
+# Bulk article fetch: ids per bulk request, and parallel single GETs when
+# the backend has no bulk endpoint
+ARTICLE_BULK_SIZE = int(os.getenv("BACKEND_ARTICLE_BULK_SIZE", "100"))
+ARTICLE_FETCH_CONCURRENCY = int(os.getenv("BACKEND_ARTICLE_FETCH_CONCURRENCY", "8"))
+
+# One pooled session for article reads (keep-alive instead of a TCP/TLS handshake per call)
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_bulk_supported: Optional[bool] = None  # learned on first get_articles call
+
 # Worker identification (set by entrypoints)
 _WORKER_ID: Optional[str] = None
 
@@ -75,10 +87,25 @@ def ingest_article(article_data: Dict[str, Any]) -> Dict[str, Any]:
         raise
 
 
+def _get_session() -> requests.Session:
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=4, pool_maxsize=max(10, ARTICLE_FETCH_CONCURRENCY)
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
 def get_article(article_id: str) -> Optional[Dict[str, Any]]:
     """Get article from Backend API"""
     try:
-        response = requests.get(
+        response = _get_session().get(
             f"{BACKEND_URL}/api/articles/{article_id}",
             headers=_get_headers(),
             timeout=10
@@ -96,6 +123,58 @@ def get_article(article_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _get_articles_bulk(article_ids: List[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """POST /api/articles/batch. None if the backend does not offer it (404/405)."""
+    response = _get_session().post(
+        f"{BACKEND_URL}/api/articles/batch",
+        json={"ids": article_ids},
+        headers=_get_headers(),
+        timeout=30
+    )
+    if response.status_code in (404, 405):
+        return None
+    response.raise_for_status()
+    body = response.json()
+    # Accept {"articles": {id: article}} or {"articles": [article, ...]}
+    articles = body.get("articles", body) if isinstance(body, dict) else body
+    if isinstance(articles, dict):
+        return {aid: a for aid, a in articles.items() if a}
+    return {a.get("argos_id") or a.get("id"): a for a in articles if a}
+
+
+def get_articles(article_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Get many articles from Backend API. Returns {article_id: article}; missing
+    ids are left out.
+
+    Uses the bulk endpoint when the backend has it, otherwise concurrent
+    single GETs over the pooled session.
+    """
+    global _bulk_supported
+    ids = list(dict.fromkeys(a for a in article_ids if a))
+    if not ids:
+        return {}
+
+    if _bulk_supported is not False:
+        try:
+            found: Dict[str, Dict[str, Any]] = {}
+            for start in range(0, len(ids), ARTICLE_BULK_SIZE):
+                chunk = _get_articles_bulk(ids[start:start + ARTICLE_BULK_SIZE])
+                if chunk is None:
+                    _bulk_supported = False
+                    break
+                _bulk_supported = True
+                found.update(chunk)
+            else:
+                return found
+        except Exception as e:
+            print(f"⚠️  Bulk article fetch failed, falling back to single fetches: {e}")
+
+    with ThreadPoolExecutor(max_workers=min(ARTICLE_FETCH_CONCURRENCY, len(ids))) as executor:
+        results = executor.map(get_article, ids)
+        return {aid: article for aid, article in zip(ids, results) if article}
+
+
 def search_articles_by_keywords(
     keywords: List[str],
     limit: int = 5,
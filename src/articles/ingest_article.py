@@ -1,3 +1,6 @@
+import os
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
 from typing import cast, Any
 
 from src.articles.load_article import load_article
@@ -10,9 +13,14 @@ from src.graph.neo4j_client import run_cypher
 from utils.app_logging import get_logger
 from src.graph.ops.link import find_influences_and_correlates
 from src.graph.ops.topic import add_topic
+from src.graph.ops.batch_writer import GraphWriteBatch
+from src.llm.models import ArticleTopicClassification
 
 logger = get_logger(__name__)
 
+# Max concurrent per-topic classifications for one article (1 = sequential)
+CLASSIFY_MAX_WORKERS = int(os.getenv("ARTICLE_CLASSIFY_MAX_WORKERS", "4"))
+
 
 def discover_topic_relationships(topic_id: str, argos_id: str) -> None:
     """
@@ -103,22 +111,117 @@ def enrich_starving_topic_if_needed(topic_id: str) -> None:
         track("starving_topic_enrichment_failed", f"Topic {topic_id}: {e}")
 
 
+def classify_article_for_topics(
+    argos_id: str, article_summary: str, topic_ids: list[str]
+) -> dict[str, ArticleTopicClassification | Exception]:
+    """
+    Classify one article for several topics with bounded concurrency.
+
+    Each topic needs its own context lookup + SIMPLE-tier LLM call; these are
+    independent, so they fan out over a thread pool of CLASSIFY_MAX_WORKERS
+    (in-flight LLM calls are further capped per tier by the router).
+
+    Returns:
+        {topic_id: classification or the exception it raised}, for every topic_id
+    """
+    from src.graph.ops.topic import get_topic_context
+    from src.llm.classify_article_for_topic import classify_article_for_topic
+
+    def classify_one(topic_id: str) -> ArticleTopicClassification:
+        logger.info(f"Classifying article {argos_id} for topic {topic_id}...")
+        # Get topic context for better classification
+        topic_context = get_topic_context(topic_id)
+        # Classify article for this specific topic
+        return classify_article_for_topic(
+            article_summary=article_summary,
+            topic_id=topic_id,
+            topic_name=topic_context["name"],
+            topic_analysis_snippet=topic_context["analysis_snippet"]
+        )
+
+    results: dict[str, ArticleTopicClassification | Exception] = {}
+    if not topic_ids:
+        return results
+
+    workers = max(1, min(CLASSIFY_MAX_WORKERS, len(topic_ids)))
+    if workers == 1:
+        for topic_id in topic_ids:
+            try:
+                results[topic_id] = classify_one(topic_id)
+            except Exception as e:
+                results[topic_id] = e
+        return results
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="classify") as pool:
+        futures = {topic_id: pool.submit(classify_one, topic_id) for topic_id in topic_ids}
+        for topic_id, future in futures.items():
+            try:
+                results[topic_id] = future.result()
+            except Exception as e:
+                results[topic_id] = e
+    return results
+
+
+def _run_agent_analysis(topic_id: str, argos_id: str, tier: int) -> None:
+    """Rewrite a topic's analysis with the agent pipeline after a Tier 2+/3 link."""
+    from src.analysis_agents.orchestrator import analysis_rewriter_with_agents
+    logger.info(f"🤖 Triggering agent analysis for {topic_id} (Tier {tier} article: {argos_id})")
+    analysis_rewriter_with_agents(topic_id)
+    track("agent_analysis_completed", f"Topic {topic_id}: All sections written")
+    logger.info(f"✅ Agent analysis complete for {topic_id}")
+
+
+def _enrich_new_topic(topic_id: str) -> None:
+    """Enrich a freshly created topic from Perigon + cold storage (get more articles quickly)."""
+    from worker.workflows.topic_enrichment import backfill_topic_from_storage
+    logger.info(f"🔄 Enriching new topic {topic_id} from Perigon + cold storage...")
+    enrichment_added = backfill_topic_from_storage(topic_id=topic_id, test=False)
+    logger.info(f"✅ Enrichment complete for new topic {topic_id}: {enrichment_added} articles added")
+    track("new_topic_enriched", f"Topic {topic_id}: {enrichment_added} articles added")
+
+
+def _run_or_defer(
+    batch: GraphWriteBatch | None, key: Hashable, callback: Callable[[], Any]
+) -> None:
+    """Run a post-link follow-up now, or after the batch is written when batching."""
+    if batch is None:
+        callback()
+    else:
+        batch.defer(callback, key=key)
+
+
 def add_article(
-    article_id: str, test: bool = False, intended_topic_id: str | None = None
+    article_id: str | dict[str, Any],
+    test: bool = False,
+    intended_topic_id: str | None = None,
+    batch: GraphWriteBatch | None = None,
+    topics: list[NodeRow] | None = None,
 ) -> dict[str, str]:
     """
     Minimal, stateless pipeline for adding an Article and ABOUT edge.
     Loads article from cold storage, formats text, runs node identification, deduplication, LLM-driven field extraction, creates node and ABOUT edge.
     Fails fast and logs all actions.
+
+    Args:
+        article_id: Article ID, or an already-loaded article payload (skips the backend fetch)
+        batch: Optional GraphWriteBatch; node/edge writes are queued and follow-ups
+            (relationship discovery, enrichment, analysis) run after the batch is written
+        topics: Optional pre-fetched topic rows (shared across a batch of articles)
     """
+    if isinstance(article_id, dict):
+        article = article_id
+        article_id = str(article.get("argos_id") or article.get("id"))
+    else:
+        article = None
 
     logger.info(f"Starting article processing for {article_id}")
     
     # Track article processing attempt
     track("article_processed")
 
-    # 1. Load article from cold storage
-    article = load_article(article_id)
+    # 1. Load article from cold storage (unless the caller handed us the payload)
+    if article is None:
+        article = load_article(article_id)
     if not article or not isinstance(article, dict):
         logger.error(f"Article not found or invalid: {article_id}")
         raise ValueError(f"Article not found or invalid: {article_id}")
@@ -131,21 +234,25 @@ def add_article(
     # logger.info(f"Formatted article text for LLM input. Length: {len(formatted_article_text)}")
 
     # 3. Multi-topic identification (find ALL topics this article is ABOUT)
-    topic_list = get_all_topics()
+    if topics is None:
+        topics = [NodeRow(id=topic["id"], name=topic["name"]) for topic in get_all_topics()]
+    l = topics
 
-    l = []
-    for topic in topic_list:
-        n = NodeRow(id=topic["id"], name=topic["name"])
-        l.append(n)
+    # Embedding prefilter: the LLM only sees the top-K most similar topics
+    from src.vector.topic_index import shortlist_topic_ids
+    shortlisted = set(shortlist_topic_ids(formatted_article_text, [node.id for node in l]))
+    candidates = [node for node in l if node.id in shortlisted]
+    if len(candidates) < len(l):
+        logger.info(f"Topic prefilter: {len(candidates)}/{len(l)} candidate topics")
 
     # 1. Get results from LLM
-    topic_mapping = find_topic_mapping(formatted_article_text, l)
+    topic_mapping = find_topic_mapping(formatted_article_text, candidates)
     motivation = topic_mapping.motivation
     existing_article_ids = topic_mapping.existing or []
     new_topic_names = topic_mapping.new or []
 
     # 2. Validate that LLM only returned IDs that actually exist (prevent hallucinations)
-    valid_topic_ids = {node.id for node in l}
+    valid_topic_ids = {node.id for node in candidates}
     hallucinated_ids = [tid for tid in existing_article_ids if tid not in valid_topic_ids]
     
     if hallucinated_ids:
@@ -185,13 +292,23 @@ def add_article(
     argos_id = cast(str, article.get("argos_id"))
 
     # Check if Article already exists
-    article_exists_query = (
-        "OPTIONAL MATCH (a:Article {id: $id}) RETURN a IS NOT NULL AS exists"
-    )
-    exists_result = run_cypher(article_exists_query, {"id": argos_id})
-    article_already_exists = (
-        bool(exists_result[0].get("exists")) if exists_result else False
-    )
+    if batch is not None:
+        article_already_exists = batch.article_exists(argos_id)
+    else:
+        article_exists_query = (
+            "OPTIONAL MATCH (a:Article {id: $id}) RETURN a IS NOT NULL AS exists"
+        )
+        exists_result = run_cypher(article_exists_query, {"id": argos_id})
+        article_already_exists = (
+            bool(exists_result[0].get("exists")) if exists_result else False
+        )
+
+    # Article metadata for capacity decisions (saves a lookup per topic)
+    article_meta = {
+        "summary": article.get("argos_summary") or article.get("summary"),
+        "source": article.get("url"),
+        "published_at": article.get("pubDate"),
+    }
 
     # 4. Article node creation (SIMPLIFIED - no classification on node)
     # Classification now happens per-topic on the ABOUT relationship
@@ -210,19 +327,23 @@ def add_article(
             }
 
         # 3. Insert Article node in Neo4j (SIMPLIFIED - just article data)
-        create_query = """
-        CREATE (a:Article {
-            id: $id,
-            title: $title,
-            summary: $summary,
-            source: $source,
-            published_at: $published_at,
-            created_at: datetime()
-        })
-        RETURN a
-        """
-        run_cypher(create_query, a)
-        logger.info(f"Created Article node for article id={argos_id}")
+        if batch is not None:
+            batch.add_article(a)
+            logger.info(f"Queued Article node for article id={argos_id}")
+        else:
+            create_query = """
+            CREATE (a:Article {
+                id: $id,
+                title: $title,
+                summary: $summary,
+                source: $source,
+                published_at: $published_at,
+                created_at: datetime()
+            })
+            RETURN a
+            """
+            run_cypher(create_query, a)
+            logger.info(f"Created Article node for article id={argos_id}")
     else:
         logger.info(f"Article node {argos_id} already exists; skipping creation.")
 
@@ -258,7 +379,9 @@ def add_article(
                 importance_catalyst=classification.importance_catalyst,
                 motivation=classification.motivation,
                 implications=classification.implications,
-                test=test
+                test=test,
+                article_data=article_meta,
+                batch=batch,
             )
             
             # Handle rejection
@@ -270,7 +393,11 @@ def add_article(
                 f"Created ABOUT link: {argos_id} -> {intended_topic_id} (intended topic)"
             )
             # Trigger next steps for the intended topic link
-            discover_topic_relationships(intended_topic_id, argos_id)
+            _run_or_defer(
+                batch,
+                ("discover", intended_topic_id),
+                lambda tid=intended_topic_id: discover_topic_relationships(tid, argos_id),
+            )
             if not article_already_exists:
                 track("article_added")
             track("about_link_created")
@@ -278,7 +405,8 @@ def add_article(
     # 8. Multi-topic processing: loop over all relevant topics
     successful_topics = 0
 
-    # Process existing nodes
+    # Process existing nodes: dedup first, so we only classify topics that still need a link
+    topics_to_link: list[str] = []
     for i, existing_id in enumerate(existing_article_ids):
         logger.info(
             f"Processing existing topic {i+1}/{len(existing_article_ids)}: {existing_id}"
@@ -286,45 +414,42 @@ def add_article(
         topic_id = existing_id
 
         # Check if ABOUT edge already exists for this topic
-        edge_exists_query = """
-        OPTIONAL MATCH (a:Article {id: $id})
-        WITH a
-        OPTIONAL MATCH (a)-[:ABOUT]->(t:Topic {id: $topic_id})
-        RETURN a IS NOT NULL AS article_exists, t IS NOT NULL AS about_exists
-        """
-        dedup_result = run_cypher(
-            edge_exists_query, {"id": argos_id, "topic_id": topic_id}
-        )
+        if batch is not None:
+            about_exists = batch.is_linked(argos_id, topic_id)
+        else:
+            edge_exists_query = """
+            OPTIONAL MATCH (a:Article {id: $id})
+            WITH a
+            OPTIONAL MATCH (a)-[:ABOUT]->(t:Topic {id: $topic_id})
+            RETURN a IS NOT NULL AS article_exists, t IS NOT NULL AS about_exists
+            """
+            dedup_result = run_cypher(
+                edge_exists_query, {"id": argos_id, "topic_id": topic_id}
+            )
+            about_exists = bool(dedup_result and dedup_result[0].get("about_exists"))
 
-        if dedup_result:
-            row = dedup_result[0]
-            about_exists = bool(row.get("about_exists"))
+        if about_exists:
+            logger.info(
+                f"Article {argos_id} already linked to topic {topic_id}. Skipping duplicate."
+            )
+            track("article_duplicate_skipped")
+            continue
+        topics_to_link.append(topic_id)
 
-            if about_exists:
-                logger.info(
-                    f"Article {argos_id} already linked to topic {topic_id}. Skipping duplicate."
-                )
-                track("article_duplicate_skipped")
-                continue
+    # NEW: Classify article FOR EACH SPECIFIC TOPIC (independent LLM calls, run concurrently)
+    from src.graph.ops.link import create_about_link_with_classification
+
+    classifications = classify_article_for_topics(
+        argos_id, article.get("argos_summary") or article.get("summary"), topics_to_link
+    )
+
+    # Apply graph writes in the mapper's topic order (deterministic capacity decisions)
+    for topic_id in topics_to_link:
+        outcome = classifications[topic_id]
+        if isinstance(outcome, Exception):
+            raise outcome
+        classification = outcome
 
-        # NEW: Classify article FOR THIS SPECIFIC TOPIC
-        from src.graph.ops.topic import get_topic_context
-        from src.llm.classify_article_for_topic import classify_article_for_topic
-        from src.graph.ops.link import create_about_link_with_classification
-        
-        logger.info(f"Classifying article {argos_id} for topic {topic_id}...")
-        
-        # Get topic context for better classification
-        topic_context = get_topic_context(topic_id)
-        
-        # Classify article for this specific topic
-        classification = classify_article_for_topic(
-            article_summary=article.get("argos_summary") or article.get("summary"),
-            topic_id=topic_id,
-            topic_name=topic_context["name"],
-            topic_analysis_snippet=topic_context["analysis_snippet"]
-        )
-        
         # Create ABOUT link with capacity management
         capacity_result = create_about_link_with_classification(
             article_id=argos_id,
@@ -336,7 +461,9 @@ def add_article(
             importance_catalyst=classification.importance_catalyst,
             motivation=classification.motivation,
             implications=classification.implications,
-            test=test
+            test=test,
+            article_data=article_meta,
+            batch=batch,
         )
         
         # Handle rejection
@@ -354,18 +481,22 @@ def add_article(
         track(f"article_classified_priority_{classification.overall_importance}")
 
         # Trigger next steps, relationship discovery and replacement analysis
-        discover_topic_relationships(topic_id, argos_id)
+        _run_or_defer(
+            batch,
+            ("discover", topic_id),
+            lambda tid=topic_id: discover_topic_relationships(tid, argos_id),
+        )
 
         # Trigger agent-based analysis for Tier 2+ articles (standard+ importance)
         # Changed from Tier 3 only to Tier 2+ for more frequent analysis updates
         # WORKER_MODE check: only write if allowed
         if not test and classification.overall_importance >= 2 and can_write():
-            from src.analysis_agents.orchestrator import analysis_rewriter_with_agents
             track("analysis.triggered.new_articles", f"Topic {topic_id}: Tier {classification.overall_importance} article {argos_id}")
-            logger.info(f"🤖 Triggering agent analysis for {topic_id} (Tier {classification.overall_importance} article: {argos_id})")
-            analysis_rewriter_with_agents(topic_id)
-            track("agent_analysis_completed", f"Topic {topic_id}: All sections written")
-            logger.info(f"✅ Agent analysis complete for {topic_id}")
+            _run_or_defer(
+                batch,
+                ("analysis", topic_id),
+                lambda tid=topic_id, tier=classification.overall_importance: _run_agent_analysis(tid, argos_id, tier),
+            )
         elif not test and classification.overall_importance >= 2 and not can_write():
             track("agent_analysis_deferred", f"Topic {topic_id}: Tier {classification.overall_importance} - WORKER_MODE=ingest")
             logger.info(f"⏭️  Deferring analysis for {topic_id} (WORKER_MODE=ingest, write server will handle)")
@@ -390,6 +521,10 @@ def add_article(
                 logger.warning(f"Failed to create new topic for article {article_id}")
                 track("article_rejected_no_topics", f"Failed to create topic for article {article.get('argos_id')}")
             else:
+                # Make the new topic visible to later articles sharing this topic list
+                if all(node.id != topic_id for node in l):
+                    l.append(NodeRow(id=topic_id, name=new_topic_result.get("name") or topic_id))
+
                 # NEW: Classify article FOR THIS NEW TOPIC
                 from src.graph.ops.topic import get_topic_context
                 from src.llm.classify_article_for_topic import classify_article_for_topic
@@ -419,7 +554,9 @@ def add_article(
                     importance_catalyst=classification.importance_catalyst,
                     motivation=classification.motivation,
                     implications=classification.implications,
-                    test=test
+                    test=test,
+                    article_data=article_meta,
+                    batch=batch,
                 )
                 
                 # Handle rejection
@@ -437,25 +574,29 @@ def add_article(
                     track(f"article_classified_priority_{classification.overall_importance}")
 
                     # Trigger next steps, relationship discovery and replacement analysis
-                    discover_topic_relationships(topic_id, argos_id)
+                    _run_or_defer(
+                        batch,
+                        ("discover", topic_id),
+                        lambda tid=topic_id: discover_topic_relationships(tid, argos_id),
+                    )
 
                     # Enrich new topic from Perigon + cold storage (get more articles quickly)
                     if not test:
-                        from worker.workflows.topic_enrichment import backfill_topic_from_storage
-                        logger.info(f"🔄 Enriching new topic {topic_id} from Perigon + cold storage...")
-                        enrichment_added = backfill_topic_from_storage(topic_id=topic_id, test=False)
-                        logger.info(f"✅ Enrichment complete for new topic {topic_id}: {enrichment_added} articles added")
-                        track("new_topic_enriched", f"Topic {topic_id}: {enrichment_added} articles added")
+                        _run_or_defer(
+                            batch,
+                            ("enrich", topic_id),
+                            lambda tid=topic_id: _enrich_new_topic(tid),
+                        )
 
                     # Trigger agent-based analysis for Tier 3 articles only (premium importance)
                     # WORKER_MODE check: only write if allowed
                     if not test and classification.overall_importance >= 3 and can_write():
-                        from src.analysis_agents.orchestrator import analysis_rewriter_with_agents
                         track("analysis.triggered.new_articles", f"Topic {topic_id}: Tier {classification.overall_importance} article {argos_id}")
-                        logger.info(f"🤖 Triggering agent analysis for {topic_id} (Tier {classification.overall_importance} article: {argos_id})")
-                        analysis_rewriter_with_agents(topic_id)
-                        track("agent_analysis_completed", f"Topic {topic_id}: All sections written")
-                        logger.info(f"✅ Agent analysis complete for {topic_id}")
+                        _run_or_defer(
+                            batch,
+                            ("analysis", topic_id),
+                            lambda tid=topic_id, tier=classification.overall_importance: _run_agent_analysis(tid, argos_id, tier),
+                        )
                     elif not test and classification.overall_importance >= 3 and not can_write():
                         track("agent_analysis_deferred", f"Topic {topic_id}: Tier {classification.overall_importance} - WORKER_MODE=ingest")
                         logger.info(f"⏭️  Deferring analysis for {topic_id} (WORKER_MODE=ingest, write server will handle)")
@@ -486,3 +627,70 @@ def add_article(
         "status": "success" if successful_topics > 0 else "failed",
         "topics_processed": successful_topics,
     }
+
+
+def add_articles(
+    articles: list[str | dict[str, Any]],
+    test: bool = False,
+    batch: GraphWriteBatch | None = None,
+    topics: list[NodeRow] | None = None,
+) -> list[dict[str, str]]:
+    """
+    Bulk entry point: run add_article for many articles with batched graph writes.
+
+    The topic list and article/ABOUT dedup state are fetched once for the whole
+    batch, Article nodes and ABOUT edges are written with UNWIND transactions,
+    and follow-ups (relationship discovery, enrichment, analysis) run once per
+    topic after everything is written.
+
+    Args:
+        articles: Article IDs or already-loaded article payloads (with argos_id)
+        test: Passed through to add_article
+        batch: Optional caller-owned GraphWriteBatch to add to (the ingestion
+            pipeline shares one across its graph workers and flushes it on exit);
+            by default a batch is opened and flushed for this call
+        topics: Optional pre-fetched topic rows shared with other calls on the batch
+
+    Returns:
+        One result dict per input article (failures reported, not raised)
+    """
+    if not articles:
+        return []
+
+    if topics is None:
+        topics = [NodeRow(id=t["id"], name=t["name"]) for t in get_all_topics()]
+    ids = [
+        str(a.get("argos_id")) if isinstance(a, dict) else a
+        for a in articles
+    ]
+
+    if batch is None:
+        with GraphWriteBatch() as own_batch:
+            results = _add_to_batch(articles, ids, test, own_batch, topics)
+        logger.info(
+            f"Bulk add complete: {len(articles)} articles | graph writes: {own_batch.stats}"
+        )
+        return results
+    return _add_to_batch(articles, ids, test, batch, topics)
+
+
+def _add_to_batch(
+    articles: list[str | dict[str, Any]],
+    ids: list[str],
+    test: bool,
+    batch: GraphWriteBatch,
+    topics: list[NodeRow],
+) -> list[dict[str, str]]:
+    results: list[dict[str, str]] = []
+    batch.preload_articles(ids)
+    for article, article_id in zip(articles, ids):
+        try:
+            results.append(add_article(article, test=test, batch=batch, topics=topics))
+        except Exception as e:
+            title = article.get("title", "N/A")[:100] if isinstance(article, dict) else "N/A"
+            logger.error(
+                f"Failed to add article {article_id} | error={type(e).__name__}: {e} | title={title}",
+                exc_info=True,
+            )
+            results.append({"article_id": article_id, "status": "failed", "reason": str(e)})
+    return results
@@ -1,13 +1,119 @@
 """
-Loads an article from Backend API by its unique ID.
+Loads articles from Backend API by their unique ID.
+
+Material builders read the same articles over and over (every section of a
+topic, every topic an article is linked to), so loaded articles are kept in
+a bounded LRU with a TTL, optionally backed by one JSON file per article
+under ARTICLE_CACHE_DIR so the cache survives restarts. load_articles()
+fetches everything missing from the cache in one bulk backend call.
 """
 
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, cast
+
 from utils.app_logging import get_logger
-from typing import Dict, Any, cast
 from src.api.backend_client import get_article as get_article_from_api
+from src.api.backend_client import get_articles as get_articles_from_api
 
 logger = get_logger(__name__)
 
+# ============================================================================
+# ARTICLE CACHE
+# ============================================================================
+# Articles barely change once stored; the TTL bounds how stale a re-summarized one can get
+ARTICLE_CACHE_TTL_S = float(os.getenv("ARTICLE_CACHE_TTL_S", "3600"))
+ARTICLE_CACHE_SIZE = int(os.getenv("ARTICLE_CACHE_SIZE", "5000"))
+# Optional on-disk layer (unset = memory only)
+ARTICLE_CACHE_DIR = os.getenv("ARTICLE_CACHE_DIR", "")
+
+_cache_lock = threading.Lock()
+_article_cache: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+_cache_stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+
+def _unwrap(article: Dict[str, Any]) -> Dict[str, Any]:
+    # Safety net: unwrap if nested (backend should already return flat)
+    while isinstance(article.get("data"), dict):
+        article = article["data"]
+    return article
+
+
+def _disk_path(article_id: str) -> Optional[Path]:
+    if not ARTICLE_CACHE_DIR:
+        return None
+    safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in article_id)
+    return Path(ARTICLE_CACHE_DIR) / f"{safe_id}.json"
+
+
+def _cache_get(article_id: str) -> Optional[Dict[str, Any]]:
+    # Returns a copy: callers may mutate the article without touching the cached entry
+    with _cache_lock:
+        entry = _article_cache.get(article_id)
+        if entry is not None and time.time() - entry[0] < ARTICLE_CACHE_TTL_S:
+            _article_cache.move_to_end(article_id)
+            _cache_stats["hits"] += 1
+            return dict(entry[1])
+        if entry is not None:
+            del _article_cache[article_id]
+
+    path = _disk_path(article_id)
+    if path is not None:
+        try:
+            if time.time() - path.stat().st_mtime < ARTICLE_CACHE_TTL_S:
+                article = json.loads(path.read_text())
+                _cache_put(article_id, article, write_disk=False, stored_at=path.stat().st_mtime)
+                with _cache_lock:
+                    _cache_stats["disk_hits"] += 1
+                return article
+        except (OSError, ValueError):
+            pass
+
+    with _cache_lock:
+        _cache_stats["misses"] += 1
+    return None
+
+
+def _cache_put(
+    article_id: str,
+    article: Dict[str, Any],
+    write_disk: bool = True,
+    stored_at: Optional[float] = None,
+) -> None:
+    with _cache_lock:
+        # Stores a copy, so later changes to the caller's dict don't leak into the cache
+        _article_cache[article_id] = (stored_at or time.time(), dict(article))
+        _article_cache.move_to_end(article_id)
+        while len(_article_cache) > ARTICLE_CACHE_SIZE:
+            _article_cache.popitem(last=False)
+
+    path = _disk_path(article_id) if write_disk else None
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(article, default=str))
+            tmp.replace(path)
+        except OSError as e:
+            logger.debug("Article cache write failed for %s: %s", article_id, e)
+
+
+def get_article_cache_stats() -> Dict[str, Any]:
+    with _cache_lock:
+        lookups = _cache_stats["hits"] + _cache_stats["disk_hits"] + _cache_stats["misses"]
+        hit_rate = (_cache_stats["hits"] + _cache_stats["disk_hits"]) / lookups if lookups else 0.0
+        return {**_cache_stats, "size": len(_article_cache), "hit_rate": round(hit_rate, 3)}
+
+
+def clear_article_cache() -> None:
+    """Drop the in-memory layer (the disk layer ages out via the TTL)."""
+    with _cache_lock:
+        _article_cache.clear()
+
 
 def load_article(article_id: str, max_days: int = 90) -> Dict[str, str] | None:
     """
@@ -21,13 +127,52 @@ def load_article(article_id: str, max_days: int = 90) -> Dict[str, str] | None:
     Raises:
         FileNotFoundError: If the article cannot be found
     """
+    cached = _cache_get(article_id)
+    if cached is not None:
+        return cast(Dict[str, str], cached)
+
     article = get_article_from_api(article_id)
     if article:
         logger.debug("Loaded article %s from Backend API", article_id)
-        # Safety net: unwrap if nested (backend should already return flat)
-        while isinstance(article.get("data"), dict):
-            article = article["data"]
+        article = _unwrap(article)
+        _cache_put(article_id, article)
         return cast(Dict[str, str], article)
-    
+
     logger.error("Article %s not found in Backend API", article_id)
     raise FileNotFoundError(f"Article {article_id} not found")
+
+
+def load_articles(article_ids: Iterable[str]) -> Dict[str, Dict[str, str]]:
+    """
+    Loads many articles at once: cache first, then one bulk Backend API fetch
+    for the rest.
+
+    Returns:
+        {article_id: article} for the articles found; missing ids are left out
+        (callers handle them like load_article's FileNotFoundError).
+    """
+    ids = list(dict.fromkeys(a for a in article_ids if a))
+    found: Dict[str, Dict[str, str]] = {}
+    missing = []
+    for article_id in ids:
+        cached = _cache_get(article_id)
+        if cached is not None:
+            found[article_id] = cast(Dict[str, str], cached)
+        else:
+            missing.append(article_id)
+
+    if missing:
+        fetched = get_articles_from_api(missing)
+        for article_id in missing:
+            article = fetched.get(article_id)
+            if not article:
+                logger.warning("Article %s not found in Backend API", article_id)
+                continue
+            article = _unwrap(article)
+            _cache_put(article_id, article)
+            found[article_id] = cast(Dict[str, str], article)
+        logger.debug(
+            "Loaded %d articles (%d cached, %d fetched)",
+            len(found), len(ids) - len(missing), len(found) - (len(ids) - len(missing)),
+        )
+    return found
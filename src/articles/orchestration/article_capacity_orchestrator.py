@@ -136,7 +136,8 @@ def make_room_for_article(
                     r.importance_risk = 0,
                     r.importance_opportunity = 0,
                     r.importance_trend = 0,
-                    r.importance_catalyst = 0
+                    r.importance_catalyst = 0,
+                    a.vector_changed_at = datetime()
                 """
                 run_cypher(archive_query, {
                     "article_id": decision.target_article_id,
@@ -232,7 +233,8 @@ def make_room_for_article(
                     r.importance_trend = CASE WHEN r.importance_trend > $new_importance THEN $new_importance ELSE r.importance_trend END,
                     r.importance_catalyst = CASE WHEN r.importance_catalyst > $new_importance THEN $new_importance ELSE r.importance_catalyst END,
                     r.downgraded_at = datetime(),
-                    r.downgrade_reason = $reason
+                    r.downgrade_reason = $reason,
+                    a.vector_changed_at = datetime()
                 """
                 run_cypher(downgrade_query, {
                     "article_id": decision.target_article_id,
@@ -37,7 +37,8 @@ MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
 
 # Scraping Settings
-MAX_CONCURRENT_REQUESTS = 5
+MAX_CONCURRENT_REQUESTS = 5  # Concurrent source fetches across all domains
+MAX_CONCURRENT_PER_DOMAIN = 2  # Concurrent source fetches against one domain
 MAX_SOURCE_LINKS_TO_SCRAPE = 10  # Maximum number of links to scrape per article
 
 # Storage Settings
@@ -27,8 +27,8 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 import time
-from datetime import datetime
-from typing import Dict, List, Any
+import threading
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 
 # Import local modules
@@ -36,10 +36,11 @@ from src.clients.perigon.query_eurusd import get_query as query1
 from src.clients.perigon.query_ai_data import get_query as query2
 from src.clients.perigon.news_api_client import NewsApiClient
 from src.clients.perigon.source_scraper import (
-    scrape_article_and_sources_sync,
+    scrape_articles_and_sources_sync,
     is_article_good,
 )
 from src.clients.perigon.text_summarizer import summarize_article
+from src.clients.perigon.pipeline import Stage, run_stages
 from src.api.backend_client import ingest_article
 
 # Set up logger for this module
@@ -47,6 +48,16 @@ from utils import app_logging
 
 logger = app_logging.get_logger("news_ingestion_orchestrator")
 
+# Worker threads per pipeline stage (summarize → store → graph)
+SUMMARIZE_WORKERS = int(os.getenv("INGEST_SUMMARIZE_WORKERS", "4"))
+STORE_WORKERS = int(os.getenv("INGEST_STORE_WORKERS", "2"))
+# add_article already fans out per-topic classification; one graph worker keeps
+# capacity checks and batched writes in article order
+GRAPH_WORKERS = int(os.getenv("INGEST_GRAPH_WORKERS", "1"))
+
+# (input index, payload) travelling between stages
+_Item = Tuple[int, Dict[str, Any]]
+
 
 def set_third_party_log_levels(debug: bool) -> None:
     """
@@ -96,7 +107,8 @@ class NewsIngestionOrchestrator:
         self.scrape_enabled = bool(scrape_enabled)
         logger.debug("Scrape enabled: %s", self.scrape_enabled)
 
-        # Initialize statistics
+        # Initialize statistics (updated from pipeline worker threads)
+        self._stats_lock = threading.Lock()
         self.stats = {
             "queries_executed": 0,
             "articles_retrieved": 0,
@@ -138,7 +150,7 @@ class NewsIngestionOrchestrator:
             )
             
             # Track query execution (done in news_api_client)
-            self.stats["queries_executed"] += 1
+            self._count("queries_executed")
 
             if not raw_results or "articles" not in raw_results:
                 logger.warning("⚠️ No articles found or invalid API response")
@@ -149,34 +161,19 @@ class NewsIngestionOrchestrator:
                 f"Retrieved {len(articles)} articles from API for topic {topic}"
             )
             # Query already tracked in news_api_client
-            self.stats["articles_retrieved"] += len(articles)
+            self._count("articles_retrieved", len(articles))
             # If the query returned zero results, nothing more to process
             if len(articles) == 0:
                 logger.warning(f"Zero results for topic {topic}")
                 return []
 
-            # Process articles
-            processed_articles = self._process_articles(articles)
-
-            # If not testing, trigger add_article for each processed article
+            # Process articles: summarize → store → graph as a pipeline, so each
+            # stored payload goes straight to the graph stage (no reload from backend)
             if not test:
-                from src.articles.ingest_article import add_article
-
-                for article in processed_articles:
-                    article_id = article["argos_id"]
-                    try:
-                        add_article(article_id=article_id, test=False)
-                    except Exception as e:
-                        # Log full error details including traceback
-                        import traceback
-                        logger.error(
-                            f"Failed to add article {article_id} | "
-                            f"error={type(e).__name__}: {e} | "
-                            f"title={article.get('title', 'N/A')[:100]}"
-                        )
-                        logger.error(f"Traceback:\n{traceback.format_exc()}")
+                processed_articles = self._process_and_add_to_graph(articles)
             else:
                 logger.info("❌❌❌ Test mode enabled, skipping add_article")
+                processed_articles = self._process_articles(articles)
 
             duration = time.time() - start_time
             logger.info(
@@ -191,16 +188,19 @@ class NewsIngestionOrchestrator:
                     f"⚠️ Skipping query for topic {topic}: 414 Request-URI Too Large"
                 )
                 return []
-            self.stats["errors"] += 1
+            self._count("errors")
             logger.error(f"❌ Error executing query: {e}")
             raise RuntimeError(f"Failed to execute query: {e}")
 
     # --- helpers -------------------------------------------------------------
-    def _fast_store(self, article: Dict[str, Any], title: str, title_sample: str) -> Dict[str, Any] | None:
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _fast_summarize(self, article: Dict[str, Any], title: str, title_sample: str) -> Dict[str, Any] | None:
         """
-        Store API article, generating summary if API summary missing.
-        Uses backend /ingest endpoint for automatic deduplication.
-        Returns stored payload dict on success, None if failed.
+        Build the storage payload from API data, generating a summary if the API summary is missing.
+        Returns the payload, or None if no summary could be produced.
         """
         summary = article.get("summary")
         if not isinstance(summary, str) or not summary.strip():
@@ -212,7 +212,7 @@ class NewsIngestionOrchestrator:
                 generated_summary = summarize_article(article)
                 if generated_summary and generated_summary.strip():
                     summary = generated_summary.strip()
-                    self.stats["articles_summarized"] += 1
+                    self._count("articles_summarized")
                     logger.info(
                         "✅ Generated summary for '%s' | len=%d chars", title_sample, len(summary)
                     )
@@ -220,42 +220,20 @@ class NewsIngestionOrchestrator:
                     logger.warning(
                         "❌ Failed to generate summary for '%s'; skipping", title_sample
                     )
-                    self.stats["errors"] += 1
+                    self._count("errors")
                     return None
             except Exception as e:
                 logger.warning(
                     "❌ Summary generation failed for '%s': %s", title_sample, str(e)
                 )
-                self.stats["errors"] += 1
+                self._count("errors")
                 return None
         
         # Prepare payload with summary
         payload: Dict[str, Any] = dict(article)
         payload["argos_summary"] = summary.strip()
         payload.setdefault("argos_topic", title)
-        
-        # Send to backend for deduplication and storage
-        # Backend will generate ID if new, or return existing ID if duplicate
-        try:
-            result = ingest_article(payload)
-            argos_id = result["argos_id"]
-            status = result["status"]
-            
-            # Add ID to payload for return
-            payload["argos_id"] = argos_id
-            
-            if status == "existing":
-                logger.info(f"Duplicate detected: '{title_sample}' → {argos_id}")
-            else:
-                logger.info(f"New article stored: '{title_sample}' → {argos_id}")
-                self.stats["articles_stored"] += 1
-            
-            return payload
-            
-        except Exception as e:
-            logger.error(f"Failed to ingest article '{title_sample}': {e}")
-            self.stats["errors"] += 1
-            return None
+        return payload
 
     @app_logging.log_execution(logger)
     def run_complete_test(self) -> Dict[str, Any]:
@@ -284,164 +262,186 @@ class NewsIngestionOrchestrator:
 
     @app_logging.log_execution(logger)
     def _process_articles(
-        self, articles: List[Dict[str, Any]]
+        self, articles: List[Dict[str, Any]], graph_stage: Optional[Stage] = None
     ) -> List[Dict[str, Any]]:
         """
         Process a list of articles: scrape content, summarize, and store raw data.
 
+        Runs as a staged pipeline (see pipeline.run_stages): sources are scraped
+        for the whole batch first, then each article flows through
+        summarize → store [→ graph_stage] on its own, so one slow LLM summary
+        does not hold up the others.
+
         Args:
             articles: List of articles from the API
-            query_id: Unique ID for this query
+            graph_stage: Optional final stage receiving (index, stored payload)
 
         Returns:
-            List of processed articles
+            List of processed (stored) articles, in input order
         """
-        processed_articles = []
-
-        for i, article in enumerate(articles):
-            try:
-                logger.debug(
-                    "============================================================================"
-                )
-                logger.debug(f"ARTICLE: {article.get('title', 'Untitled')}")
-                logger.debug(
-                    f"⚙️ Processing article {i+1}/{len(articles)}: {article.get('title', 'Untitled')}"
-                )
-
-                # Note: Duplicate checking now handled by backend /ingest endpoint
-                # No need for local duplicate check anymore
-
-                # Prepare metadata
-                datetime.utcnow().isoformat()
-
-                # --- Extract and QA Perigon main text BEFORE scraping ---
-                perigon_description = article["description"]
-                logger.debug(
-                    f"PERIGON MAIN TEXT (description):\n{perigon_description}\n"
-                )
-                perigon_text = article["content"]
-                MAX_LOG_TEXT_LEN = 1200
-                if len(perigon_text) > MAX_LOG_TEXT_LEN:
-                    log_text = perigon_text[:MAX_LOG_TEXT_LEN] + "\n... [truncated]"
-                else:
-                    log_text = perigon_text
-
-                logger.debug(f"PERIGON MAIN TEXT (full):\n{log_text}\n")
-
-                # Skip initial QA check - scrape first, then QA on better content
-                title = article.get("title", "Untitled")
-                title_sample = (title[:77] + "...") if len(title) > 80 else title
-
-                # No longer attach main article text under scraped_content; only use top-level 'content'.
-
-                if not self.scrape_enabled:
-                    # Fast path: skip scraping & summarization; use API data only
-                    stored = self._fast_store(article, title, title_sample)
-                    if stored is not None:
-                        processed_articles.append(stored)
-                    continue
-
-                # Scrape article content and sources (slow path)
-                logger.debug("🔍 Scraping article content and sources")
-                enriched_article = scrape_article_and_sources_sync(article)
-                self.stats["articles_scraped"] += 1
-                sources_list = enriched_article.get("scraped_sources", [])
-                logger.debug(f"Sources scraped: {len(sources_list)}")
-
-                # --- Quality Assurance: Check main article text (scraped) ---
-                # Use only the top-level 'content' for main article text after scraping
-                main_text = enriched_article.get("content", "")
-                num_sources = len(sources_list)
-                main_text_quality = is_article_good(main_text)
-                logger.debug(f"SCRAPED MAIN TEXT QA: {main_text_quality}")
-                logger.debug(f"Number of sources added: {num_sources}")
-                # Log the article quality
-                logger.debug(f"Article quality: {main_text_quality}")
-                if not main_text_quality:
-                    logger.warning(
-                        f"❌ Article: '{title_sample}' | QA: {main_text_quality} | Failed QA after scraping and will be skipped. Reason: low-quality or corrupted text."
-                    )
-                    self.stats["errors"] += 1
-                    continue
-                logger.debug(
-                    f"✅ Article: '{title_sample}' | QA: {main_text_quality} | Passed QA check after scraping."
-                )
-
-                # Generate summary from scraped content
-                logger.debug("summarizing...")
-                logger.debug("📝 Generating article summary")
-                summary = summarize_article(enriched_article)
-                logger.debug(
-                    "summary generation complete | type=%s | len=%s",
-                    type(summary),
-                    (len(summary) if isinstance(summary, str) else "NA"),
-                )
-                if not isinstance(summary, str) or not summary.strip():
-                    logger.warning(
-                        "❌ Summary missing or invalid type; skipping article '%s'",
-                        title_sample,
-                    )
-                    self.stats["errors"] += 1
-                    continue
-                self.stats["articles_summarized"] += 1
-                # Single per-article INFO line summarizing scraping result
-                logger.info(
-                    f"Article: '{title_sample}' scraped {num_sources} sources, summary generated!"
-                )
-
-                # Build strict dict payload for storage: merge enriched article + argos_summary
-                payload: Dict[str, Any] = dict(enriched_article)
-                payload["argos_summary"] = summary
-                # Minimal provenance
-                payload.setdefault("argos_topic", title)
-                # Debug the payload shape before storage
-                logger.debug(
-                    "storage payload | type=%s | keys_sample=%s",
-                    type(payload),
-                    list(payload.keys())[:12],
-                )
-
-                # Store the enriched and summarized article via backend
-                logger.debug("saving...")
-                try:
-                    result = ingest_article(payload)
-                    argos_id = result["argos_id"]
-                    status = result["status"]
-                    
-                    # Add ID to payload
-                    payload["argos_id"] = argos_id
-                    
-                    if status == "existing":
-                        logger.info(f"Duplicate detected: '{title_sample}' → {argos_id}")
-                    else:
-                        logger.debug(f"💾 Stored article: {argos_id}")
-                        self.stats["articles_stored"] += 1
-                    
-                    processed_articles.append(payload)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to ingest article '{title_sample}': {e}")
-                    self.stats["errors"] += 1
-
-                logger.debug(
-                    "============================================================================"
-                )
-
-            except Exception:
-                logger.exception(
-                    "❌ Error processing article %s ('%s')",
-                    i + 1,
-                    article.get("title", "Untitled"),
-                )
-                self.stats["errors"] += 1
-                # Continue processing other articles to avoid losing good data from batch failures
-                # Note: This trades fail-fast for data preservation - one bad article won't kill 9 good ones
-                logger.error(
-                    f"BATCH_PROCESSING_ERROR: Skipping failed article and continuing with remaining {len(articles) - i - 1} articles"
-                )
-                continue
+        # Scrape linked sources for the whole batch concurrently (one pooled client)
+        enriched_articles: List[Optional[Dict[str, Any]]] = [None] * len(articles)
+        if self.scrape_enabled and articles:
+            logger.debug(f"🔍 Scraping sources for {len(articles)} articles")
+            enriched_articles = scrape_articles_and_sources_sync(articles)
+            self._count("articles_scraped", len(articles))
+
+        stages = [
+            Stage("summarize", self._summarize_stage, workers=SUMMARIZE_WORKERS),
+            Stage("store", self._store_stage, workers=STORE_WORKERS),
+        ]
+        if graph_stage is not None:
+            stages.append(graph_stage)
+
+        items = [(i, (article, enriched_articles[i])) for i, article in enumerate(articles)]
+        results = run_stages(items, stages)
+        # Unexpected exceptions inside a stage are logged by run_stages; count them here
+        self._count("errors", sum(int(stage.stats["errors"]) for stage in stages))
+        return [payload for _, payload in sorted(results, key=lambda item: item[0])]
+
+    def _process_and_add_to_graph(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """_process_articles with a final graph stage: add_articles on each stored payload, writes batched."""
+        from src.articles.ingest_article import add_articles
+        from src.analysis.policies.topic_identifier import NodeRow
+        from src.graph.ops.batch_writer import GraphWriteBatch
+        from src.graph.ops.topic import get_all_topics
+
+        # Shared by all articles of this query; topics created along the way are appended
+        topics = [NodeRow(id=t["id"], name=t["name"]) for t in get_all_topics()]
+
+        with GraphWriteBatch() as batch:
+            def add_to_graph(item: _Item) -> _Item:
+                _, payload = item
+                # Streamed into the shared batch as each article is stored; failures are logged by add_articles
+                add_articles([payload], test=False, batch=batch, topics=topics)
+                return item  # Stored either way; graph failures are logged only
+
+            processed = self._process_articles(
+                articles, graph_stage=Stage("graph", add_to_graph, workers=GRAPH_WORKERS)
+            )
 
-        return processed_articles
+        logger.info(f"Graph stage complete: {len(processed)} articles | graph writes: {batch.stats}")
+        return processed
+
+    def _summarize_stage(self, item: Tuple[int, Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]) -> Optional[_Item]:
+        """QA + summary for one article. Returns (index, payload) or None to drop it."""
+        i, (article, enriched_article) = item
+        logger.debug(
+            "============================================================================"
+        )
+        logger.debug(f"ARTICLE: {article.get('title', 'Untitled')}")
+        logger.debug(f"⚙️ Processing article {i+1}: {article.get('title', 'Untitled')}")
+
+        # Note: Duplicate checking now handled by backend /ingest endpoint
+        # No need for local duplicate check anymore
+
+        # --- Extract and QA Perigon main text BEFORE scraping ---
+        perigon_description = article["description"]
+        logger.debug(
+            f"PERIGON MAIN TEXT (description):\n{perigon_description}\n"
+        )
+        perigon_text = article["content"]
+        MAX_LOG_TEXT_LEN = 1200
+        if len(perigon_text) > MAX_LOG_TEXT_LEN:
+            log_text = perigon_text[:MAX_LOG_TEXT_LEN] + "\n... [truncated]"
+        else:
+            log_text = perigon_text
+
+        logger.debug(f"PERIGON MAIN TEXT (full):\n{log_text}\n")
+
+        # Skip initial QA check - scrape first, then QA on better content
+        title = article.get("title", "Untitled")
+        title_sample = (title[:77] + "...") if len(title) > 80 else title
+
+        # No longer attach main article text under scraped_content; only use top-level 'content'.
+
+        if not self.scrape_enabled:
+            # Fast path: skip scraping & summarization; use API data only
+            payload = self._fast_summarize(article, title, title_sample)
+            return (i, payload) if payload is not None else None
+
+        # Slow path: article content and sources were scraped for the whole batch
+        sources_list = enriched_article.get("scraped_sources", [])
+        logger.debug(f"Sources scraped: {len(sources_list)}")
+
+        # --- Quality Assurance: Check main article text (scraped) ---
+        # Use only the top-level 'content' for main article text after scraping
+        main_text = enriched_article.get("content", "")
+        num_sources = len(sources_list)
+        main_text_quality = is_article_good(main_text)
+        logger.debug(f"SCRAPED MAIN TEXT QA: {main_text_quality}")
+        logger.debug(f"Number of sources added: {num_sources}")
+        if not main_text_quality:
+            logger.warning(
+                f"❌ Article: '{title_sample}' | QA: {main_text_quality} | Failed QA after scraping and will be skipped. Reason: low-quality or corrupted text."
+            )
+            self._count("errors")
+            return None
+        logger.debug(
+            f"✅ Article: '{title_sample}' | QA: {main_text_quality} | Passed QA check after scraping."
+        )
+
+        # Generate summary from scraped content
+        logger.debug("📝 Generating article summary")
+        summary = summarize_article(enriched_article)
+        logger.debug(
+            "summary generation complete | type=%s | len=%s",
+            type(summary),
+            (len(summary) if isinstance(summary, str) else "NA"),
+        )
+        if not isinstance(summary, str) or not summary.strip():
+            logger.warning(
+                "❌ Summary missing or invalid type; skipping article '%s'",
+                title_sample,
+            )
+            self._count("errors")
+            return None
+        self._count("articles_summarized")
+        # Single per-article INFO line summarizing scraping result
+        logger.info(
+            f"Article: '{title_sample}' scraped {num_sources} sources, summary generated!"
+        )
+
+        # Build strict dict payload for storage: merge enriched article + argos_summary
+        payload: Dict[str, Any] = dict(enriched_article)
+        payload["argos_summary"] = summary
+        # Minimal provenance
+        payload.setdefault("argos_topic", title)
+        logger.debug(
+            "storage payload | type=%s | keys_sample=%s",
+            type(payload),
+            list(payload.keys())[:12],
+        )
+        return i, payload
+
+    def _store_stage(self, item: _Item) -> Optional[_Item]:
+        """
+        Store one payload via the backend /ingest endpoint (automatic deduplication).
+        Returns (index, payload with argos_id), or None if storing failed.
+        """
+        i, payload = item
+        title = payload.get("title", "Untitled")
+        title_sample = (title[:77] + "...") if len(title) > 80 else title
+        try:
+            result = ingest_article(payload)
+            argos_id = result["argos_id"]
+            status = result["status"]
+            
+            # Add ID to payload for return
+            payload["argos_id"] = argos_id
+            
+            if status == "existing":
+                logger.info(f"Duplicate detected: '{title_sample}' → {argos_id}")
+            else:
+                logger.info(f"New article stored: '{title_sample}' → {argos_id}")
+                self._count("articles_stored")
+            
+            return i, payload
+            
+        except Exception as e:
+            logger.error(f"Failed to ingest article '{title_sample}': {e}")
+            self._count("errors")
+            return None
 
 
 if __name__ == "__main__":
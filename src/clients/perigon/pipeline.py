@@ -0,0 +1,124 @@
+"""
+Staged, bounded-queue pipeline for article ingestion.
+
+Each stage has its own worker threads and hands items to the next stage
+through a bounded queue, so a slow item (e.g. one long LLM summary) only
+occupies one worker while the others keep flowing downstream, and a slow
+stage applies backpressure instead of letting work pile up in memory.
+
+Usage:
+    results = run_stages(
+        articles,
+        [
+            Stage("summarize", summarize_fn, workers=4),
+            Stage("store", store_fn, workers=2),
+            Stage("graph", graph_fn, workers=1),
+        ],
+    )
+
+A stage function takes one item and returns the item for the next stage,
+or None to drop it. Exceptions are logged and drop the item.
+"""
+
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, List
+
+from utils import app_logging
+
+logger = app_logging.get_logger(__name__)
+
+# Max items waiting between two stages
+PIPELINE_QUEUE_SIZE = int(os.getenv("INGEST_PIPELINE_QUEUE_SIZE", "8"))
+
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    name: str
+    fn: Callable[[Any], Any]
+    workers: int = 1
+    stats: dict = field(default_factory=lambda: {"in": 0, "out": 0, "dropped": 0, "errors": 0, "busy_s": 0.0})
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def count(self, key: str, amount: float = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+
+
+def run_stages(
+    items: Iterable[Any], stages: List[Stage], queue_size: int = PIPELINE_QUEUE_SIZE
+) -> List[Any]:
+    """
+    Push items through the stages. Returns what comes out of the last stage,
+    in completion order.
+    """
+    queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+    results: List[Any] = []
+    results_lock = threading.Lock()
+    threads: List[threading.Thread] = []
+
+    for idx, stage in enumerate(stages):
+        inbox = queues[idx]
+        outbox = queues[idx + 1] if idx + 1 < len(stages) else None
+        next_workers = max(1, stages[idx + 1].workers) if outbox is not None else 0
+        remaining = [max(1, stage.workers)]
+        remaining_lock = threading.Lock()
+
+        def worker(stage=stage, inbox=inbox, outbox=outbox, next_workers=next_workers,
+                   remaining=remaining, remaining_lock=remaining_lock):
+            while True:
+                item = inbox.get()
+                if item is _DONE:
+                    break
+                stage.count("in")
+                started = time.monotonic()
+                try:
+                    out = stage.fn(item)
+                except Exception as e:
+                    stage.count("errors")
+                    logger.error(f"Pipeline stage '{stage.name}' failed: {e}", exc_info=True)
+                    out = None
+                finally:
+                    stage.count("busy_s", time.monotonic() - started)
+                if out is None:
+                    stage.count("dropped")
+                    continue
+                stage.count("out")
+                if outbox is not None:
+                    outbox.put(out)  # blocks when the next stage is behind (backpressure)
+                else:
+                    with results_lock:
+                        results.append(out)
+            # Last worker of this stage to finish tells the next stage to wind down
+            with remaining_lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                for _ in range(next_workers):
+                    outbox.put(_DONE)
+
+        for n in range(max(1, stage.workers)):
+            t = threading.Thread(target=worker, name=f"ingest-{stage.name}-{n}", daemon=True)
+            t.start()
+            threads.append(t)
+
+    for item in items:
+        queues[0].put(item)
+    for _ in range(max(1, stages[0].workers)):
+        queues[0].put(_DONE)
+
+    for t in threads:
+        t.join()
+
+    for stage in stages:
+        logger.info(
+            f"Pipeline stage '{stage.name}': in={stage.stats['in']} out={stage.stats['out']} "
+            f"dropped={stage.stats['dropped']} errors={stage.stats['errors']} "
+            f"busy={stage.stats['busy_s']:.1f}s workers={stage.workers}"
+        )
+    return results
@@ -8,6 +8,8 @@ World-class Source Scraper for News Ingestion.
 - Polite scraping (delays, real headers)
 - Ultra-clean output (trafilatura)
 - Recursive URL extraction for all sources
+- Concurrent source fetching over one pooled HTTP/2 client
+  (global + per-domain limits, see SourceScraper)
 """
 
 import json
@@ -20,6 +22,12 @@ from urllib.parse import urlparse
 import httpx
 import trafilatura
 
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from . import config
 from utils import app_logging
 
@@ -27,6 +35,7 @@ logger = app_logging.get_logger(__name__)
 
 USER_AGENT = config.USER_AGENT
 MIN_WORDS_OK = 100
+FETCH_TIMEOUT_S = 20
 
 
 # --- Utility: get domain from URL ---
@@ -75,24 +84,46 @@ def load_cookies_from_disk(domain: str) -> Optional[list]:
 
 
 # --- Static (httpx+trafilatura) fetch path ---
-async def try_static_fetch(url: str, cookies: Optional[list] = None) -> str:
+def create_http_client() -> httpx.AsyncClient:
+    """Pooled keep-alive client (HTTP/2 when h2 is installed) shared by all fetches."""
+    return httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        follow_redirects=True,
+        timeout=FETCH_TIMEOUT_S,
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=config.MAX_CONCURRENT_REQUESTS * 2,
+            max_keepalive_connections=config.MAX_CONCURRENT_REQUESTS * 2,
+        ),
+    )
+
+
+async def _extract_text(html: str) -> str:
+    # trafilatura is CPU-bound; keep it off the event loop so other fetches progress
+    return await asyncio.to_thread(trafilatura.extract, html) or ""
+
+
+async def try_static_fetch(
+    url: str, cookies: Optional[list] = None, client: Optional[httpx.AsyncClient] = None
+) -> str:
     logger.debug(f"[static] GET {url}")
-    headers = {"User-Agent": USER_AGENT}
-    async with httpx.AsyncClient(
-        headers=headers, follow_redirects=True, timeout=20
-    ) as client:
-        try:
-            resp = await client.get(
-                url, cookies={c["name"]: c["value"] for c in cookies or []}
-            )
-            resp.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            logger.debug(f"[static] HTTP error {e.response.status_code}")
-            return ""
-        except (httpx.TransportError, httpx.TimeoutException) as e:
-            logger.debug(f"[static] transport error: {e}")
-            return ""
-    text = trafilatura.extract(resp.text) or ""
+    own_client = client is None
+    client = client or create_http_client()
+    try:
+        resp = await client.get(
+            url, cookies={c["name"]: c["value"] for c in cookies or []}
+        )
+        resp.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        logger.debug(f"[static] HTTP error {e.response.status_code}")
+        return ""
+    except (httpx.TransportError, httpx.TimeoutException) as e:
+        logger.debug(f"[static] transport error: {e}")
+        return ""
+    finally:
+        if own_client:
+            await client.aclose()
+    text = await _extract_text(resp.text)
     logger.debug(f"[static] extracted {len(text)} chars")
     return text
 
@@ -156,27 +187,26 @@ async def playwright_fetch(
 
 
 # --- Main orchestrator for a single URL ---
-async def fetch_article(url: str) -> str:
+async def fetch_article(url: str, client: Optional[httpx.AsyncClient] = None) -> str:
     """
     Perform a single robust static scrape (httpx + trafilatura). No browser escalation.
+    Pass a shared client to reuse pooled connections; otherwise a one-off client is used.
     Returns article text or empty string if failed.
     """
     log_url = url if len(url) <= 80 else url[:77] + "..."
-    headers = {"User-Agent": USER_AGENT}
+    own_client = client is None
+    client = client or create_http_client()
     try:
-        async with httpx.AsyncClient(
-            headers=headers, follow_redirects=True, timeout=20
-        ) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            text = trafilatura.extract(resp.text) or ""
-            if text:
-                logger.debug(f"Scrape succeeded ({len(text.split())} words)")
-                sample = text[:400] + ("..." if len(text) > 400 else "")
-                logger.debug(f"Sample: {sample}")
-            else:
-                logger.debug(f"Scrape returned no extractable text for {log_url}")
-            return text
+        resp = await client.get(url)
+        resp.raise_for_status()
+        text = await _extract_text(resp.text)
+        if text:
+            logger.debug(f"Scrape succeeded ({len(text.split())} words)")
+            sample = text[:400] + ("..." if len(text) > 400 else "")
+            logger.debug(f"Sample: {sample}")
+        else:
+            logger.debug(f"Scrape returned no extractable text for {log_url}")
+        return text
 
     except httpx.HTTPStatusError as e:
         logger.debug(f"HTTP error {e.response.status_code} for {log_url}")
@@ -184,6 +214,9 @@ async def fetch_article(url: str) -> str:
         logger.debug(f"Transport error for {log_url}: {e}")
     except Exception as e:
         logger.error(f"Failed to scrape {log_url}: {e}")
+    finally:
+        if own_client:
+            await client.aclose()
     return ""
 
 
@@ -213,6 +246,100 @@ def extract_all_urls(data) -> List[str]:
     return list(set(urls))  # deduplicate
 
 
+# --- Scraper engine: shared client, global + per-domain concurrency ---
+class SourceScraper:
+    """
+    Async context manager that fetches source URLs concurrently.
+
+    One pooled client is reused for every fetch (keep-alive, HTTP/2 when
+    available). At most config.MAX_CONCURRENT_REQUESTS fetches run at once,
+    and at most config.MAX_CONCURRENT_PER_DOMAIN against any single domain.
+
+    Usage:
+        async with SourceScraper() as scraper:
+            enriched = await scraper.scrape_many(articles)
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = config.MAX_CONCURRENT_REQUESTS,
+        max_per_domain: int = config.MAX_CONCURRENT_PER_DOMAIN,
+    ):
+        self.max_per_domain = max_per_domain
+        self._global = asyncio.Semaphore(max_concurrent)
+        self._domains: Dict[str, asyncio.Semaphore] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "SourceScraper":
+        self._client = create_http_client()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _domain_semaphore(self, url: str) -> asyncio.Semaphore:
+        domain = domain_from_url(url)
+        if domain not in self._domains:
+            self._domains[domain] = asyncio.Semaphore(self.max_per_domain)
+        return self._domains[domain]
+
+    async def fetch(self, url: str) -> str:
+        async with self._domain_semaphore(url), self._global:
+            return await fetch_article(url, client=self._client)
+
+    async def scrape_sources(self, article_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Scrape ONLY linked/source URLs (not the main article), concurrently.
+        Returns a copy of article_data with 'scraped_sources':
+            [ {'url': ..., 'text': ...}, ... ]  (input order, only sources passing is_article_good)
+        """
+        if not article_data:
+            raise ValueError("Article data cannot be None or empty")
+
+        urls = extract_all_urls(article_data)
+        if not urls:
+            logger.debug("No URLs found to scrape in article_data")
+            article_data["scraped_sources"] = []
+            return article_data
+
+        main_url = article_data.get("url") or urls[0]
+        source_urls = [u for u in urls if u != main_url]
+
+        texts = await asyncio.gather(*(self.fetch(u) for u in source_urls))
+
+        scraped_sources = []
+        for src_url, text in zip(source_urls, texts):
+            src_url_sample = src_url if len(src_url) <= 80 else src_url[:77] + "..."
+            if is_article_good(text):
+                scraped_sources.append({"url": src_url, "text": text})
+                logger.debug(f"✅ Source passed QA check: {src_url_sample} ({len(text)} chars)")
+            else:
+                logger.debug(f"❌ Source failed QA and will be excluded: {src_url_sample}")
+
+        article_data = dict(article_data)
+        article_data["scraped_sources"] = scraped_sources
+        return article_data
+
+    async def scrape_many(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        scrape_sources for a batch of articles, all sharing the same limits.
+        Order is preserved; an article whose scrape fails comes back with no sources.
+        """
+        results = await asyncio.gather(
+            *(self.scrape_sources(a) for a in articles), return_exceptions=True
+        )
+        enriched = []
+        for article, result in zip(articles, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Source scraping failed for {(article or {}).get('url', '?')}: {result}")
+                result = dict(article or {})
+                result["scraped_sources"] = []
+            enriched.append(result)
+        return enriched
+
+
 # --- Main interface: scrape_article_and_sources ---
 async def scrape_article_and_sources(article_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -221,46 +348,20 @@ async def scrape_article_and_sources(article_data: Dict[str, Any]) -> Dict[str,
         'scraped_sources': [ {'url': ..., 'text': ...}, ... ]
     Only sources that pass is_article_good are included.
     """
-    if not article_data:
-        raise ValueError("Article data cannot be None or empty")
-
-    urls = extract_all_urls(article_data)
-    if not urls:
-        logger.debug("No URLs found to scrape in article_data")
-        article_data["scraped_sources"] = []
-        return article_data
+    async with SourceScraper() as scraper:
+        return await scraper.scrape_sources(article_data)
 
-    main_url = article_data.get("url") or urls[0]
-    source_urls = [u for u in urls if u != main_url]
 
-    scraped_sources = []
-    import json
+async def scrape_articles_and_sources(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Batch version of scrape_article_and_sources (one client and one set of limits)."""
+    async with SourceScraper() as scraper:
+        return await scraper.scrape_many(articles)
 
-    for src_url in source_urls:
-        # Always log a clear separator before every source
-        logger.debug("---------------- NEW SOURCE -------------------------------")
-        src_url_sample = src_url if len(src_url) <= 80 else src_url[:77] + "..."
-        logger.debug(f"Scraping source: {src_url_sample}")
-        text = await fetch_article(src_url)
-        if is_article_good(text):
-            json_len_before = len(json.dumps(article_data))
-            scraped_sources.append({"url": src_url, "text": text})
-            article_data["scraped_sources"] = scraped_sources
-            json_len_after = len(json.dumps(article_data))
-            logger.debug(
-                f"JSON length before adding source: {json_len_before}, after: {json_len_after}"
-            )
-            logger.debug("✅ Source passed QA check.")
-        else:
-            logger.debug("❌ Source failed QA and will be excluded.")
-
-    logger.debug("---------------- END SOURCE INTERATION ----------------------")
 
-    article_data = dict(article_data)
-    article_data["scraped_sources"] = scraped_sources
-    return article_data
-
-
-# --- Synchronous wrapper ---
+# --- Synchronous wrappers ---
 def scrape_article_and_sources_sync(article_data: Dict[str, Any]) -> Dict[str, Any]:
     return asyncio.run(scrape_article_and_sources(article_data))
+
+
+def scrape_articles_and_sources_sync(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return asyncio.run(scrape_articles_and_sources(articles))
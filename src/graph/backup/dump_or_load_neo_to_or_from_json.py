@@ -40,7 +40,7 @@ if PROJECT_ROOT not in sys.path:
 
 import json
 from datetime import datetime
-from src.graph.neo4j_client import connect_graph_db, NEO4J_DATABASE
+from src.graph.neo4j_client import connect_graph_db, close_driver, NEO4J_DATABASE
 
 # Dump directory anchored next to this script
 DUMPS_DIR = os.path.join(os.path.dirname(__file__), "dumps")
@@ -102,7 +102,7 @@ def dump_neo_db(out_dir=DUMPS_DIR):
 
         return dump_path
     finally:
-        driver.close()
+        close_driver()
 
 
 def load_neo_db(dump_path, wipe=True):
@@ -166,7 +166,7 @@ def load_neo_db(dump_path, wipe=True):
 
         return True
     finally:
-        driver.close()
+        close_driver()
 
 
 if __name__ == "__main__":
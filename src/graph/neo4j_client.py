@@ -8,10 +8,13 @@ from utils.env_loader import load_env
 load_env()
 
 import os
+import atexit
 import logging
-from collections.abc import Mapping
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional, TypeVar, cast
-from neo4j import GraphDatabase, basic_auth, Driver
+from neo4j import GraphDatabase, basic_auth, Driver, Session, Transaction
 from utils import app_logging
 from .models import Neo4jRecord, Topic, Article, CountResult, IdResult, NodeExistsResult
 
@@ -24,16 +27,104 @@ NEO4J_USER = os.environ.get("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.environ.get("NEO4J_PASSWORD", "password")
 NEO4J_DATABASE = os.environ.get("NEO4J_DATABASE", "neo4j")
 
+# Connection pool sizing for the process-wide driver
+NEO4J_MAX_POOL_SIZE = int(os.environ.get("NEO4J_MAX_POOL_SIZE", "50"))
+NEO4J_CONNECTION_ACQUISITION_TIMEOUT = float(
+    os.environ.get("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", "60")
+)
+
+# Process-wide driver (created lazily, shared by all threads)
+_driver: Optional[Driver] = None
+_driver_lock = threading.Lock()
+
+
+def get_driver() -> Driver:
+    """
+    Return the process-wide pooled Neo4j driver, creating it on first use.
+
+    The database existence check runs once, when the driver is created.
+    Every later call returns the same driver, so sessions borrow connections
+    from its pool instead of opening new ones.
+
+    Raises:
+        RuntimeError: If connection fails or database cannot be created
+    """
+    global _driver
+    if _driver is not None:
+        return _driver
+    with _driver_lock:
+        if _driver is None:
+            _driver = _create_driver()
+            atexit.register(close_driver)
+    return _driver
+
+
+def close_driver() -> None:
+    """Close the process-wide driver and release its connection pool (safe to call twice)."""
+    global _driver
+    with _driver_lock:
+        if _driver is None:
+            return
+        try:
+            _driver.close()
+            logger.debug("Neo4j driver closed")
+        except Exception as e:
+            logger.warning(f"Error while closing Neo4j driver: {e}")
+        finally:
+            _driver = None
+
 
 def connect_graph_db() -> Driver:
     """
-    Creates and returns a Neo4j driver object using config from environment variables or defaults.
+    Return the shared Neo4j driver.
+
+    Kept for existing callers; prefer graph_session() / graph_transaction().
+    Callers must NOT close the returned driver.
+    """
+    return get_driver()
+
+
+@contextmanager
+def graph_session(database: Optional[str] = None) -> Iterator[Session]:
+    """
+    Context-managed session on the pooled driver.
+
+    Example:
+        with graph_session() as session:
+            session.run("MATCH (t:Topic) RETURN count(t)")
+    """
+    with get_driver().session(database=database or NEO4J_DATABASE) as session:
+        yield session
+
+
+@contextmanager
+def graph_transaction(database: Optional[str] = None) -> Iterator[Transaction]:
+    """
+    Context-managed explicit transaction on the pooled driver.
+
+    Commits when the block exits normally, rolls back if it raises.
+
+    Example:
+        with graph_transaction() as tx:
+            tx.run("CREATE (a:Article {id: $id})", {"id": "abc"})
+            tx.run("MATCH (a:Article {id: $id}) SET a.seen = true", {"id": "abc"})
+    """
+    with graph_session(database) as session:
+        with session.begin_transaction() as tx:
+            yield tx
+            tx.commit()
+
+
+def _create_driver() -> Driver:
+    """
+    Creates a Neo4j driver object using config from environment variables or defaults.
     Checks if the target database exists; if not, tries to create it (admin required).
     Returns:
         neo4j.Driver: Neo4j driver instance
     Raises:
         RuntimeError: If connection fails or database cannot be created
     """
+    driver: Optional[Driver] = None
     try:
         # Suppress noisy warnings from the Neo4j Python driver unless explicitly enabled
         app_logging.get_logger("neo4j").setLevel(logging.ERROR)
@@ -49,7 +140,10 @@ def connect_graph_db() -> Driver:
             f"Connecting to Neo4j at {NEO4J_URI} as user '{NEO4J_USER}' (database: '{NEO4J_DATABASE}')"
         )
         driver = GraphDatabase.driver(
-            NEO4J_URI, auth=basic_auth(NEO4J_USER, NEO4J_PASSWORD)
+            NEO4J_URI,
+            auth=basic_auth(NEO4J_USER, NEO4J_PASSWORD),
+            max_connection_pool_size=NEO4J_MAX_POOL_SIZE,
+            connection_acquisition_timeout=NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
         )
         # First, check if the database exists (connect to system db)
         with driver.session(database="system") as sys_session:
@@ -96,9 +190,14 @@ def connect_graph_db() -> Driver:
         # Now test connection on the specified database
         with driver.session(database=NEO4J_DATABASE) as session:
             session.run("RETURN 1")
-        logger.debug(f"✅ Successfully connected to Neo4j database '{NEO4J_DATABASE}'!")
+        logger.debug(
+            f"✅ Successfully connected to Neo4j database '{NEO4J_DATABASE}' "
+            f"(pool size {NEO4J_MAX_POOL_SIZE})!"
+        )
         return driver
     except Exception as e:
+        if driver is not None:
+            driver.close()
         logger.error(
             f"❌ Failed to connect to Neo4j or create database: {e}", exc_info=True
         )
@@ -125,10 +224,8 @@ def run_cypher(
 
         # For node queries, use specialized methods below for better typing
     """
-    driver = connect_graph_db()
-    db = database or NEO4J_DATABASE
     try:
-        with driver.session(database=db) as session:
+        with graph_session(database) as session:
             # Normalize params to ensure logging never errors on None
             p = params or {}
             result = session.run(query, p)
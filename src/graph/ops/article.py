@@ -43,6 +43,8 @@ def remove_article_from_graph(article_id: str) -> None:
     MATCH (a:Article {id: $article_id}) DETACH DELETE a
     """
     run_cypher(cypher, {"article_id": article_id})
+    from src.vector.indexer import forget_articles
+    forget_articles([article_id])
     logger.info(f"Removed article {article_id} from graph.")
 
 
@@ -0,0 +1,281 @@
+"""
+Batched graph writes for article ingestion.
+
+Collects Article nodes and ABOUT edges in memory and writes them with one
+UNWIND transaction per flush, instead of one round trip per node/edge.
+
+Usage:
+    with GraphWriteBatch() as batch:
+        batch.preload_articles(article_ids)      # one query for dedup state
+        batch.add_article({...})
+        batch.add_about(article_id, topic_id, "current", 3, motivation, implications)
+        batch.defer(lambda: discover_topic_relationships(topic_id, article_id), key=("discover", topic_id))
+    # on exit: pending rows are flushed, then deferred follow-ups run in order
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any
+
+from src.graph.neo4j_client import run_cypher, graph_transaction
+from utils import app_logging
+
+logger = app_logging.get_logger(__name__)
+
+# Flush when this many rows (articles + edges) are pending...
+BATCH_MAX_ROWS = int(os.getenv("GRAPH_BATCH_MAX_ROWS", "200"))
+# ...or when the oldest pending row has waited this long (checked on add)
+BATCH_MAX_WAIT_S = float(os.getenv("GRAPH_BATCH_MAX_WAIT_S", "5"))
+
+# Minimum tier at which a linked article is indexed into Qdrant (see create_link_at_tier)
+INDEX_MIN_TIER = 2
+
+_MERGE_ARTICLES = """
+UNWIND $rows AS row
+MERGE (a:Article {id: row.id})
+ON CREATE SET
+    a.title = row.title,
+    a.summary = row.summary,
+    a.source = row.source,
+    a.published_at = row.published_at,
+    a.created_at = datetime()
+"""
+
+_MERGE_ABOUT = """
+UNWIND $rows AS row
+MATCH (a:Article {id: row.article_id}), (t:Topic {id: row.topic_id})
+MERGE (a)-[r:ABOUT]->(t)
+ON CREATE SET
+    r.timeframe = row.timeframe,
+    r.importance_risk = row.tier,
+    r.importance_opportunity = row.tier,
+    r.importance_trend = row.tier,
+    r.importance_catalyst = row.tier,
+    r.motivation = row.motivation,
+    r.implications = row.implications,
+    r.created_at = datetime(),
+    a.vector_changed_at = datetime()
+RETURN count(r) AS linked
+"""
+
+
+def fetch_article_link_state(article_ids: Iterable[str]) -> dict[str, set[str]]:
+    """
+    Look up which articles already exist and which topics they are ABOUT, in one query.
+
+    Returns:
+        {article_id: {topic_id, ...}} for every article that exists in the graph.
+        Articles that do not exist are absent from the dict.
+    """
+    ids = sorted({aid for aid in article_ids if aid})
+    if not ids:
+        return {}
+    query = """
+    UNWIND $ids AS id
+    MATCH (a:Article {id: id})
+    OPTIONAL MATCH (a)-[:ABOUT]->(t:Topic)
+    RETURN a.id AS id, collect(t.id) AS topic_ids
+    """
+    rows = run_cypher(query, {"ids": ids})
+    return {r["id"]: set(r.get("topic_ids") or []) for r in rows}
+
+
+class GraphWriteBatch:
+    """
+    Buffer of Article/ABOUT writes flushed as UNWIND transactions.
+
+    Thread-safe; a flush happens when BATCH_MAX_ROWS rows are pending, when the
+    oldest pending row is older than BATCH_MAX_WAIT_S, on flush(), or on exit.
+    """
+
+    def __init__(self, max_rows: int = BATCH_MAX_ROWS, max_wait_s: float = BATCH_MAX_WAIT_S):
+        self.max_rows = max_rows
+        self.max_wait_s = max_wait_s
+        self._lock = threading.RLock()
+        self._articles: dict[str, dict[str, Any]] = {}
+        self._abouts: dict[tuple[str, str], dict[str, Any]] = {}
+        self._oldest_pending: float | None = None
+        # Known graph state: article_id -> topic ids it is ABOUT (existing articles only)
+        self._known: dict[str, set[str]] = {}
+        self._checked: set[str] = set()
+        self._deferred: list[Callable[[], Any]] = []
+        self._deferred_keys: set[Hashable] = set()
+        self.stats = {"flushes": 0, "articles_written": 0, "abouts_written": 0}
+
+    # --- dedup state ---------------------------------------------------------
+    def preload_articles(self, article_ids: Iterable[str]) -> None:
+        """Load existence + ABOUT state for many articles with a single query."""
+        ids = [aid for aid in article_ids if aid and aid not in self._checked]
+        if not ids:
+            return
+        state = fetch_article_link_state(ids)
+        with self._lock:
+            self._known.update(state)
+            self._checked.update(ids)
+
+    def article_exists(self, article_id: str) -> bool:
+        """True if the article is in the graph or pending in this batch."""
+        self.preload_articles([article_id])
+        with self._lock:
+            return article_id in self._known or article_id in self._articles
+
+    def is_linked(self, article_id: str, topic_id: str) -> bool:
+        """True if an ABOUT edge exists in the graph or is pending in this batch."""
+        self.preload_articles([article_id])
+        with self._lock:
+            return (
+                topic_id in self._known.get(article_id, set())
+                or (article_id, topic_id) in self._abouts
+            )
+
+    def has_pending_about(self, topic_id: str) -> bool:
+        """True if unflushed ABOUT edges point at this topic (capacity counts would be stale)."""
+        with self._lock:
+            return any(tid == topic_id for (_, tid) in self._abouts)
+
+    # --- buffering -----------------------------------------------------------
+    def add_article(self, article: dict[str, Any]) -> None:
+        """Queue an Article node (id, title, summary, source, published_at)."""
+        with self._lock:
+            self._articles.setdefault(article["id"], {
+                "id": article["id"],
+                "title": article.get("title"),
+                "summary": article.get("summary"),
+                "source": article.get("source"),
+                "published_at": article.get("published_at"),
+            })
+            self._touch()
+        self._maybe_flush()
+
+    def add_about(
+        self,
+        article_id: str,
+        topic_id: str,
+        timeframe: str,
+        tier: int,
+        motivation: str,
+        implications: str,
+    ) -> None:
+        """Queue an ABOUT edge with uniform importance scores at tier (same shape as create_link_at_tier)."""
+        with self._lock:
+            self._abouts.setdefault((article_id, topic_id), {
+                "article_id": article_id,
+                "topic_id": topic_id,
+                "timeframe": timeframe,
+                "tier": tier,
+                "motivation": motivation,
+                "implications": implications,
+            })
+            self._touch()
+        self._maybe_flush()
+
+    def defer(self, callback: Callable[[], Any], key: Hashable | None = None) -> None:
+        """
+        Run callback after the batch is written (see run_deferred).
+
+        Callbacks with the same key run once, e.g. one relationship discovery
+        per topic instead of one per article.
+        """
+        with self._lock:
+            if key is not None:
+                if key in self._deferred_keys:
+                    return
+                self._deferred_keys.add(key)
+            self._deferred.append(callback)
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._articles) + len(self._abouts)
+
+    def _touch(self) -> None:
+        if self._oldest_pending is None:
+            self._oldest_pending = time.monotonic()
+
+    def _maybe_flush(self) -> None:
+        with self._lock:
+            if not self._articles and not self._abouts:
+                return
+            too_many = self.pending >= self.max_rows
+            too_old = (
+                self._oldest_pending is not None
+                and time.monotonic() - self._oldest_pending >= self.max_wait_s
+            )
+        if too_many or too_old:
+            self.flush()
+
+    # --- writing -------------------------------------------------------------
+    def flush(self) -> dict[str, int]:
+        """Write all pending rows in one transaction. Returns counts written."""
+        with self._lock:
+            articles = list(self._articles.values())
+            abouts = list(self._abouts.values())
+            if not articles and not abouts:
+                return {"articles": 0, "abouts": 0}
+
+            with graph_transaction() as tx:
+                if articles:
+                    tx.run(_MERGE_ARTICLES, {"rows": articles}).consume()
+                linked = 0
+                if abouts:
+                    record = tx.run(_MERGE_ABOUT, {"rows": abouts}).single()
+                    linked = int(record["linked"]) if record else 0
+
+            # Committed: fold into known state and clear the buffer
+            for row in articles:
+                self._known.setdefault(row["id"], set())
+                self._checked.add(row["id"])
+            for row in abouts:
+                self._known.setdefault(row["article_id"], set()).add(row["topic_id"])
+            self._articles.clear()
+            self._abouts.clear()
+            self._oldest_pending = None
+
+            self.stats["flushes"] += 1
+            self.stats["articles_written"] += len(articles)
+            self.stats["abouts_written"] += len(abouts)
+
+        if linked < len(abouts):
+            logger.warning(
+                f"Batch flush linked {linked}/{len(abouts)} ABOUT edges (missing article or topic)"
+            )
+        logger.info(
+            f"Batch flush: {len(articles)} articles, {len(abouts)} ABOUT edges in one transaction"
+        )
+
+        # Index to Qdrant if Tier 2 or 3 (same rule as create_link_at_tier)
+        to_index = sorted({r["article_id"] for r in abouts if r["tier"] >= INDEX_MIN_TIER})
+        if to_index:
+            from src.vector.indexer import index_articles
+            index_articles(to_index)  # Fail loud - crash if Qdrant is down
+
+        return {"articles": len(articles), "abouts": len(abouts)}
+
+    def run_deferred(self) -> None:
+        """Run deferred follow-ups in registration order (after a flush)."""
+        with self._lock:
+            callbacks = self._deferred
+            self._deferred = []
+            self._deferred_keys = set()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Deferred graph follow-up failed: {e}", exc_info=True)
+
+    def close(self) -> None:
+        """Flush pending writes, then run deferred follow-ups."""
+        self.flush()
+        self.run_deferred()
+
+    def __enter__(self) -> "GraphWriteBatch":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # Still persist what was classified before the failure, but skip follow-ups
+            self.flush()
@@ -1,13 +1,16 @@
-from src.graph.neo4j_client import connect_graph_db, NEO4J_DATABASE
+from src.graph.neo4j_client import graph_session
 from utils import app_logging
 from src.observability.stats_client import track
 from difflib import get_close_matches
-from typing import Optional, Any
+from typing import Optional, Any, TYPE_CHECKING
 from src.graph.ops.topic import get_all_topics, get_topic_by_id
 from src.graph.policies.topic import llm_filter_all_interesting_topics
 from src.graph.policies.link import llm_select_link_to_remove, llm_select_one_new_link
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    from src.graph.ops.batch_writer import GraphWriteBatch
+
 logger = app_logging.get_logger(__name__)
 
 class LinkModel(BaseModel):
@@ -23,8 +26,7 @@ def add_link(link: LinkModel, context: Optional[dict[str, Any]] = None) -> None:
     logger.info(f"Adding link: {link}")
     event_id = f"{link.source.lower()}__{link.type.lower()}__{link.target.lower()}"
     try:
-        driver = connect_graph_db()
-        with driver.session(database=NEO4J_DATABASE) as session:
+        with graph_session() as session:
             # Fetch and log all Topic topics' IDs and names
             query_topics = """
             MATCH (n:Topic)
@@ -230,8 +232,7 @@ def get_existing_links(topic_id: str) -> list[dict]:
         f"[get_existing_links] Fetching all topic-to-topic links for topic_id={topic_id}"
     )
     try:
-        driver = connect_graph_db()
-        with driver.session(database=NEO4J_DATABASE) as session:
+        with graph_session() as session:
             query = """
             MATCH (src:Topic {id: $id})-[r]->(tgt:Topic)
             RETURN type(r) AS type, src.id AS source, tgt.id AS target
@@ -259,8 +260,7 @@ def remove_link(link: dict[str, str], context: Optional[dict[str, str]] = None):
     logger.info(f"Removing link: {link}")
     event_id = f"{str(link.get('source','none')).lower()}__{str(link.get('type','none')).lower()}__{str(link.get('target','none')).lower()}"
     try:
-        driver = connect_graph_db()
-        with driver.session(database=NEO4J_DATABASE) as session:
+        with graph_session() as session:
             query = """
             MATCH (src:Topic {id: $source})-[r]->(tgt:Topic {id: $target})
             WHERE type(r) = $type
@@ -351,7 +351,9 @@ def create_about_link_with_classification(
     importance_catalyst: int,
     motivation: str,
     implications: str,
-    test: bool = False
+    test: bool = False,
+    article_data: dict | None = None,
+    batch: "GraphWriteBatch | None" = None,
 ) -> dict:
     """
     Create ABOUT relationship with two-stage capacity management.
@@ -373,6 +375,9 @@ def create_about_link_with_classification(
         motivation: Why this article matters for THIS topic
         implications: What this could mean for THIS topic
         test: If True, skip capacity checks
+        article_data: Optional {summary, source, published_at}; skips the Article lookup
+        batch: Optional GraphWriteBatch; dedup uses its preloaded state and the
+            ABOUT edge is queued instead of written immediately
     
     Returns:
         {"action": "added"|"archived"|"rejected"|"duplicate", "tier": int}
@@ -380,11 +385,14 @@ def create_about_link_with_classification(
     from src.graph.neo4j_client import run_cypher
     
     # Check if link already exists
-    check_query = """
-    MATCH (a:Article {id: $article_id})-[r:ABOUT]->(t:Topic {id: $topic_id})
-    RETURN r
-    """
-    existing = run_cypher(check_query, {"article_id": article_id, "topic_id": topic_id})
+    if batch is not None:
+        existing = batch.is_linked(article_id, topic_id)
+    else:
+        check_query = """
+        MATCH (a:Article {id: $article_id})-[r:ABOUT]->(t:Topic {id: $topic_id})
+        RETURN r
+        """
+        existing = bool(run_cypher(check_query, {"article_id": article_id, "topic_id": topic_id}))
     
     if existing:
         logger.info(f"ABOUT link already exists: {article_id} -> {topic_id}")
@@ -395,17 +403,18 @@ def create_about_link_with_classification(
     initial_tier = max(importance_risk, importance_opportunity, importance_trend, importance_catalyst)
     
     # Get article metadata for capacity check
-    article_query = """
-    MATCH (a:Article {id: $article_id})
-    RETURN a.summary as summary, a.source as source, a.published_at as published_at
-    """
-    article_result = run_cypher(article_query, {"article_id": article_id})
-    
-    if not article_result:
-        logger.error(f"Article {article_id} not found")
-        return {"action": "error"}
-    
-    article_data = article_result[0]
+    if article_data is None:
+        article_query = """
+        MATCH (a:Article {id: $article_id})
+        RETURN a.summary as summary, a.source as source, a.published_at as published_at
+        """
+        article_result = run_cypher(article_query, {"article_id": article_id})
+        
+        if not article_result:
+            logger.error(f"Article {article_id} not found")
+            return {"action": "error"}
+        
+        article_data = article_result[0]
     
     # Add with capacity check (recursive)
     result = add_article_with_capacity_check(
@@ -418,7 +427,8 @@ def create_about_link_with_classification(
         article_published=article_data["published_at"],
         motivation=motivation,
         implications=implications,
-        test=test
+        test=test,
+        batch=batch,
     )
     
     return result
@@ -438,7 +448,8 @@ def add_article_with_capacity_check(
     article_published: str,
     motivation: str,
     implications: str,
-    test: bool = False
+    test: bool = False,
+    batch: "GraphWriteBatch | None" = None,
 ) -> dict:
     """
     Recursively add article with two-stage capacity management.
@@ -477,7 +488,7 @@ def add_article_with_capacity_check(
             # Tier 0 = archive, unlimited capacity
             logger.info(f"Archiving article {aid} at tier 0")
             try:
-                create_link_at_tier(aid, topic_id, timeframe, 0, motivation_text, implications_text)
+                create_link_at_tier(aid, topic_id, timeframe, 0, motivation_text, implications_text, batch=batch)
                 track("article_archived", f"Article {aid} archived at tier 0")
                 return {"action": "archived", "tier": 0}
             except Exception as e:
@@ -485,13 +496,17 @@ def add_article_with_capacity_check(
                 track("error_occurred", f"Failed to archive article {aid}: {e}")
                 return {"action": "error", "tier": 0}
         
+        # Buffered edges for this topic must be written before counting capacity
+        if batch is not None and batch.has_pending_about(topic_id):
+            batch.flush()
+
         # Check capacity at this tier
         capacity_info = check_capacity(topic_id, timeframe, tier)
         
         if capacity_info["has_room"]:
             # Room available - just add it
             logger.info(f"Adding article {aid} at tier {tier} (room available)")
-            create_link_at_tier(aid, topic_id, timeframe, tier, motivation_text, implications_text)
+            create_link_at_tier(aid, topic_id, timeframe, tier, motivation_text, implications_text, batch=batch)
             track("about_link_created")
             return {"action": "added", "tier": tier}
         
@@ -549,7 +564,7 @@ def add_article_with_capacity_check(
         
         # Now we have room at current tier - add new article
         logger.info(f"Adding article {aid} at tier {tier} (made room by downgrading {downgrade_id})")
-        create_link_at_tier(aid, topic_id, timeframe, tier, motivation_text, implications_text)
+        create_link_at_tier(aid, topic_id, timeframe, tier, motivation_text, implications_text, batch=batch)
         track("about_link_created")
         return {"action": "added", "tier": tier}
     
@@ -572,11 +587,17 @@ def create_link_at_tier(
     timeframe: str,
     tier: int,
     motivation: str,
-    implications: str
+    implications: str,
+    batch: "GraphWriteBatch | None" = None,
 ):
-    """Create ABOUT link with uniform importance scores at tier."""
+    """Create ABOUT link with uniform importance scores at tier (queued on batch if given)."""
     from src.graph.neo4j_client import run_cypher
 
+    if batch is not None:
+        batch.add_about(article_id, topic_id, timeframe, tier, motivation, implications)
+        logger.info(f"Queued ABOUT link: {article_id} -> {topic_id} | tier={tier}")
+        return
+
     create_query = """
     MATCH (a:Article {id: $article_id}), (t:Topic {id: $topic_id})
     CREATE (a)-[:ABOUT {
@@ -589,6 +610,7 @@ def create_link_at_tier(
         implications: $implications,
         created_at: datetime()
     }]->(t)
+    SET a.vector_changed_at = datetime()
     """
 
     run_cypher(create_query, {
@@ -629,7 +651,8 @@ def set_about_link_tier(
         r.importance_risk = $tier,
         r.importance_opportunity = $tier,
         r.importance_trend = $tier,
-        r.importance_catalyst = $tier
+        r.importance_catalyst = $tier,
+        a.vector_changed_at = datetime()
     """
 
     run_cypher(
@@ -677,6 +700,7 @@ def remove_link(article_id: str, topic_id: str):
     query = """
     MATCH (a:Article {id: $article_id})-[r:ABOUT]->(t:Topic {id: $topic_id})
     DELETE r
+    SET a.vector_changed_at = datetime()
     """
     
     run_cypher(query, {"article_id": article_id, "topic_id": topic_id})
@@ -1,7 +1,11 @@
+import os
+import threading
+import time
+from collections import OrderedDict
 from typing import Any, TYPE_CHECKING
 from datetime import datetime, timezone
 
-from src.graph.neo4j_client import run_cypher, connect_graph_db, NEO4J_DATABASE
+from src.graph.neo4j_client import run_cypher, graph_session
 from src.graph.models import Neo4jRecord
 from src.graph.config import DAILY_TOPIC_LIMIT
 from utils import app_logging
@@ -14,6 +18,66 @@ from src.analysis.policies.topic_proposal import TopicProposal
 
 logger = app_logging.get_logger(__name__)
 
+# ============================================================================
+# TOPIC CATALOG CACHE
+# ============================================================================
+# get_all_topics / get_topic_context are hit several times per article.
+# Both are cached in-process with a TTL and an entry bound, and dropped on
+# create_topic / remove_topic (add_topic creates through create_topic).
+TOPIC_CACHE_TTL_S = float(os.getenv("TOPIC_CACHE_TTL_S", "60"))
+TOPIC_CONTEXT_CACHE_TTL_S = float(os.getenv("TOPIC_CONTEXT_CACHE_TTL_S", "300"))
+TOPIC_CONTEXT_CACHE_SIZE = int(os.getenv("TOPIC_CONTEXT_CACHE_SIZE", "2000"))
+_TOPIC_LIST_CACHE_SIZE = 16  # distinct field selections
+
+_cache_lock = threading.Lock()
+_topic_list_cache: "OrderedDict[tuple[str, ...], tuple[float, list[dict[str, str]]]]" = OrderedDict()
+_topic_context_cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+_cache_stats = {"list_hits": 0, "list_misses": 0, "context_hits": 0, "context_misses": 0}
+
+
+def _cache_get(cache: OrderedDict, key: Any, ttl: float, kind: str) -> Any:
+    with _cache_lock:
+        entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            cache.move_to_end(key)
+            _cache_stats[f"{kind}_hits"] += 1
+            return entry[1]
+        if entry is not None:
+            del cache[key]
+        _cache_stats[f"{kind}_misses"] += 1
+        return None
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any, max_size: int) -> None:
+    with _cache_lock:
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
+
+def invalidate_topic_cache(topic_id: str | None = None) -> None:
+    """
+    Drop cached topic lists (and the context for topic_id, or all contexts if None).
+    Call after any write that adds, removes or renames topics.
+    """
+    with _cache_lock:
+        _topic_list_cache.clear()
+        if topic_id is None:
+            _topic_context_cache.clear()
+        else:
+            _topic_context_cache.pop(topic_id, None)
+
+
+def get_topic_cache_stats() -> dict[str, int]:
+    """Hit/miss counters and current sizes of the topic caches."""
+    with _cache_lock:
+        return {
+            **_cache_stats,
+            "list_entries": len(_topic_list_cache),
+            "context_entries": len(_topic_context_cache),
+        }
+
 
 def add_topic(article_id: str, suggested_names: list[str] = []) -> dict[str, str] | None:
     """
@@ -155,8 +219,7 @@ def get_topic_by_id(topic_id: str) -> dict[str, str]:
         f" Called: Fetching full Topic topic with id='{topic_id}' from Neo4j..."
     )
     try:
-        driver = connect_graph_db()
-        with driver.session(database=NEO4J_DATABASE) as session:
+        with graph_session() as session:
             query = "MATCH (n:Topic {id: $id}) RETURN n"
             logger.info(f" Running query: {query} with id={topic_id}")
             result = session.run(query, {"id": topic_id})
@@ -193,8 +256,7 @@ def get_topic_id_by_name(name: str) -> str:
 
     logger.info(f"Resolving topic id by name: name='{name}'")
     try:
-        driver = connect_graph_db()
-        with driver.session(database=NEO4J_DATABASE) as session:
+        with graph_session() as session:
             query = "MATCH (n:Topic {name: $name}) RETURN n.id AS id"
             logger.info(f"Running query: {query} | params={{'name': '{name}'}}")
             result = session.run(query, {"name": name})
@@ -220,8 +282,7 @@ def check_if_topic_exists(topic_id: str) -> bool:
     Returns:
         bool: True if topic exists, False otherwise
     """
-    driver = connect_graph_db()
-    with driver.session(database=NEO4J_DATABASE) as session:
+    with graph_session() as session:
         cypher = "MATCH (n:Topic {id: $id}) RETURN n LIMIT 1"
         result = session.run(cypher, {"id": topic_id})
         exists = result.single() is not None
@@ -244,8 +305,7 @@ def get_topic_if_exists(topic_id: str) -> dict[str, str] | None:
     Returns:
         dict: topic data if found, None otherwise
     """
-    driver = connect_graph_db()
-    with driver.session(database=NEO4J_DATABASE) as session:
+    with graph_session() as session:
         cypher = "MATCH (n:Topic {id: $id}) RETURN n LIMIT 1"
         result = session.run(cypher, {"id": topic_id})
         record = result.single()
@@ -259,25 +319,35 @@ def get_topic_if_exists(topic_id: str) -> dict[str, str] | None:
             return None
 
 
-def get_all_topics(fields: list[str] = ["id", "name", "type"]) -> list[dict[str, str]]:
+def get_all_topics(
+    fields: list[str] = ["id", "name", "type"], use_cache: bool = True
+) -> list[dict[str, str]]:
     """
     Fetch all current graph topics from the Neo4j database.
     Args:
         fields (list): Optional list of property names to return for each topic. Defaults to ['id', 'name', 'type'].
+        use_cache (bool): Serve from the topic catalog cache (TOPIC_CACHE_TTL_S). Pass False
+            when the fields change outside create/remove (e.g. last_queried for scheduling).
     Returns:
         List[Dict]: List of topic dicts with requested fields.
     Raises:
         RuntimeError: If the database query fails.
     """
+    key = tuple(fields)
+    if use_cache:
+        cached = _cache_get(_topic_list_cache, key, TOPIC_CACHE_TTL_S, "list")
+        if cached is not None:
+            # Copies, so callers can mutate their rows without touching the cache
+            return [dict(t) for t in cached]
     try:
-        driver = connect_graph_db()
-        with driver.session(database=NEO4J_DATABASE) as session:
+        with graph_session() as session:
             return_clause = ", ".join([f"n.{f} AS {f}" for f in fields])
             query = f"MATCH (n:Topic) RETURN {return_clause}"
             logger.info(f" Running query: {query}")
             result = session.run(query)
             topics = [dict(record) for record in result]
             logger.info(f" Fetched {len(topics)} topic(s) from Neo4j.")
+            _cache_put(_topic_list_cache, key, [dict(t) for t in topics], _TOPIC_LIST_CACHE_SIZE)
             return topics
     except Exception as e:
         logger.error(f" Failed to fetch topics from Neo4j: {e}", exc_info=True)
@@ -350,12 +420,24 @@ def remove_topic(topic_id: str, reason: str | None = None) -> dict[str, str]:
     rel_count = int(count_res[0]["rel_count"]) if count_res else 0
 
     # 3) Delete the topic and detach all rels
-    q_delete = "MATCH (t:Topic {id: $id}) " "DETACH DELETE t"
+    # Articles about this topic lose it from their vector payload (picked up by index_changes)
+    q_delete = (
+        "MATCH (t:Topic {id: $id}) "
+        "OPTIONAL MATCH (a:Article)-[:ABOUT]->(t) "
+        "SET a.vector_changed_at = datetime() "
+        "WITH DISTINCT t "
+        "DETACH DELETE t"
+    )
     run_cypher(q_delete, {"id": topic_id})
 
     logger.info(
         f"Removed Topic topic: name={name} id={topic_id} element_id={element_id} rels={rel_count}"
     )
+    invalidate_topic_cache(topic_id)
+    from src.vector.topic_index import drop_topic
+    drop_topic(topic_id)
+    from src.graph.scheduling.topic_scheduler import on_topic_removed
+    on_topic_removed(topic_id)
     track("topic_deleted", f"Topic {name} removed (id={topic_id}, rels={rel_count})")
     return {
         "status": "deleted",
@@ -384,8 +466,7 @@ def create_topic(topic_proposal: TopicProposal) -> dict[str, str]:
         logger.info(f"topic with ID '{topic_proposal.id}' already exists, skipping creation.")
 
         # Fetch existing topic and return it
-        driver = connect_graph_db()
-        with driver.session(database=NEO4J_DATABASE) as session:
+        with graph_session() as session:
             cypher = "MATCH (n:Topic {id: $id}) RETURN n, elementId(n) AS eid"
             result = session.run(cypher, {"id": topic_proposal.id})
             record = result.single()
@@ -401,8 +482,7 @@ def create_topic(topic_proposal: TopicProposal) -> dict[str, str]:
                 )
 
     # Create the topic
-    driver = connect_graph_db()
-    with driver.session(database=NEO4J_DATABASE) as session:
+    with graph_session() as session:
 
         # Convert all properties into a params dict for Cypher
         params = {"props": topic_proposal.model_dump()}
@@ -418,6 +498,11 @@ def create_topic(topic_proposal: TopicProposal) -> dict[str, str]:
             logger.info(
                 f"Created new Topic topic: {topic_dict.get('name')} (id={topic_proposal.id}, element_id={topic_dict['element_id']})"
             )
+            invalidate_topic_cache(topic_proposal.id)
+            from src.vector.topic_index import refresh_topic
+            refresh_topic(topic_proposal.id)
+            from src.graph.scheduling.topic_scheduler import on_topic_created
+            on_topic_created(topic_proposal.id)
             return topic_dict
         else:
             logger.error(f"Failed to create Topic topic with ID '{topic_proposal.id}'")
@@ -444,6 +529,10 @@ def get_topic_context(topic_id: str) -> dict:
         >>> print(context["name"])
         "Federal Reserve Policy"
     """
+    cached = _cache_get(_topic_context_cache, topic_id, TOPIC_CONTEXT_CACHE_TTL_S, "context")
+    if cached is not None:
+        return dict(cached)
+
     query = """
     MATCH (t:Topic {id: $topic_id})
     RETURN 
@@ -465,7 +554,9 @@ def get_topic_context(topic_id: str) -> dict:
             "analysis_snippet": "No analysis available yet for this topic."
         }
     
-    return {
+    context = {
         "name": result[0]["name"],
         "analysis_snippet": result[0]["analysis_snippet"]
     }
+    _cache_put(_topic_context_cache, topic_id, context, TOPIC_CONTEXT_CACHE_SIZE)
+    return dict(context)
@@ -0,0 +1,157 @@
+"""
+Lease-based topic claiming for ingest workers.
+
+claim_next() is a single Cypher statement (one transaction) that picks the
+most overdue unleased topics, stamps them with a lease (owner + expiry) and
+sets last_queried. Workers running it concurrently never get the same topic:
+each candidate is write-locked first and the lease is re-checked under the
+lock, so a worker that lost the race simply gets fewer rows back.
+
+A lease that is not released (worker crashed or was killed) expires after
+TOPIC_LEASE_S and the topic becomes claimable again.
+
+A lease only stops concurrent runs. A worker claiming from its own schedule
+(topic_scheduler) also passes seen_queried, the last_queried it scheduled
+each topic from. If another worker queried the topic since then, the claim
+skips it and the caller resyncs, so a topic is not queried twice in a row.
+
+Usage:
+    for topic in claim_next(n=1):
+        try:
+            process(topic)
+        finally:
+            release(topic["id"])
+"""
+import os
+import socket
+from typing import Any, Dict, List, Optional
+
+from src.graph.neo4j_client import run_cypher
+from utils import app_logging
+
+logger = app_logging.get_logger(__name__)
+
+# How long a claim stays valid without release (must outlast one topic run)
+TOPIC_LEASE_S = int(os.getenv("TOPIC_LEASE_S", "3600"))
+# Identifies this worker on the leases it holds
+WORKER_ID = os.getenv("INGEST_WORKER_ID", f"{socket.gethostname()}-{os.getpid()}")
+# Same value query_overdue_seconds uses for never-queried topics
+NEVER_QUERIED_OVERDUE_S = 1_000_000_000
+
+# Not queried since the caller's snapshot: $seen maps id -> last_queried epoch
+# seconds (null = never queried). 1s of slack absorbs epoch rounding; a
+# non-datetime legacy last_queried compares as null and is accepted.
+_NOT_QUERIED_SINCE_SEEN = """($seen IS NULL
+       OR t.last_queried IS NULL
+       OR ($seen[t.id] IS NOT NULL
+           AND coalesce(t.last_queried <= datetime({epochMillis: toInteger(($seen[t.id] + 1) * 1000)}), true)))"""
+
+_CLAIM_QUERY = f"""
+MATCH (t:Topic)
+WHERE (t.lease_expires_at IS NULL OR t.lease_expires_at < datetime())
+  AND ($names IS NULL OR t.name IN $names)
+  AND ($ids IS NULL OR t.id IN $ids)
+  AND {_NOT_QUERIED_SINCE_SEEN}
+WITH t
+ORDER BY t.last_queried IS NOT NULL, t.last_queried ASC
+LIMIT $n
+// Take the write lock, then re-check: another worker may have claimed or
+// queried t between our MATCH and the lock
+SET t._claim_lock = true
+REMOVE t._claim_lock
+WITH t
+WHERE (t.lease_expires_at IS NULL OR t.lease_expires_at < datetime())
+  AND {_NOT_QUERIED_SINCE_SEEN}
+WITH t, t.last_queried AS previous_queried
+SET t.lease_owner = $owner,
+    t.lease_expires_at = datetime() + duration({{seconds: $lease_s}}),
+    t.last_queried = datetime()
+RETURN t.id AS id,
+       t.name AS name,
+       t.type AS type,
+       t.query AS query,
+       t.queries AS queries,
+       previous_queried AS last_queried,
+       t.last_queried AS queried_at,
+       t.last_updated AS last_updated,
+       t.last_analyzed AS last_analyzed,
+       t.lease_expires_at AS lease_expires_at,
+       CASE WHEN previous_queried IS NULL THEN $never_queried
+            ELSE duration.inSeconds(previous_queried, datetime()).seconds
+       END AS overdue_seconds
+ORDER BY overdue_seconds DESC
+"""
+
+
+def claim_next(
+    n: int = 1,
+    owner: str = WORKER_ID,
+    lease_s: int = TOPIC_LEASE_S,
+    names: Optional[List[str]] = None,
+    ids: Optional[List[str]] = None,
+    seen_queried: Optional[Dict[str, Optional[float]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Atomically claim up to n of the most overdue topics not leased by another worker.
+
+    Args:
+        n: Max topics to claim
+        owner: Lease owner (defaults to this worker)
+        lease_s: Lease duration in seconds
+        names: Optional topic-name filter (e.g. a single ASSET)
+        ids: Optional topic-id filter (e.g. the topics the scheduler reports due)
+        seen_queried: Optional {topic_id: last_queried epoch seconds or None}, as
+            the caller's schedule knows it; topics queried after that are skipped
+
+    Returns:
+        Claimed topics, most overdue first. last_queried is the value before the
+        claim; overdue_seconds is computed from it; queried_at is the new
+        last_queried. Empty if nothing is claimable.
+    """
+    rows = run_cypher(
+        _CLAIM_QUERY,
+        {
+            "n": n,
+            "owner": owner,
+            "lease_s": lease_s,
+            "names": names,
+            "ids": ids,
+            "seen": seen_queried,
+            "never_queried": NEVER_QUERIED_OVERDUE_S,
+        },
+    )
+    if rows:
+        logger.debug(f"Claimed {len(rows)} topic(s) for {owner}: {[r['id'] for r in rows]}")
+    return rows or []
+
+
+def release(topic_id: str, owner: str = WORKER_ID) -> bool:
+    """Release a lease held by owner. Returns False if the lease was lost (expired and re-claimed)."""
+    rows = run_cypher(
+        """
+        MATCH (t:Topic {id: $id})
+        WHERE t.lease_owner = $owner
+        REMOVE t.lease_owner, t.lease_expires_at
+        RETURN t.id AS id
+        """,
+        {"id": topic_id, "owner": owner},
+    )
+    if not rows:
+        logger.warning(f"Lease for topic {topic_id} was no longer held by {owner}")
+        return False
+    return True
+
+
+def extend(topic_id: str, owner: str = WORKER_ID, lease_s: int = TOPIC_LEASE_S) -> bool:
+    """Push a held lease's expiry out by lease_s from now (for long-running topics)."""
+    rows = run_cypher(
+        """
+        MATCH (t:Topic {id: $id})
+        WHERE t.lease_owner = $owner
+        SET t.lease_expires_at = datetime() + duration({seconds: $lease_s})
+        RETURN t.id AS id
+        """,
+        {"id": topic_id, "owner": owner, "lease_s": lease_s},
+    )
+    return bool(rows)
+
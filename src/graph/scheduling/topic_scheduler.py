@@ -0,0 +1,290 @@
+"""
+In-process topic scheduler: a min-heap of next-due times per topic.
+
+The heap is built from the graph once (and resynced every
+TOPIC_SCHEDULER_RESYNC_S to pick up changes made by other processes), then
+kept current by events instead of recomputing every topic each cycle:
+- mark_queried(id)     topic ran, next due = now + its SLA interval
+- on_topic_created(id) new topic, due immediately
+- on_topic_removed(id) dropped from the schedule
+Each event is O(log n). wait_due() sleeps on a condition variable until the
+earliest topic is due, and an event that schedules something earlier wakes
+it at once, so due topics never sit out a long fixed sleep.
+
+SLA interval per topic: the topic's query_interval_s property if set, else
+TOPIC_QUERY_INTERVAL_S. The default of 0 keeps the "least recently queried
+runs next" policy from query_overdue.py (every topic is always due, the heap
+only orders them); set it > 0 to let workers idle between due times.
+
+Several workers each keep their own heap, so a popped topic may have been
+queried by another worker meanwhile. last_queried_snapshot() gives the
+last_queried each due time was computed from; claim_next(seen_queried=...)
+refuses topics queried after that and the caller resyncs them.
+
+Metrics (stats()): queue_depth = topics currently due, lag_s = how long the
+most overdue (previously queried) topic has been past its due time.
+"""
+import heapq
+import itertools
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.graph.neo4j_client import run_cypher
+from src.graph.scheduling.query_overdue import query_overdue_seconds
+from utils import app_logging
+
+logger = app_logging.get_logger(__name__)
+
+# Default SLA: seconds between queries of one topic (0 = always due, staleness order)
+TOPIC_QUERY_INTERVAL_S = float(os.getenv("TOPIC_QUERY_INTERVAL_S", "0"))
+# Full reload from the graph, for topics created/queried by other processes
+TOPIC_SCHEDULER_RESYNC_S = float(os.getenv("TOPIC_SCHEDULER_RESYNC_S", "1800"))
+# Due time for never-queried topics: ahead of everything, left out of lag_s
+NEVER_QUERIED_DUE_AT = 0.0
+
+
+class TopicScheduler:
+    """Min-heap of (due_at, topic_id) with lazy deletion; thread-safe."""
+
+    def __init__(
+        self,
+        default_interval_s: float = TOPIC_QUERY_INTERVAL_S,
+        names: Optional[List[str]] = None,
+    ):
+        self.default_interval_s = default_interval_s
+        self.names = names  # optional topic-name filter (e.g. a single ASSET)
+        self._heap: List[tuple] = []
+        self._due_at: Dict[str, float] = {}  # live entry per topic; heap rows not matching are stale
+        self._interval_s: Dict[str, float] = {}
+        # last_queried (epoch s, None = never) each topic's due time is based on
+        self._last_queried: Dict[str, Optional[float]] = {}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._loaded_at = 0.0
+
+    # ------------------------------------------------------------------ load
+    def load(self, topics: Optional[Iterable[Dict[str, Any]]] = None) -> int:
+        """(Re)build the heap from topic dicts (id, last_queried, query_interval_s). O(n)."""
+        if topics is None:
+            topics = run_cypher(
+                """
+                MATCH (t:Topic)
+                WHERE $names IS NULL OR t.name IN $names
+                RETURN t.id AS id, t.last_queried AS last_queried,
+                       t.query_interval_s AS query_interval_s,
+                       t.lease_expires_at AS lease_expires_at
+                """,
+                {"names": self.names},
+            ) or []
+        now = time.time()
+        due_at: Dict[str, float] = {}
+        intervals: Dict[str, float] = {}
+        last_queried: Dict[str, Optional[float]] = {}
+        for topic in topics:
+            interval = topic.get("query_interval_s")
+            interval = float(interval) if interval is not None else self.default_interval_s
+            intervals[topic["id"]] = interval
+            due_at[topic["id"]] = self._due_from(topic, interval, now)
+            last_queried[topic["id"]] = to_epoch(topic.get("last_queried"))
+        with self._cond:
+            self._due_at = due_at
+            self._interval_s = intervals
+            self._last_queried = last_queried
+            self._heap = [(due, next(self._seq), tid) for tid, due in due_at.items()]
+            heapq.heapify(self._heap)
+            self._loaded_at = now
+            self._cond.notify_all()
+        logger.info(f"Topic scheduler loaded {len(due_at)} topics")
+        return len(due_at)
+
+    @staticmethod
+    def _due_from(topic: Dict[str, Any], interval_s: float, now: float) -> float:
+        if not topic.get("last_queried"):
+            due = NEVER_QUERIED_DUE_AT
+        else:
+            # query_overdue_seconds = seconds since last_queried
+            due = now - query_overdue_seconds(topic) + interval_s
+        lease = topic.get("lease_expires_at")
+        if lease is not None:
+            # Leased by another worker: not ours to run before the lease ends
+            try:
+                due = max(due, lease.to_native().timestamp())
+            except Exception:
+                pass
+        return due
+
+    # ---------------------------------------------------------------- events
+    def schedule(self, topic_id: str, due_at: float, interval_s: Optional[float] = None) -> None:
+        """Set a topic's next due time. O(log n)."""
+        with self._cond:
+            if interval_s is not None:
+                self._interval_s[topic_id] = interval_s
+            self._interval_s.setdefault(topic_id, self.default_interval_s)
+            self._due_at[topic_id] = due_at
+            heapq.heappush(self._heap, (due_at, next(self._seq), topic_id))
+            if self._heap[0][2] == topic_id:
+                self._cond.notify_all()  # new earliest deadline - wake waiters
+
+    def mark_queried(self, topic_id: str, queried_at: Any = None) -> None:
+        """Topic just ran: next due one SLA interval from now.
+
+        queried_at is the last_queried the claim wrote (graph clock); it becomes
+        the topic's seen value for the next claim.
+        """
+        interval = self._interval_s.get(topic_id, self.default_interval_s)
+        with self._cond:
+            self._last_queried[topic_id] = to_epoch(queried_at) if queried_at is not None else time.time()
+        self.schedule(topic_id, time.time() + interval)
+
+    def remove(self, topic_id: str) -> None:
+        """Unschedule a topic (its heap rows become stale and are skipped)."""
+        with self._cond:
+            self._due_at.pop(topic_id, None)
+            self._interval_s.pop(topic_id, None)
+            self._last_queried.pop(topic_id, None)
+
+    def resync(self, topic_ids: List[str]) -> None:
+        """Re-read due times for a few topics from the graph (e.g. after losing a claim race)."""
+        if not topic_ids:
+            return
+        rows = run_cypher(
+            """
+            MATCH (t:Topic)
+            WHERE t.id IN $ids AND ($names IS NULL OR t.name IN $names)
+            RETURN t.id AS id, t.last_queried AS last_queried,
+                   t.query_interval_s AS query_interval_s,
+                   t.lease_expires_at AS lease_expires_at
+            """,
+            {"ids": topic_ids, "names": self.names},
+        ) or []
+        now = time.time()
+        found = set()
+        for topic in rows:
+            interval = topic.get("query_interval_s")
+            interval = float(interval) if interval is not None else self.default_interval_s
+            with self._cond:
+                self._last_queried[topic["id"]] = to_epoch(topic.get("last_queried"))
+            self.schedule(topic["id"], self._due_from(topic, interval, now), interval)
+            found.add(topic["id"])
+        for topic_id in set(topic_ids) - found:
+            self.remove(topic_id)
+
+    def last_queried_snapshot(self, topic_ids: List[str]) -> Dict[str, Optional[float]]:
+        """{id: last_queried epoch or None} as this scheduler knows it, for claim_next(seen_queried=...)."""
+        with self._cond:
+            return {tid: self._last_queried.get(tid) for tid in topic_ids}
+
+    # ----------------------------------------------------------------- waits
+    def _drop_stale(self) -> None:
+        while self._heap:
+            due, _, tid = self._heap[0]
+            if self._due_at.get(tid) == due:
+                return
+            heapq.heappop(self._heap)
+
+    def pop_due(self, n: int = 1) -> List[str]:
+        """Take up to n due topics off the heap, most overdue first. O(k log n).
+
+        Popped topics are out of the schedule until mark_queried/schedule/resync puts them back.
+        """
+        now = time.time()
+        out: List[str] = []
+        with self._cond:
+            while len(out) < n:
+                self._drop_stale()
+                if not self._heap or self._heap[0][0] > now:
+                    break
+                _, _, tid = heapq.heappop(self._heap)
+                del self._due_at[tid]
+                out.append(tid)
+        return out
+
+    def seconds_until_due(self) -> Optional[float]:
+        """Seconds until the earliest topic is due (<= 0 if one is due now, None if empty)."""
+        with self._cond:
+            self._drop_stale()
+            return self._heap[0][0] - time.time() if self._heap else None
+
+    def wait_due(self, n: int = 1, timeout: Optional[float] = None) -> List[str]:
+        """
+        Block until at least one topic is due (or timeout), then pop up to n.
+        Wakes exactly at the earliest due time, or earlier if an event schedules a sooner one.
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        with self._cond:
+            while True:
+                if self._loaded_at and time.time() - self._loaded_at >= TOPIC_SCHEDULER_RESYNC_S:
+                    break
+                self._drop_stale()
+                now = time.time()
+                wait = self._heap[0][0] - now if self._heap else TOPIC_SCHEDULER_RESYNC_S
+                if wait <= 0:
+                    break
+                if deadline is not None:
+                    if now >= deadline:
+                        return []
+                    wait = min(wait, deadline - now)
+                self._cond.wait(wait)
+        if self._loaded_at and time.time() - self._loaded_at >= TOPIC_SCHEDULER_RESYNC_S:
+            self.load()
+        return self.pop_due(n)
+
+    # --------------------------------------------------------------- metrics
+    def stats(self) -> Dict[str, float]:
+        """Topic count, queue depth (topics due now) and lag of the most overdue topic. O(n)."""
+        now = time.time()
+        with self._cond:
+            due = [d for d in self._due_at.values() if d <= now]
+            lags = [now - d for d in due if d != NEVER_QUERIED_DUE_AT]
+            return {
+                "topics": len(self._due_at),
+                "queue_depth": len(due),
+                "never_queried": len(due) - len(lags),
+                "lag_s": round(max(lags), 1) if lags else 0.0,
+                "next_due_in_s": round(max(0.0, min(self._due_at.values()) - now), 1) if self._due_at else None,
+            }
+
+
+def to_epoch(value: Any) -> Optional[float]:
+    """Neo4j DateTime (or datetime) -> epoch seconds; None if never queried.
+
+    Legacy non-datetime values map to 0.0 (long ago): the claim's comparison
+    with them is null, which it accepts.
+    """
+    if not value:
+        return None
+    try:
+        if hasattr(value, "to_native"):
+            value = value.to_native()
+        return value.timestamp()
+    except Exception:
+        return 0.0
+
+
+_scheduler: Optional[TopicScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_topic_scheduler(names: Optional[List[str]] = None) -> TopicScheduler:
+    """Process-wide scheduler, loaded from the graph on first use (names only applies then)."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            scheduler = TopicScheduler(names=names)
+            scheduler.load()
+            _scheduler = scheduler
+    return _scheduler
+
+
+def on_topic_created(topic_id: str) -> None:
+    """New topic: due immediately (no-op until the scheduler has been loaded)."""
+    if _scheduler is not None:
+        _scheduler.schedule(topic_id, NEVER_QUERIED_DUE_AT)
+
+
+def on_topic_removed(topic_id: str) -> None:
+    """Deleted topic: drop it from the schedule (no-op until loaded)."""
+    if _scheduler is not None:
+        _scheduler.remove(topic_id)
@@ -1,6 +1,9 @@
 """Model Configuration for Argos Research Platform
 
-Smart LLM Router with SQLite-based status tracking for optimal server selection.
+Smart LLM Router with pluggable status tracking for optimal server selection:
+busy counters and round-robin state live in a router_state backend
+(LLM_ROUTER_STATE=memory, the in-process default, or sqlite to share state
+between processes on one host).
 
 4-Tier Architecture:
 - SIMPLE: 20B model (local + :8686 + :8787) - Article ingestion, classification, relevance
@@ -11,13 +14,14 @@ Smart LLM Router with SQLite-based status tracking for optimal server selection.
 Automatic busy status tracking and round-robin load balancing for SIMPLE tier.
 """
 
+import asyncio
 import os
-import sqlite3
 import time
+import weakref
 from datetime import datetime
 from contextlib import contextmanager
 from pathlib import Path
-from threading import Lock
+from threading import BoundedSemaphore
 from typing import Optional
 
 from enum import Enum
@@ -31,6 +35,9 @@ from typing import Any, Iterator, AsyncIterator
 
 from utils.app_logging import get_logger
 from src.observability.stats_client import track
+from src.llm.router_state import RouterState, create_router_state
+from src.llm.tokenizer import count_tokens, record_usage
+from src.llm.upstream_guard import UpstreamGuard
 
 logger = get_logger(__name__)
 
@@ -66,12 +73,9 @@ _load_env_file()
 TOKEN_THRESHOLD = 3000  # Requests ≤3k tokens use local, >3k use external (SIMPLE tier)
 LLM_CALL_TIMEOUT_S = 300.0
 LLM_RETRY_ATTEMPTS = 2  # Reduced from 3 - we have fallback logic now
-DB_RETRY_ATTEMPTS = 5
-DB_RETRY_DELAY = 0.1
 
-# OpenRouter free tier rate limiting (16 req/min = ~4s between calls)
+# OpenRouter free tier rate limiting (16 req/min = ~4s between calls, shared token bucket)
 OPENROUTER_MIN_DELAY_S = 4.0  # Minimum seconds between OpenRouter calls
-_openrouter_last_call: float = 0.0  # Timestamp of last OpenRouter call
 
 # Paid 20B cooldown (prevent overspending on SIMPLE tier fallback)
 # At $0.03/M input + $0.14/M output, typical short calls ~$0.00001-0.0001 each
@@ -81,11 +85,15 @@ _paid_20b_calls_today: int = 0
 _paid_20b_reset_date: str = ""  # ISO date string for reset tracking
 
 # OpenRouter upstream rate limit backoff (when the free model is overloaded globally)
-# Waits: 1m → 5m → 15m → 60m → 60m... (keeps trying hourly for 24/7 operation)
-OPENROUTER_UPSTREAM_BACKOFF_S = [60, 300, 900, 3600, 3600, 3600, 3600, 3600]
+# Circuit breaker cooldowns for that server: 1m → 5m → 15m → 60m (then hourly probes).
+# Traffic falls through to the next server meanwhile - no thread sleeps.
+OPENROUTER_UPSTREAM_BACKOFF_S = [60, 300, 900, 3600]
+# Billing/quota errors take the server out for an hour
+BILLING_BACKOFF_S = [3600]
 
-# DeepSeek R1 Free has only 8K context - skip it for long prompts
-DEEPSEEK_R1_CONTEXT_LIMIT = 6000  # Leave room for output tokens
+# Tokens kept free for the completion when checking a server's context_window
+# (e.g. DeepSeek R1 Free has only 8K context - skip it for long prompts)
+CONTEXT_OUTPUT_RESERVE = int(os.getenv("LLM_CONTEXT_OUTPUT_RESERVE", "2048"))
 
 # API Keys from environment (loaded from .env above)
 DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY")
@@ -133,6 +141,7 @@ if not DISABLE_LOCAL_LLM:
         'base_url': 'http://127.0.0.1:8080/v1',
         'model': 'ggml-org/gpt-oss-20b-GGUF',
         'temperature': 0.2,
+        'context_window': 32768,
     }
     _init_logger.info("LLM CONFIG: Added 'local' server (20B llama.cpp)")
 
@@ -144,12 +153,14 @@ if not LOCAL_LLM_ONLY:
             'base_url': 'http://gate04.cfa.handels.gu.se:8686/v1',
             'model': 'openai/gpt-oss-20b',
             'temperature': 0.2,
+            'context_window': 32768,
         },
         'external_b': {
             'provider': 'openai',
             'base_url': 'http://gate04.cfa.handels.gu.se:8787/v1',
             'model': 'openai/gpt-oss-20b',
             'temperature': 0.2,
+            'context_window': 32768,
         },
         # Paid 20B fallback via OpenRouter (DeepInfra: $0.03/M input, $0.14/M output)
         'external_20b_paid': {
@@ -157,6 +168,7 @@ if not LOCAL_LLM_ONLY:
             'base_url': 'https://openrouter.ai/api/v1',
             'model': 'openai/gpt-oss-20b',  # Non-free version
             'temperature': 0.2,
+            'context_window': 131072,
         },
     })
     _init_logger.info("LLM CONFIG: Added external_a, external_b (20B vLLM on :8686, :8787)")
@@ -178,6 +190,7 @@ if not LOCAL_LLM_ONLY:
         'base_url': 'https://openrouter.ai/api/v1',
         'model': 'openai/gpt-oss-120b:free',
         'temperature': 0.2,
+        'context_window': 131072,
     }
     _init_logger.info("LLM CONFIG: Added external_120b (120B via OpenRouter free tier)")
 
@@ -187,6 +200,7 @@ if not LOCAL_LLM_ONLY:
         'base_url': 'https://openrouter.ai/api/v1',
         'model': 'deepseek/deepseek-r1-0528:free',
         'temperature': 0.2,
+        'context_window': 8192,
     }
     _init_logger.info("LLM CONFIG: Added deepseek_r1_free (DeepSeek R1 free, 8K context)")
 
@@ -196,6 +210,7 @@ if not LOCAL_LLM_ONLY:
         'base_url': 'https://openrouter.ai/api/v1',
         'model': 'openai/gpt-oss-120b',  # Non-free version
         'temperature': 0.2,
+        'context_window': 131072,
     }
     _init_logger.info("LLM CONFIG: Added external_120b_paid (120B via GMICloud, $0.02/M)")
 
@@ -205,6 +220,7 @@ if not LOCAL_LLM_ONLY:
         'base_url': 'https://api.deepseek.com',
         'model': 'deepseek-chat',
         'temperature': 0.2,
+        'context_window': 128000,
     }
     _init_logger.info("LLM CONFIG: Added deepseek_paid (DeepSeek v3.2 paid API)")
 
@@ -213,20 +229,69 @@ if not LOCAL_LLM_ONLY:
         'provider': 'anthropic',
         'model': 'claude-sonnet-4-20250514',  # Fast and capable
         'temperature': 0.2,
+        'context_window': 200000,
     }
     _init_logger.info("LLM CONFIG: Added anthropic (Claude for FAST tier)")
 
+# All OpenRouter servers share one rate limit bucket
+for _server_config in SERVERS.values():
+    if 'openrouter.ai' in (_server_config.get('base_url') or ''):
+        _server_config.setdefault('rate_limit_per_min', 60.0 / OPENROUTER_MIN_DELAY_S)
+        _server_config.setdefault('rate_limit_group', 'openrouter')
+
 # Log final server configuration
 _init_logger.info(f"🔧 LLM CONFIG: Final SERVERS = {list(SERVERS.keys())}")
 
-# Database setup
-DB_PATH = Path(__file__).parent / "router_status.db"
-db_lock = Lock()
+# Per-server token buckets + circuit breakers (see upstream_guard)
+upstream_guard = UpstreamGuard(SERVERS)
+
+# Max in-flight calls per tier in this process (caps concurrent fan-out, e.g. per-topic classification)
+TIER_MAX_CONCURRENCY = {
+    ModelTier.SIMPLE: int(os.getenv("LLM_MAX_CONCURRENCY_SIMPLE", "6")),
+    ModelTier.MEDIUM: int(os.getenv("LLM_MAX_CONCURRENCY_MEDIUM", "4")),
+    ModelTier.COMPLEX: int(os.getenv("LLM_MAX_CONCURRENCY_COMPLEX", "4")),
+    ModelTier.FAST: int(os.getenv("LLM_MAX_CONCURRENCY_FAST", "4")),
+}
+_tier_semaphores = {tier: BoundedSemaphore(max(1, n)) for tier, n in TIER_MAX_CONCURRENCY.items()}
+
+
+@contextmanager
+def tier_slot(tier: ModelTier):
+    """Hold one of the tier's in-flight call slots (blocks while the tier is saturated)."""
+    if tier == ModelTier.SIMPLE_LONG_CONTEXT:
+        tier = ModelTier.SIMPLE
+    semaphore = _tier_semaphores[tier]
+    semaphore.acquire()
+    try:
+        yield
+    finally:
+        semaphore.release()
 
 
 def estimate_tokens(text: str) -> int:
-    """Estimate token count using word-based heuristic."""
-    return int(len(text.split()) * 1.3)
+    """Prompt token count (local BPE tokenizer when available, see src.llm.tokenizer)."""
+    return count_tokens(text)
+
+
+def _input_text(input: LanguageModelInput) -> str:
+    """All prompt text in an LLM input (str, message list, or PromptValue from a chain)."""
+    if isinstance(input, str):
+        return input
+    if hasattr(input, 'to_messages'):
+        input = input.to_messages()
+    if isinstance(input, (list, tuple)):
+        parts = []
+        for msg in input:
+            content = getattr(msg, 'content', msg if isinstance(msg, str) else '')
+            parts.append(content if isinstance(content, str) else str(content))
+        return "\n\n".join(parts)
+    return ""
+
+
+def _fits_context(server_id: str, estimated_tokens: int) -> bool:
+    """True if the prompt leaves CONTEXT_OUTPUT_RESERVE tokens free in the server's window."""
+    window = SERVERS.get(server_id, {}).get('context_window')
+    return window is None or estimated_tokens + CONTEXT_OUTPUT_RESERVE <= window
 
 
 def _check_paid_20b_cooldown() -> bool:
@@ -259,148 +324,50 @@ def _check_paid_20b_cooldown() -> bool:
 
 
 class RouterDB:
-    """Simple SQLite-based router status manager for SIMPLE tier load balancing."""
-
-    def __init__(self):
-        self._init_db()
-
-    def _init_db(self):
-        """Initialize database with retry logic."""
-        for attempt in range(DB_RETRY_ATTEMPTS):
-            try:
-                with sqlite3.connect(DB_PATH, timeout=5.0) as conn:
-                    conn.execute("""
-                        CREATE TABLE IF NOT EXISTS router_status (
-                            key TEXT PRIMARY KEY,
-                            value TEXT,
-                            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-                    # Initialize default values for SIMPLE tier load balancing
-                    conn.execute("""
-                        INSERT OR IGNORE INTO router_status (key, value)
-                        VALUES ('local_busy', '0')
-                    """)
-                    conn.execute("""
-                        INSERT OR IGNORE INTO router_status (key, value)
-                        VALUES ('last_external', 'external_a')
-                    """)
-                    # Initialize external server status (20B servers for SIMPLE tier)
-                    conn.execute("""
-                        INSERT OR IGNORE INTO router_status (key, value)
-                        VALUES ('external_a_busy', '0')
-                    """)
-                    conn.execute("""
-                        INSERT OR IGNORE INTO router_status (key, value)
-                        VALUES ('external_b_busy', '0')
-                    """)
-                    conn.execute("""
-                        INSERT OR IGNORE INTO router_status (key, value)
-                        VALUES ('external_a_last_call', datetime('now'))
-                    """)
-                    conn.execute("""
-                        INSERT OR IGNORE INTO router_status (key, value)
-                        VALUES ('external_b_last_call', datetime('now'))
-                    """)
-                    conn.commit()
-                logger.debug("Router database initialized")
-                return
-            except sqlite3.OperationalError as e:
-                if attempt < DB_RETRY_ATTEMPTS - 1:
-                    logger.debug(f"DB init attempt {attempt + 1} failed, retrying: {e}")
-                    time.sleep(DB_RETRY_DELAY * (2 ** attempt))
-                else:
-                    logger.error(f"Failed to initialize router database after {DB_RETRY_ATTEMPTS} attempts: {e}")
-                    raise
-    
-    def _execute_with_retry(self, query: str, params: tuple = (), fetch: bool = False):
-        """Execute database operation with retry logic."""
-        for attempt in range(DB_RETRY_ATTEMPTS):
-            try:
-                with sqlite3.connect(DB_PATH, timeout=5.0) as conn:
-                    cursor = conn.execute(query, params)
-                    if fetch:
-                        result = cursor.fetchone()
-                        return result[0] if result else None
-                    conn.commit()
-                    return
-            except sqlite3.OperationalError as e:
-                if attempt < DB_RETRY_ATTEMPTS - 1:
-                    logger.debug(f"DB operation attempt {attempt + 1} failed, retrying: {e}")
-                    time.sleep(DB_RETRY_DELAY * (2 ** attempt))
-                else:
-                    logger.warning(f"Database operation failed after {DB_RETRY_ATTEMPTS} attempts: {e}")
-                    raise
-    
+    """Router status manager for SIMPLE tier load balancing (backend: see router_state)."""
+
+    def __init__(self, state: Optional[RouterState] = None):
+        self._state = state or create_router_state()
+        logger.debug(f"Router state backend: {type(self._state).__name__}")
+
+    # Busy status is an in-flight counter, so concurrent calls to the same
+    # server (see tier_slot) don't clear each other's flag.
     def is_local_busy(self) -> bool:
         """Check if local server is busy."""
-        try:
-            result = self._execute_with_retry(
-                "SELECT value FROM router_status WHERE key = 'local_busy'", 
-                fetch=True
-            )
-            return result == '1' if result else False
-        except Exception:
-            return False  # Assume not busy if can't check
-    
+        return self.is_external_busy('local')
+
     def set_local_busy(self, busy: bool):
         """Set local server busy status."""
-        try:
-            self._execute_with_retry(
-                "UPDATE router_status SET value = ?, updated_at = CURRENT_TIMESTAMP WHERE key = 'local_busy'",
-                ('1' if busy else '0',)
-            )
-        except Exception as e:
-            logger.warning(f"Failed to update local busy status: {e}")
-    
+        self.set_external_busy('local', busy)
+
     def is_external_busy(self, server_id: str) -> bool:
         """Check if external server is busy."""
         try:
-            result = self._execute_with_retry(
-                f"SELECT value FROM router_status WHERE key = '{server_id}_busy'", 
-                fetch=True
-            )
-            return result == '1' if result else False
+            return int(self._state.get(f"{server_id}_busy") or 0) > 0
         except Exception:
-            return False
+            return False  # Assume not busy if can't check
 
     def set_external_busy(self, server_id: str, busy: bool):
         """Set external server busy status."""
         try:
-            # Update busy status
-            self._execute_with_retry(
-                f"INSERT OR REPLACE INTO router_status (key, value, updated_at) VALUES ('{server_id}_busy', ?, CURRENT_TIMESTAMP)",
-                ('1' if busy else '0',)
-            )
+            self._state.incr(f"{server_id}_busy", 1 if busy else -1)
             # Update last call timestamp if setting to busy
             if busy:
-                self._execute_with_retry(
-                    f"INSERT OR REPLACE INTO router_status (key, value, updated_at) VALUES ('{server_id}_last_call', datetime('now'), CURRENT_TIMESTAMP)",
-                    ()
-                )
+                self._state.set(f"{server_id}_last_call", repr(time.time()))
         except Exception as e:
             logger.warning(f"Failed to update {server_id} busy status: {e}")
 
+    def _last_call(self, server_id: str) -> float:
+        try:
+            return float(self._state.get(f"{server_id}_last_call") or 0.0)
+        except ValueError:
+            return 0.0
+
     def get_least_recently_used_external(self) -> str:
         """Get external server that was called longest ago (ONLY 2 servers now)."""
         try:
-            # Get last call times for ONLY 2 active servers: 8686 and 8787
-            times = {}
-            for server in ['external_a', 'external_b']:
-                time_val = self._execute_with_retry(
-                    f"SELECT value FROM router_status WHERE key = '{server}_last_call'", 
-                    fetch=True
-                )
-                if time_val:
-                    times[server] = time_val
-            
-            # If we don't have all timestamps, fall back to round-robin
-            if len(times) < 2:
-                return self.get_next_external()
-            
-            # Return the one called longest ago (earliest timestamp)
-            return min(times.items(), key=lambda x: x[1])[0]
-            
+            # Never-called servers count as least recently used
+            return min(['external_a', 'external_b'], key=self._last_call)
         except Exception as e:
             logger.warning(f"Failed to get least recently used external: {e}")
             return self.get_next_external()  # Fallback to round-robin
@@ -416,10 +383,7 @@ class RouterDB:
         exclude = exclude or set()
         try:
             # Start from the next server in round-robin order
-            last = self._execute_with_retry(
-                "SELECT value FROM router_status WHERE key = 'last_external'", 
-                fetch=True
-            )
+            last = self._state.get('last_external', 'external_a')
             
             # Define rotation order - ONLY 2 servers now: 8686 and 8787
             rotation = ['external_a', 'external_b']
@@ -435,10 +399,7 @@ class RouterDB:
                     else:
                         logger.debug(f"{server} is free (round-robin position {idx}), selecting it")
                     # Update last_external to maintain round-robin state
-                    self._execute_with_retry(
-                        "UPDATE router_status SET value = ?, updated_at = CURRENT_TIMESTAMP WHERE key = 'last_external'",
-                        (server,)
-                    )
+                    self._state.set('last_external', server)
                     return server
             
             # All busy - pick least recently used
@@ -453,39 +414,37 @@ class RouterDB:
     def get_next_external(self) -> str:
         """Get next external server using round-robin (ONLY 2 servers now)."""
         try:
-            last = self._execute_with_retry(
-                "SELECT value FROM router_status WHERE key = 'last_external'", 
-                fetch=True
-            )
+            last = self._state.get('last_external', 'external_a')
             # Round-robin through ONLY 2 servers: a → b → a (8686 → 8787 → 8686)
             rotation = {
                 'external_a': 'external_b',
                 'external_b': 'external_a'
             }
             next_server = rotation.get(last, 'external_a')
-            
-            self._execute_with_retry(
-                "UPDATE router_status SET value = ?, updated_at = CURRENT_TIMESTAMP WHERE key = 'last_external'",
-                (next_server,)
-            )
+            self._state.set('last_external', next_server)
             return next_server
         except Exception as e:
             logger.warning(f"Failed to get next external server: {e}")
             return 'external_a'
     
-    def get_next_any_server(self) -> str:
-        """Get next free server for SIMPLE tier: local → external_a → external_b."""
-        # Check each server in order, return first free one
-        if 'local' in SERVERS and not self.is_local_busy():
-            return 'local'
+    def get_next_any_server(self, exclude: set[str] = None) -> str:
+        """Get next free server for SIMPLE tier: local → external_a → external_b.
 
-        if 'external_a' in SERVERS and not self.is_external_busy('external_a'):
-            return 'external_a'
-
-        if 'external_b' in SERVERS and not self.is_external_busy('external_b'):
-            return 'external_b'
+        Args:
+            exclude: Set of server IDs to skip (failed, tripped or too small)
+        """
+        exclude = exclude or set()
+        candidates = [s for s in ('local', 'external_a', 'external_b') if s in SERVERS]
 
-        # All busy - fallback to local if available, else external_a
+        # Check each server in order, return first free one
+        for server in candidates:
+            if server not in exclude and not self.is_external_busy(server):
+                return server
+
+        # All busy - first non-excluded server, else local if available, else external_a
+        for server in candidates:
+            if server not in exclude:
+                return server
         if 'local' in SERVERS:
             return 'local'
         return 'external_a' if 'external_a' in SERVERS else 'local'
@@ -593,10 +552,16 @@ def _route_request(tier: ModelTier, estimated_tokens: int = 0, exclude: set[str]
 
     Routing chains (tries in order, skips excluded/unavailable):
     - FAST: anthropic
-    - COMPLEX/MEDIUM: deepseek_r1_free (if <6K tokens) → external_120b → external_120b_paid → deepseek_paid
+    - COMPLEX/MEDIUM: deepseek_r1_free (if it fits in 8K) → external_120b → external_120b_paid → deepseek_paid
     - SIMPLE: local → external_a → external_b (with load balancing)
+
+    Servers whose context_window cannot hold the prompt plus
+    CONTEXT_OUTPUT_RESERVE, and servers whose circuit breaker is open, are
+    skipped up front instead of failing and retrying.
     """
-    exclude = exclude or set()
+    exclude = set(exclude or ())
+    exclude |= {sid for sid in SERVERS if not _fits_context(sid, estimated_tokens)}
+    exclude |= upstream_guard.tripped()
 
     # --- FAST tier: Anthropic Claude ---
     if tier == ModelTier.FAST:
@@ -607,11 +572,9 @@ def _route_request(tier: ModelTier, estimated_tokens: int = 0, exclude: set[str]
 
     # --- COMPLEX/MEDIUM tier: Same fallback chain, token-aware ---
     if tier in (ModelTier.COMPLEX, ModelTier.MEDIUM):
-        # DeepSeek R1 free: only for short prompts (<6K tokens)
-        if (estimated_tokens < DEEPSEEK_R1_CONTEXT_LIMIT and
-            'deepseek_r1_free' in SERVERS and
-            'deepseek_r1_free' not in exclude):
-            logger.debug(f"{tier.value} → deepseek_r1_free (tokens={estimated_tokens} < {DEEPSEEK_R1_CONTEXT_LIMIT})")
+        # DeepSeek R1 free: only for short prompts (8K context, see _fits_context)
+        if 'deepseek_r1_free' in SERVERS and 'deepseek_r1_free' not in exclude:
+            logger.debug(f"{tier.value} → deepseek_r1_free (tokens={estimated_tokens})")
             return 'deepseek_r1_free'
 
         # 120B free (long context, but limited to 1000 req/day shared)
@@ -635,16 +598,17 @@ def _route_request(tier: ModelTier, estimated_tokens: int = 0, exclude: set[str]
     # --- SIMPLE tier: 20B models with load balancing ---
     # Fallback chain: local → external_a → external_b → external_20b_paid (with cooldown)
     if tier in (ModelTier.SIMPLE, ModelTier.SIMPLE_LONG_CONTEXT):
-        if estimated_tokens > TOKEN_THRESHOLD:
+        free_servers = {'local', 'external_a', 'external_b'} & set(SERVERS.keys())
+
+        if estimated_tokens > TOKEN_THRESHOLD and not {'external_a', 'external_b'} <= exclude:
             server_id = router_db.get_next_external_smart(exclude=exclude)
             logger.debug(f"SIMPLE → {server_id} (tokens={estimated_tokens} > {TOKEN_THRESHOLD})")
             return server_id
 
         # Try free servers first
-        free_server = router_db.get_next_any_server()
+        free_server = router_db.get_next_any_server(exclude=exclude)
 
-        # If all free servers have been tried (in exclude set), fall back to paid 20B
-        free_servers = {'local', 'external_a', 'external_b'} & set(SERVERS.keys())
+        # If all free servers have been tried (in exclude set) or are too small, fall back to paid 20B
         if free_servers and free_servers.issubset(exclude):
             # All free servers failed - try paid 20B if under cooldown limit
             if 'external_20b_paid' in SERVERS and 'external_20b_paid' not in exclude:
@@ -659,6 +623,169 @@ def _route_request(tier: ModelTier, estimated_tokens: int = 0, exclude: set[str]
     raise ValueError(f"Unknown tier: {tier}")
 
 
+# ============================================================================
+# CALL HELPERS (shared by the sync and async paths)
+# ============================================================================
+
+# Per-server cap on concurrent async calls (override per server with 'max_concurrency')
+SERVER_MAX_CONCURRENCY = int(os.getenv("LLM_SERVER_MAX_CONCURRENCY", "8"))
+# Opt-in: longest rate-limit wait accepted before routing to another free server of
+# the same tier instead (0 = always wait out the spacing, the default)
+LLM_MAX_RATE_WAIT_S = float(os.getenv("LLM_MAX_RATE_WAIT_S", "0"))
+# Free servers a call may be moved between because of rate spacing (never paid ones)
+_FREE_REROUTE_SERVERS = {
+    ModelTier.SIMPLE: {'local', 'external_a', 'external_b'},
+    ModelTier.SIMPLE_LONG_CONTEXT: {'local', 'external_a', 'external_b'},
+    ModelTier.MEDIUM: {'deepseek_r1_free', 'external_120b'},
+    ModelTier.COMPLEX: {'deepseek_r1_free', 'external_120b'},
+}
+
+# asyncio primitives are bound to one event loop, so semaphores are kept per loop
+_server_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _server_semaphore(server_id: str) -> asyncio.Semaphore:
+    """The running event loop's concurrency semaphore for a server."""
+    per_loop = _server_semaphores.setdefault(asyncio.get_running_loop(), {})
+    semaphore = per_loop.get(server_id)
+    if semaphore is None:
+        limit = SERVERS.get(server_id, {}).get('max_concurrency', SERVER_MAX_CONCURRENCY)
+        semaphore = per_loop[server_id] = asyncio.Semaphore(max(1, limit))
+    return semaphore
+
+
+def _route_and_reserve(tier: ModelTier, estimated_tokens: int, exclude: set[str]) -> tuple[str, float]:
+    """Route a call and reserve its rate-limit slot. Returns (server_id, seconds to wait).
+
+    Servers with a tripped breaker are skipped by _route_request; rate spacing
+    is waited out, by the caller, before it takes a tier slot, busy mark or
+    server semaphore. With LLM_MAX_RATE_WAIT_S set, a free server whose bucket
+    would hold the call longer is passed over for the next free server of the
+    same tier - spacing alone never moves a call to a paid server or another tier.
+    """
+    server_id = _route_request(tier, estimated_tokens, exclude=exclude)
+    free = _FREE_REROUTE_SERVERS.get(tier, set())
+    if LLM_MAX_RATE_WAIT_S <= 0 or server_id not in free:
+        return server_id, upstream_guard.before_call(server_id)
+
+    first = server_id
+    throttled: set[str] = set()
+    while server_id in free and server_id not in throttled:
+        wait_time = upstream_guard.before_call(server_id, max_wait=LLM_MAX_RATE_WAIT_S)
+        if wait_time is not None:
+            return server_id, wait_time
+        throttled.add(server_id)
+        # Only free servers of this tier are candidates (paid ones and other tiers excluded)
+        candidates = exclude | throttled | (set(SERVERS) - free)
+        if set(SERVERS) <= candidates:
+            break
+        server_id = _route_request(tier, estimated_tokens, exclude=candidates)
+        if server_id in free and server_id not in throttled:
+            logger.info(f"⏭️  {first} rate limited beyond {LLM_MAX_RATE_WAIT_S:.0f}s - trying {server_id}")
+    return first, upstream_guard.before_call(first)
+
+
+def _check_response(server_id: str, result: BaseMessage) -> bool:
+    """Log the response. Returns False if the server returned empty content (caller falls back)."""
+    result_type = type(result).__name__
+    has_content = hasattr(result, 'content')
+
+    if not has_content:
+        # Result doesn't have content attribute
+        logger.error(
+            f"❌ UNEXPECTED RESULT FORMAT: {server_id} | "
+            f"result_type={result_type} | has_content={has_content} | "
+            f"result_value={str(result)[:200]}"
+        )
+        return True
+
+    content = str(result.content).strip()
+    content_preview = content[:200] if content else "(empty)"
+    logger.debug(
+        f"📥 LLM RESPONSE | server={server_id} | "
+        f"type={result_type} | has_content={has_content} | "
+        f"length={len(content)} | preview={content_preview}..."
+    )
+    if content:
+        return True
+
+    logger.error(
+        f"❌ SERVER FAILED: {server_id} returned EMPTY response | "
+        f"url={SERVERS.get(server_id, {}).get('base_url')} | "
+        f"result_type={result_type} | has_content_attr={has_content} | "
+        f"content_value='{result.content}' | content_length=0 | "
+        f"This server may be down, overloaded, or hit token limit"
+    )
+    # Log additional result attributes for debugging
+    try:
+        result_attrs = {k: v for k, v in vars(result).items() if not k.startswith('_')}
+        logger.error(f"📋 Result attributes: {result_attrs}")
+    except Exception:
+        pass
+    return False
+
+
+def _classify_llm_error(server_id: str, e: Exception, estimated_tokens: int) -> str:
+    """Log an LLM call error and decide what to do next.
+
+    Returns:
+        "upstream_rate_limit": OpenRouter free model overloaded globally - trip its breaker
+        "billing": quota/billing error - fail fast, no point retrying
+        "context": prompt too long for this server - not a health problem
+        "fallback": anything else - exclude this server and try the next one
+    """
+    error_msg = str(e).lower()
+    logger.error(
+        f"❌ LLM EXCEPTION | server={server_id} | "
+        f"error_type={type(e).__name__} | "
+        f"url={SERVERS.get(server_id, {}).get('base_url')} | "
+        f"tokens={estimated_tokens}"
+    )
+    logger.error(f"📋 Error details: {str(e)[:500]}")
+
+    # Context/token limit exceeded (400 error) - try next server
+    if ('exceed' in error_msg or 'max_num_tokens' in error_msg or
+        ('context' in error_msg and 'length' in error_msg)):
+        logger.warning(f"CONTEXT EXCEEDED on {server_id} - trying fallback")
+        return "context"
+    elif 'timeout' in error_msg:
+        logger.error(f"TIMEOUT ERROR - Request took longer than {LLM_CALL_TIMEOUT_S}s")
+    elif 'connection' in error_msg:
+        logger.error(f"CONNECTION ERROR - Cannot reach server")
+    elif 'token' in error_msg and 'limit' in error_msg:
+        logger.error(f"TOKEN LIMIT ERROR - Request may exceed server capacity")
+    elif 'memory' in error_msg or 'oom' in error_msg:
+        logger.error(f"MEMORY ERROR - Server out of memory")
+    elif 'rate' in error_msg and 'limit' in error_msg:
+        logger.error(f"RATE LIMIT ERROR - Too many requests")
+        # This requires longer waits (minutes to hours) since it's not our rate limit
+        is_openrouter = 'openrouter.ai' in (SERVERS.get(server_id, {}).get('base_url') or '')
+        if is_openrouter and ('upstream' in error_msg or 'temporarily' in error_msg):
+            return "upstream_rate_limit"
+
+    if any(keyword in error_msg for keyword in ['quota', 'billing', 'insufficient', 'credits']):
+        logger.error(f"BILLING/QUOTA error for {server_id}: {e}")
+        return "billing"
+
+    return "fallback"
+
+
+def _record_llm_error(server_id: str, e: Exception, estimated_tokens: int) -> str:
+    """Classify an LLM error (see _classify_llm_error) and update the server's circuit breaker."""
+    kind = _classify_llm_error(server_id, e, estimated_tokens)
+    if kind == "upstream_rate_limit":
+        upstream_guard.trip(server_id, "upstream rate limit", OPENROUTER_UPSTREAM_BACKOFF_S)
+    elif kind == "billing":
+        upstream_guard.trip(server_id, "billing/quota", BILLING_BACKOFF_S)
+    elif kind == "context":
+        upstream_guard.record_success(server_id)  # Server answered - the prompt was the problem
+    else:
+        upstream_guard.record_failure(server_id, type(e).__name__)
+    return kind
+
+
 class RoutedLLM(Runnable[LanguageModelInput, BaseMessage]):
     """Smart LLM router that defers server selection until invoke time.
     
@@ -683,189 +810,84 @@ class RoutedLLM(Runnable[LanguageModelInput, BaseMessage]):
         input: LanguageModelInput,
         config: Optional[RunnableConfig] = None,
         **kwargs: Any
+    ) -> BaseMessage:
+        """Invoke LLM with smart routing, bounded by the tier's concurrency limit."""
+        return self._invoke_with_fallback(input, config, **kwargs)
+
+    def _log_attempt(self, attempt: int, server_id: str, estimated_tokens: int, exclude_servers: set[str]):
+        try:
+            sc = SERVERS.get(server_id, {})
+            attempt_info = f"attempt={attempt+1}/2" if attempt > 0 else "attempt=1/2"
+            excluded_info = f" (excluded={list(exclude_servers)})" if exclude_servers else ""
+            logger.info(
+                f"[LLM INVOKE] {attempt_info} server={server_id} provider={sc.get('provider')} "
+                f"model={sc.get('model')} url={sc.get('base_url')} tokens={estimated_tokens}{excluded_info}"
+            )
+        except Exception:
+            pass
+
+    def _record_success(
+        self, server_id: str, estimated_tokens: int, result: BaseMessage, attempt: int, exclude_servers: set[str]
+    ):
+        # Success! Record real token usage and track the call (tier + server, no message = no master log spam)
+        upstream_guard.record_success(server_id)
+        record_usage(server_id, estimated_tokens, result)
+        track(f"llm_{self.tier.value.lower()}")  # Tier total: llm_simple, llm_medium, etc.
+        track(f"llm_server_{server_id}")  # Per-server: llm_server_external_a, etc.
+        if attempt > 0:
+            content_length = len(str(result.content).strip()) if hasattr(result, 'content') else 'N/A'
+            logger.info(
+                f"✅ SUCCESS after retry | server={server_id} worked after {list(exclude_servers)} failed | "
+                f"response_length={content_length}"
+            )
+
+    def _invoke_with_fallback(
+        self,
+        input: LanguageModelInput,
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any
     ) -> BaseMessage:
         """Invoke LLM with smart routing based on actual input size."""
-        global _openrouter_last_call
-
-        # Extract text from input for token estimation
-        input_text = ""
-        if isinstance(input, str):
-            input_text = input
-        elif isinstance(input, list) and len(input) > 0:
-            # Handle message list - extract content from last message
-            last_msg = input[-1]
-            if hasattr(last_msg, 'content'):
-                input_text = str(last_msg.content)
-        
-        # Estimate tokens
-        estimated_tokens = estimate_tokens(input_text) if input_text else 0
-        
+        # Count prompt tokens (all messages) for routing and context checks
+        estimated_tokens = estimate_tokens(_input_text(input))
+
         # Track failed servers for this request
         exclude_servers = set()
-        
+
         # Try up to 2 times (primary + 1 fallback)
         for attempt in range(2):
-            # Route to appropriate server (excluding failed ones)
-            server_id = _route_request(self.tier, estimated_tokens, exclude=exclude_servers)
-            
-            # Log the routing decision and target
-            try:
-                sc = SERVERS.get(server_id, {})
-                attempt_info = f"attempt={attempt+1}/2" if attempt > 0 else "attempt=1/2"
-                excluded_info = f" (excluded={list(exclude_servers)})" if exclude_servers else ""
-                logger.info(
-                    f"[LLM INVOKE] {attempt_info} server={server_id} provider={sc.get('provider')} "
-                    f"model={sc.get('model')} url={sc.get('base_url')} tokens={estimated_tokens}{excluded_info}"
-                )
-            except Exception:
-                pass
-            
-            # Get LLM for selected server and invoke with busy tracking
+            # Route to appropriate server (excluding failed ones) and reserve its rate-limit slot
+            server_id, wait_time = _route_and_reserve(self.tier, estimated_tokens, exclude_servers)
+            self._log_attempt(attempt, server_id, estimated_tokens, exclude_servers)
+
+            # Per-upstream spacing (e.g. OpenRouter free tier), waited out before holding any slot
+            if wait_time > 0:
+                time.sleep(wait_time)
+
+            # Get LLM for selected server and invoke with tier slot + busy tracking
             llm = self._get_llm_for_server(server_id)
-            with _mark_server_busy(server_id):
+            with tier_slot(self.tier), _mark_server_busy(server_id):
                 try:
-                    # OpenRouter free tier rate limiting (applies to all OpenRouter servers)
-                    if 'openrouter.ai' in SERVERS.get(server_id, {}).get('base_url', ''):
-                        elapsed = time.time() - _openrouter_last_call
-                        if elapsed < OPENROUTER_MIN_DELAY_S:
-                            wait_time = OPENROUTER_MIN_DELAY_S - elapsed
-                            logger.debug(f"⏳ OpenRouter rate limit: waiting {wait_time:.1f}s")
-                            time.sleep(wait_time)
-                        _openrouter_last_call = time.time()
-
                     result = llm.invoke(input, config, **kwargs)
-                    
-                    # Detailed logging of what we got back
-                    result_type = type(result).__name__
-                    has_content = hasattr(result, 'content')
-                    
-                    if has_content:
-                        content = str(result.content).strip()
-                        content_length = len(content)
-                        content_preview = content[:200] if content else "(empty)"
-                        
-                        logger.debug(
-                            f"📥 LLM RESPONSE | server={server_id} | "
-                            f"type={result_type} | has_content={has_content} | "
-                            f"length={content_length} | preview={content_preview}..."
-                        )
-                        
-                        # Check for empty response
-                        if not content:
-                            logger.error(
-                                f"❌ SERVER FAILED: {server_id} returned EMPTY response | "
-                                f"url={SERVERS.get(server_id, {}).get('base_url')} | "
-                                f"result_type={result_type} | has_content_attr={has_content} | "
-                                f"content_value='{result.content}' | content_length=0 | "
-                                f"This server may be down, overloaded, or hit token limit"
-                            )
-                            
-                            # Log additional result attributes for debugging
-                            try:
-                                result_attrs = {k: v for k, v in vars(result).items() if not k.startswith('_')}
-                                logger.error(f"📋 Result attributes: {result_attrs}")
-                            except:
-                                pass
-                            
-                            exclude_servers.add(server_id)
-                            
-                            if attempt < 1:  # Have more attempts
-                                logger.info(f"🔄 RETRYING with different server (excluding {server_id})...")
-                                continue  # Try again with different server
-                            else:
-                                logger.warning(
-                                    f"⚠️  All attempts exhausted - returning empty response | "
-                                    f"failed_servers={list(exclude_servers)}"
-                                )
-                                # Return empty result - sanitizer will handle it
-                    else:
-                        # Result doesn't have content attribute
-                        logger.error(
-                            f"❌ UNEXPECTED RESULT FORMAT: {server_id} | "
-                            f"result_type={result_type} | has_content={has_content} | "
-                            f"result_value={str(result)[:200]}"
-                        )
-                    
-                    # Success! Track the call (tier + server, no message = no master log spam)
-                    track(f"llm_{self.tier.value.lower()}")  # Tier total: llm_simple, llm_medium, etc.
-                    track(f"llm_server_{server_id}")  # Per-server: llm_server_external_a, etc.
-
-                    if attempt > 0:
-                        logger.info(
-                            f"✅ SUCCESS after retry | server={server_id} worked after {list(exclude_servers)} failed | "
-                            f"response_length={content_length if has_content else 'N/A'}"
+
+                    if not _check_response(server_id, result):
+                        upstream_guard.record_failure(server_id, "empty response")
+                        exclude_servers.add(server_id)
+                        if attempt < 1:  # Have more attempts
+                            logger.info(f"🔄 RETRYING with different server (excluding {server_id})...")
+                            continue  # Try again with different server
+                        logger.warning(
+                            f"⚠️  All attempts exhausted - returning empty response | "
+                            f"failed_servers={list(exclude_servers)}"
                         )
+                        # Return empty result - sanitizer will handle it
+
+                    self._record_success(server_id, estimated_tokens, result, attempt, exclude_servers)
                     return result
-                    
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    error_type = type(e).__name__
-                    error_full = str(e)
-                    
-                    # Log detailed error information
-                    logger.error(
-                        f"❌ LLM EXCEPTION | server={server_id} | "
-                        f"error_type={error_type} | "
-                        f"url={SERVERS.get(server_id, {}).get('base_url')} | "
-                        f"tokens={estimated_tokens}"
-                    )
-                    logger.error(f"📋 Error details: {error_full[:500]}")
-                    
-                    # Check for specific error patterns and handle with fallback
-
-                    # Context/token limit exceeded (400 error) - try next server
-                    if ('exceed' in error_msg or 'max_num_tokens' in error_msg or
-                        ('context' in error_msg and 'length' in error_msg)):
-                        logger.warning(f"CONTEXT EXCEEDED on {server_id} - trying fallback")
-                        exclude_servers.add(server_id)
-                        if attempt < 1:
-                            continue  # Retry with different server
-
-                    if 'timeout' in error_msg:
-                        logger.error(f"TIMEOUT ERROR - Request took longer than {LLM_CALL_TIMEOUT_S}s")
-                    elif 'connection' in error_msg:
-                        logger.error(f"CONNECTION ERROR - Cannot reach server")
-                    elif 'token' in error_msg and 'limit' in error_msg:
-                        logger.error(f"TOKEN LIMIT ERROR - Request may exceed server capacity")
-                    elif 'memory' in error_msg or 'oom' in error_msg:
-                        logger.error(f"MEMORY ERROR - Server out of memory")
-                    elif 'rate' in error_msg and 'limit' in error_msg:
-                        logger.error(f"RATE LIMIT ERROR - Too many requests")
-
-                        # OpenRouter upstream rate limit - the free model is overloaded globally
-                        # This requires longer waits (minutes to hours) since it's not our rate limit
-                        is_openrouter = 'openrouter.ai' in SERVERS.get(server_id, {}).get('base_url', '')
-                        if is_openrouter and ('upstream' in error_msg or 'temporarily' in error_msg):
-                            for backoff_attempt, wait_seconds in enumerate(OPENROUTER_UPSTREAM_BACKOFF_S):
-                                wait_mins = wait_seconds / 60
-                                logger.warning(
-                                    f"⏳ OpenRouter upstream rate limit - waiting {wait_mins:.0f}m "
-                                    f"(attempt {backoff_attempt + 1}/{len(OPENROUTER_UPSTREAM_BACKOFF_S)})"
-                                )
-                                time.sleep(wait_seconds)
-
-                                # Retry the request
-                                try:
-                                    _openrouter_last_call = time.time()
-                                    result = llm.invoke(input, config, **kwargs)
-                                    logger.info(f"✅ OpenRouter recovered after {wait_mins:.0f}m wait")
-                                    return result
-                                except Exception as retry_e:
-                                    retry_msg = str(retry_e).lower()
-                                    if '429' in str(retry_e) or 'rate' in retry_msg:
-                                        logger.warning(f"⏳ Still rate limited, will retry...")
-                                        continue
-                                    else:
-                                        # Different error - re-raise
-                                        raise retry_e
-
-                            # Exhausted all backoff attempts
-                            logger.error(f"❌ OpenRouter still rate limited after {sum(OPENROUTER_UPSTREAM_BACKOFF_S)/3600:.1f}h of retries")
-                            raise
 
-                    # Fail fast on billing/quota errors (no point retrying)
-                    if any(keyword in error_msg for keyword in ['quota', 'billing', 'insufficient', 'credits']):
-                        logger.error(f"BILLING/QUOTA error for {server_id}: {e}")
+                except Exception as e:
+                    # Upstream rate limits trip the server's breaker and fall through to the next server
+                    if _record_llm_error(server_id, e, estimated_tokens) == "billing":
                         raise
 
                     # For any server error - try fallback if we have attempts left
@@ -875,30 +897,63 @@ class RoutedLLM(Runnable[LanguageModelInput, BaseMessage]):
                         continue
 
                     # All attempts exhausted
-                    logger.error(f"ALL SERVERS FAILED | excluded={list(exclude_servers)} | last_error={error_type}")
+                    logger.error(f"ALL SERVERS FAILED | excluded={list(exclude_servers)} | last_error={type(e).__name__}")
                     raise
-    
+
     async def ainvoke(
-        self, 
-        input: LanguageModelInput, 
+        self,
+        input: LanguageModelInput,
         config: Optional[RunnableConfig] = None,
         **kwargs: Any
     ) -> BaseMessage:
-        """Async invoke with smart routing (no busy tracking for async)."""
-        # Same routing logic as invoke
-        input_text = ""
-        if isinstance(input, str):
-            input_text = input
-        elif isinstance(input, list) and len(input) > 0:
-            last_msg = input[-1]
-            if hasattr(last_msg, 'content'):
-                input_text = str(last_msg.content)
-        
-        estimated_tokens = estimate_tokens(input_text) if input_text else 0
-        server_id = _route_request(self.tier, estimated_tokens)
-        llm = self._get_llm_for_server(server_id)
-        return await llm.ainvoke(input, config, **kwargs)
-    
+        """Async invoke with the same routing, fallback and busy tracking as invoke.
+
+        Concurrent calls are capped per server by an asyncio.Semaphore and
+        OpenRouter spacing is awaited rather than slept, so one event loop can
+        run many calls at once. Cancelling the task cancels the in-flight
+        request and releases the server's slot and busy mark.
+        """
+        estimated_tokens = estimate_tokens(_input_text(input))
+        exclude_servers = set()
+
+        for attempt in range(2):
+            server_id, wait_time = _route_and_reserve(self.tier, estimated_tokens, exclude_servers)
+            self._log_attempt(attempt, server_id, estimated_tokens, exclude_servers)
+            llm = self._get_llm_for_server(server_id)
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+
+            async with _server_semaphore(server_id):
+                with _mark_server_busy(server_id):
+                    try:
+                        result = await llm.ainvoke(input, config, **kwargs)
+
+                        if not _check_response(server_id, result):
+                            upstream_guard.record_failure(server_id, "empty response")
+                            exclude_servers.add(server_id)
+                            if attempt < 1:
+                                logger.info(f"🔄 RETRYING with different server (excluding {server_id})...")
+                                continue
+                            logger.warning(
+                                f"⚠️  All attempts exhausted - returning empty response | "
+                                f"failed_servers={list(exclude_servers)}"
+                            )
+
+                        self._record_success(server_id, estimated_tokens, result, attempt, exclude_servers)
+                        return result
+
+                    except Exception as e:  # CancelledError is not an Exception - it propagates
+                        if _record_llm_error(server_id, e, estimated_tokens) == "billing":
+                            raise
+
+                        exclude_servers.add(server_id)
+                        if attempt < 1:
+                            logger.info(f"🔄 RETRYING with different server (excluding {server_id})...")
+                            continue
+
+                        logger.error(f"ALL SERVERS FAILED | excluded={list(exclude_servers)} | last_error={type(e).__name__}")
+                        raise
+
     def stream(
         self, 
         input: LanguageModelInput, 
@@ -907,15 +962,7 @@ class RoutedLLM(Runnable[LanguageModelInput, BaseMessage]):
     ) -> Iterator[BaseMessage]:
         """Stream with smart routing and busy tracking."""
         # Same routing logic as invoke
-        input_text = ""
-        if isinstance(input, str):
-            input_text = input
-        elif isinstance(input, list) and len(input) > 0:
-            last_msg = input[-1]
-            if hasattr(last_msg, 'content'):
-                input_text = str(last_msg.content)
-        
-        estimated_tokens = estimate_tokens(input_text) if input_text else 0
+        estimated_tokens = estimate_tokens(_input_text(input))
         server_id = _route_request(self.tier, estimated_tokens)
         llm = self._get_llm_for_server(server_id)
         
@@ -928,22 +975,47 @@ class RoutedLLM(Runnable[LanguageModelInput, BaseMessage]):
         config: Optional[RunnableConfig] = None,
         **kwargs: Any
     ) -> AsyncIterator[BaseMessage]:
-        """Async stream with smart routing (no busy tracking for async)."""
-        # Same routing logic as invoke
-        input_text = ""
-        if isinstance(input, str):
-            input_text = input
-        elif isinstance(input, list) and len(input) > 0:
-            last_msg = input[-1]
-            if hasattr(last_msg, 'content'):
-                input_text = str(last_msg.content)
-        
-        estimated_tokens = estimate_tokens(input_text) if input_text else 0
-        server_id = _route_request(self.tier, estimated_tokens)
-        llm = self._get_llm_for_server(server_id)
-        
-        async for chunk in llm.astream(input, config, **kwargs):
-            yield chunk
+        """Async stream with routing, per-server concurrency cap and busy tracking.
+
+        Falls back to the next server if the first one fails before yielding
+        anything; once chunks have been yielded, errors propagate (a partial
+        stream cannot be replayed).
+        """
+        estimated_tokens = estimate_tokens(_input_text(input))
+        exclude_servers = set()
+
+        for attempt in range(2):
+            server_id, wait_time = _route_and_reserve(self.tier, estimated_tokens, exclude_servers)
+            self._log_attempt(attempt, server_id, estimated_tokens, exclude_servers)
+            llm = self._get_llm_for_server(server_id)
+            started = False
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+
+            async with _server_semaphore(server_id):
+                with _mark_server_busy(server_id):
+                    try:
+                        async for chunk in llm.astream(input, config, **kwargs):
+                            started = True
+                            yield chunk
+
+                        upstream_guard.record_success(server_id)
+                        track(f"llm_{self.tier.value.lower()}")
+                        track(f"llm_server_{server_id}")
+                        return
+
+                    except Exception as e:
+                        kind = _record_llm_error(server_id, e, estimated_tokens)
+                        if started or kind == "billing":
+                            raise
+
+                        exclude_servers.add(server_id)
+                        if attempt < 1:
+                            logger.info(f"🔄 RETRYING with different server (excluding {server_id})...")
+                            continue
+
+                        logger.error(f"ALL SERVERS FAILED | excluded={list(exclude_servers)} | last_error={type(e).__name__}")
+                        raise
     
     # For any other methods, we need to route at call time
     # This is tricky since we don't have input, so we'll use a default routing
@@ -0,0 +1,126 @@
+"""
+Router state backends for RouterDB (busy counters, round-robin cursor, last-call times).
+
+- MemoryRouterState (default): dict + lock, for single-process workers.
+  Every read/write is a dict operation, no I/O.
+- SQLiteRouterState: one persistent WAL-mode connection per process on a
+  shared file, for deployments where several worker processes route
+  against the same servers.
+
+Select with LLM_ROUTER_STATE=memory|sqlite (LLM_ROUTER_STATE_PATH for the file).
+"""
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+from utils.app_logging import get_logger
+
+logger = get_logger(__name__)
+
+ROUTER_STATE_BACKEND = os.getenv("LLM_ROUTER_STATE", "memory").lower()
+ROUTER_STATE_PATH = Path(
+    os.getenv("LLM_ROUTER_STATE_PATH", str(Path(__file__).parent / "router_status.db"))
+)
+
+
+class RouterState(ABC):
+    """Small key/value store with an atomic counter. Values are strings."""
+
+    @abstractmethod
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        ...
+
+    @abstractmethod
+    def incr(self, key: str, delta: int) -> int:
+        """Atomically add delta to an integer value (floored at 0). Returns the new value."""
+
+
+class MemoryRouterState(RouterState):
+    """Lock-protected in-process state."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._values: dict[str, str] = {}
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        with self._lock:
+            return self._values.get(key, default)
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._values[key] = value
+
+    def incr(self, key: str, delta: int) -> int:
+        with self._lock:
+            value = max(0, int(self._values.get(key) or 0) + delta)
+            self._values[key] = str(value)
+            return value
+
+
+class SQLiteRouterState(RouterState):
+    """Shared-file state over a single persistent WAL-mode connection."""
+
+    def __init__(self, path: Path = ROUTER_STATE_PATH):
+        self._lock = Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=5.0, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS router_status (
+                key TEXT PRIMARY KEY,
+                value TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM router_status WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else default
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO router_status (key, value, updated_at) "
+                "VALUES (?, ?, CURRENT_TIMESTAMP)",
+                (key, value),
+            )
+
+    def incr(self, key: str, delta: int) -> int:
+        # Single statement, so concurrent processes cannot lose updates
+        with self._lock:
+            row = self._conn.execute(
+                """
+                INSERT INTO router_status (key, value, updated_at)
+                VALUES (?1, MAX(0, ?2), CURRENT_TIMESTAMP)
+                ON CONFLICT(key) DO UPDATE SET
+                    value = MAX(0, CAST(value AS INTEGER) + ?2),
+                    updated_at = CURRENT_TIMESTAMP
+                RETURNING value
+                """,
+                (key, delta),
+            ).fetchone()
+        return int(row[0])
+
+
+def create_router_state(backend: str = ROUTER_STATE_BACKEND) -> RouterState:
+    """Build the configured backend (falls back to memory if sqlite cannot be opened)."""
+    if backend == "sqlite":
+        try:
+            return SQLiteRouterState()
+        except sqlite3.Error as e:
+            logger.warning(f"SQLite router state unavailable ({e}), using in-process state")
+    elif backend != "memory":
+        logger.warning(f"Unknown LLM_ROUTER_STATE={backend!r}, using in-process state")
+    return MemoryRouterState()
@@ -0,0 +1,188 @@
+"""
+Token counting for LLM routing, plus recorded usage from real responses.
+
+Backends (LLM_TOKENIZER=auto|tiktoken|hf|heuristic):
+- tiktoken: local BPE vocabulary (o200k_base, the gpt-oss family encoding).
+  The encoding file is downloaded once into $TIKTOKEN_CACHE_DIR, which
+  tiktoken reads itself (unset = a temp dir that may not survive restarts).
+  Set it in the worker environment (.env), e.g. to ~/.cache/tiktoken, and
+  pre-seed it for workers without network access: `make tokenizer-cache`
+  (or `python -m src.llm.tokenizer`) at build time, or copy/mount the dir.
+- hf: any HuggingFace tokenizer.json at LLM_TOKENIZER_PATH (e.g. DeepSeek's).
+- heuristic: max(words * 1.3, chars / 4) - the old estimate, hardened for
+  whitespace-poor text such as JSON.
+auto tries tiktoken, then hf (if a path is set), then heuristic.
+
+Prompts are built from shared templates, so texts are counted per paragraph
+with an LRU cache: the fixed instruction blocks are tokenized once per
+process and only the variable parts cost BPE work. Paragraph splits can
+shift the total by a token or so per boundary, which is fine for routing.
+"""
+import os
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Callable, Optional
+
+from utils.app_logging import get_logger
+
+logger = get_logger(__name__)
+
+TOKENIZER_BACKEND = os.getenv("LLM_TOKENIZER", "auto").lower()
+TOKENIZER_PATH = os.getenv("LLM_TOKENIZER_PATH", "")
+TIKTOKEN_ENCODING = os.getenv("LLM_TIKTOKEN_ENCODING", "o200k_base")
+TOKEN_CACHE_SIZE = int(os.getenv("LLM_TOKEN_CACHE_SIZE", "4096"))
+# Where the Makefile / seeding script put tiktoken's cache when TIKTOKEN_CACHE_DIR is unset
+DEFAULT_TIKTOKEN_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tiktoken")
+
+_encode_len: Optional[Callable[[str], int]] = None
+_backend_name = ""
+_init_lock = Lock()
+
+
+def _heuristic_len(text: str) -> int:
+    return int(max(len(text.split()) * 1.3, len(text) / 4))
+
+
+def _load_tiktoken() -> Callable[[str], int]:
+    import tiktoken
+    encoding = tiktoken.get_encoding(TIKTOKEN_ENCODING)
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+def seed_tiktoken_cache() -> str:
+    """Download the tiktoken encoding into $TIKTOKEN_CACHE_DIR. Returns the directory."""
+    cache_dir = os.getenv("TIKTOKEN_CACHE_DIR")
+    if not cache_dir:
+        raise ValueError("TIKTOKEN_CACHE_DIR not set (tiktoken would cache in a temp dir)")
+    os.makedirs(cache_dir, exist_ok=True)
+    _load_tiktoken()("warm up")
+    return cache_dir
+
+
+def _load_hf() -> Callable[[str], int]:
+    if not TOKENIZER_PATH:
+        raise ValueError("LLM_TOKENIZER_PATH not set")
+    from tokenizers import Tokenizer
+    tokenizer = Tokenizer.from_file(TOKENIZER_PATH)
+    return lambda text: len(tokenizer.encode(text, add_special_tokens=False).ids)
+
+
+def _init_backend() -> None:
+    global _encode_len, _backend_name
+    with _init_lock:
+        if _encode_len is not None:
+            return
+        order = {
+            "auto": ["tiktoken", "hf"] if TOKENIZER_PATH else ["tiktoken"],
+            "tiktoken": ["tiktoken"],
+            "hf": ["hf"],
+        }.get(TOKENIZER_BACKEND, [])
+        loaders = {"tiktoken": _load_tiktoken, "hf": _load_hf}
+        for name in order:
+            try:
+                fn = loaders[name]()
+                fn("warm up")
+                _encode_len, _backend_name = fn, name
+                logger.info(f"LLM tokenizer: {name}")
+                return
+            except Exception as e:
+                logger.warning(f"LLM tokenizer '{name}' unavailable ({type(e).__name__}: {e})")
+        _encode_len, _backend_name = _heuristic_len, "heuristic"
+        if TOKENIZER_BACKEND == "heuristic":
+            logger.info("LLM tokenizer: heuristic (words * 1.3 / chars / 4)")
+        else:
+            logger.warning(
+                "LLM tokenizer: falling back to heuristic (words * 1.3 / chars / 4) - "
+                f"routing estimates are degraded; seed "
+                f"{os.getenv('TIKTOKEN_CACHE_DIR') or 'TIKTOKEN_CACHE_DIR (unset)'} with "
+                "`python -m src.llm.tokenizer` or set LLM_TOKENIZER_PATH"
+            )
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _count_segment(segment: str) -> int:
+    return _encode_len(segment)
+
+
+def count_tokens(text: str) -> int:
+    """Number of prompt tokens in text (cached per paragraph)."""
+    if not text:
+        return 0
+    if _encode_len is None:
+        _init_backend()
+    return sum(_count_segment(part) for part in text.split("\n\n"))
+
+
+def tokenizer_info() -> dict:
+    """Active backend and LRU cache statistics."""
+    info = _count_segment.cache_info()
+    return {
+        "backend": _backend_name or "uninitialized",
+        "cache_hits": info.hits,
+        "cache_misses": info.misses,
+        "cache_size": info.currsize,
+    }
+
+
+# ============================================================================
+# RECORDED USAGE
+# ============================================================================
+_usage_lock = Lock()
+_usage: dict[str, dict[str, int]] = {}
+
+
+def extract_usage(result: Any) -> Optional[tuple[int, int]]:
+    """(prompt_tokens, completion_tokens) reported by the provider, if any."""
+    usage = getattr(result, "usage_metadata", None)
+    if usage:
+        return int(usage.get("input_tokens") or 0), int(usage.get("output_tokens") or 0)
+    metadata = getattr(result, "response_metadata", None) or {}
+    usage = metadata.get("token_usage") or metadata.get("usage")
+    if usage:
+        prompt = usage.get("prompt_tokens", usage.get("input_tokens", 0))
+        completion = usage.get("completion_tokens", usage.get("output_tokens", 0))
+        return int(prompt or 0), int(completion or 0)
+    return None
+
+
+def record_usage(server_id: str, estimated_tokens: int, result: Any) -> None:
+    """Accumulate estimated vs actual prompt tokens and completion tokens per server."""
+    usage = extract_usage(result)
+    with _usage_lock:
+        stats = _usage.setdefault(server_id, {
+            "calls": 0,
+            "calls_with_usage": 0,
+            "estimated_prompt_tokens": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+        })
+        stats["calls"] += 1
+        if usage is None:
+            return
+        stats["calls_with_usage"] += 1
+        stats["estimated_prompt_tokens"] += estimated_tokens
+        stats["prompt_tokens"] += usage[0]
+        stats["completion_tokens"] += usage[1]
+
+
+def get_usage_stats() -> dict[str, dict[str, float]]:
+    """
+    Per-server token usage. estimate_ratio = actual / estimated prompt tokens
+    (> 1 means the estimate undercounts; use it to tune thresholds).
+    """
+    with _usage_lock:
+        out = {}
+        for server_id, stats in _usage.items():
+            row: dict[str, float] = dict(stats)
+            if stats["estimated_prompt_tokens"]:
+                row["estimate_ratio"] = round(
+                    stats["prompt_tokens"] / stats["estimated_prompt_tokens"], 3
+                )
+            out[server_id] = row
+        return out
+
+
+if __name__ == "__main__":
+    # Pre-seed the encoding cache (build step for offline workers)
+    os.environ.setdefault("TIKTOKEN_CACHE_DIR", DEFAULT_TIKTOKEN_CACHE_DIR)
+    print(f"tiktoken {TIKTOKEN_ENCODING} cached in {seed_tiktoken_cache()}")
@@ -0,0 +1,197 @@
+"""
+Per-upstream rate limiting and circuit breaking for RoutedLLM.
+
+Each server in SERVERS gets:
+- a token bucket (only if its config sets 'rate_limit_per_min'; servers with
+  the same 'rate_limit_group' share one bucket): callers reserve a slot and
+  wait out only their own share of the spacing, or pass max_wait to be
+  refused and route to another server when the wait would be too long
+- a circuit breaker:
+    closed    - normal traffic
+    open      - tripped; _route_request skips the server until the cooldown ends
+    half_open - cooldown over; one probe call is let through, success closes
+                the breaker, failure re-opens it with the next (longer) cooldown
+
+Backoff belongs to the server, not to the calling thread: an upstream rate
+limit on one free model trips that server's breaker and traffic falls through
+to the next server in the chain instead of sleeping for up to an hour.
+"""
+import os
+import time
+from threading import Lock
+from typing import Optional, Sequence
+
+from utils.app_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Consecutive failures (timeouts, connection errors, empty responses) before a breaker opens
+FAILURE_THRESHOLD = int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", "3"))
+# Cooldown ladder for generic failures (seconds); each re-open moves one step up
+FAILURE_COOLDOWN_S = [30, 60, 120, 300, 600]
+# Half-open probe considered lost (never reported back) after this long
+PROBE_TIMEOUT_S = 300.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class TokenBucket:
+    """Token bucket with reservations: reserve() never blocks, it returns how long to wait."""
+
+    def __init__(self, rate_per_s: float, burst: float = 1.0):
+        self.rate_per_s = rate_per_s
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_s)
+        self._updated = now
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Take one token (possibly going into debt). Returns seconds until it is valid,
+        or None without taking it if that would be longer than max_wait.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            tokens = self._tokens - 1
+            wait_time = 0.0 if tokens >= 0 else -tokens / self.rate_per_s
+            if max_wait is not None and wait_time > max_wait:
+                return None
+            self._tokens = tokens
+            return wait_time
+
+
+class CircuitBreaker:
+    """closed / open / half_open state for one upstream server."""
+
+    def __init__(self, server_id: str):
+        self.server_id = server_id
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0  # position on the cooldown ladder
+        self.open_until = 0.0
+        self.probe_started: Optional[float] = None
+        self.last_reason = ""
+        self._lock = Lock()
+
+    def available(self) -> bool:
+        """Can traffic be routed here now (without changing state)?"""
+        with self._lock:
+            now = time.time()
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                return now >= self.open_until
+            # HALF_OPEN: only while no probe is in flight
+            return self.probe_started is None or now - self.probe_started > PROBE_TIMEOUT_S
+
+    def before_call(self) -> None:
+        with self._lock:
+            now = time.time()
+            if self.state == OPEN and now >= self.open_until:
+                self.state = HALF_OPEN
+                logger.info(f"🟡 Circuit half-open for {self.server_id} - sending probe")
+            if self.state == HALF_OPEN:
+                self.probe_started = now
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info(f"🟢 Circuit closed for {self.server_id} (recovered)")
+            self.state = CLOSED
+            self.failures = 0
+            self.trips = 0
+            self.probe_started = None
+
+    def record_failure(self, reason: str) -> None:
+        """Count a failure; opens the breaker at FAILURE_THRESHOLD (immediately when half-open)."""
+        with self._lock:
+            self.failures += 1
+            self.last_reason = reason
+            if self.state == HALF_OPEN or self.failures >= FAILURE_THRESHOLD:
+                self._open(FAILURE_COOLDOWN_S)
+
+    def trip(self, reason: str, ladder: Sequence[float]) -> None:
+        """Open immediately with the next cooldown on the given ladder (e.g. upstream rate limit)."""
+        with self._lock:
+            self.last_reason = reason
+            self._open(ladder)
+
+    def _open(self, ladder: Sequence[float]) -> None:
+        cooldown = ladder[min(self.trips, len(ladder) - 1)]
+        self.trips += 1
+        self.state = OPEN
+        self.open_until = time.time() + cooldown
+        self.probe_started = None
+        self.failures = 0
+        logger.warning(
+            f"🔴 Circuit open for {self.server_id} for {cooldown:.0f}s "
+            f"(trip {self.trips}, reason={self.last_reason})"
+        )
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "trips": self.trips,
+                "open_for_s": max(0.0, round(self.open_until - time.time(), 1)) if self.state == OPEN else 0.0,
+                "last_reason": self.last_reason,
+            }
+
+
+class UpstreamGuard:
+    """Token buckets + circuit breakers for every configured server."""
+
+    def __init__(self, servers: dict[str, dict]):
+        self._breakers = {sid: CircuitBreaker(sid) for sid in servers}
+        self._buckets: dict[str, TokenBucket] = {}
+        groups: dict[str, TokenBucket] = {}
+        for sid, cfg in servers.items():
+            if cfg.get('rate_limit_per_min'):
+                group = cfg.get('rate_limit_group', sid)
+                if group not in groups:
+                    groups[group] = TokenBucket(cfg['rate_limit_per_min'] / 60.0)
+                self._buckets[sid] = groups[group]
+
+    def _breaker(self, server_id: str) -> CircuitBreaker:
+        breaker = self._breakers.get(server_id)
+        if breaker is None:
+            breaker = self._breakers.setdefault(server_id, CircuitBreaker(server_id))
+        return breaker
+
+    def tripped(self) -> set[str]:
+        """Servers whose breaker currently rejects traffic."""
+        return {sid for sid, breaker in self._breakers.items() if not breaker.available()}
+
+    def before_call(self, server_id: str, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Reserve a rate-limit slot and mark the call start (half-open probe). Returns
+        seconds to wait, or None (nothing reserved) if the wait would exceed max_wait.
+        """
+        bucket = self._buckets.get(server_id)
+        wait_time = bucket.reserve(max_wait) if bucket else 0.0
+        if wait_time is None:
+            return None
+        self._breaker(server_id).before_call()
+        if wait_time > 0:
+            logger.debug(f"⏳ {server_id} rate limit: waiting {wait_time:.1f}s")
+        return wait_time
+
+    def record_success(self, server_id: str) -> None:
+        self._breaker(server_id).record_success()
+
+    def record_failure(self, server_id: str, reason: str) -> None:
+        self._breaker(server_id).record_failure(reason)
+
+    def trip(self, server_id: str, reason: str, ladder: Sequence[float]) -> None:
+        self._breaker(server_id).trip(reason, ladder)
+
+    def status(self) -> dict[str, dict]:
+        return {sid: breaker.snapshot() for sid, breaker in self._breakers.items()}
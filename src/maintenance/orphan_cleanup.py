@@ -55,7 +55,11 @@ def delete_article(article_id: str) -> bool:
     RETURN count(a) as deleted
     """
     result = run_cypher(query, {"article_id": article_id})
-    return result and result[0].get("deleted", 0) > 0
+    deleted = bool(result and result[0].get("deleted", 0) > 0)
+    if deleted:
+        from src.vector.indexer import forget_articles
+        forget_articles([article_id])
+    return deleted
 
 
 def run_orphan_cleanup() -> dict:
@@ -1,48 +1,259 @@
 """
 Simple stats tracking client - sends events to backend API.
-Fail fast and loud if tracking breaks.
+
+track() never blocks: events go into a bounded in-memory buffer and a
+background thread posts them in batches over one pooled HTTP session.
+If the backend is unreachable, events are spilled to a local JSONL file
+and replayed after the next successful send. Pending events are drained
+on interpreter exit (or explicitly with flush()); events tracked after
+shutdown() go straight to the spill file.
 """
-import requests
+import atexit
+import json
 import os
+import queue
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
 from typing import Optional
 
+import requests
+
 BACKEND_URL = os.getenv("BACKEND_API_URL", "http://localhost:8000")
 API_KEY = os.getenv("BACKEND_API_KEY", "")
 
+# Max events held in memory; beyond this, events are dropped (and counted)
+BUFFER_SIZE = int(os.getenv("STATS_BUFFER_SIZE", "10000"))
+# Max events per flush, and how long the worker waits to fill a batch
+BATCH_SIZE = int(os.getenv("STATS_BATCH_SIZE", "100"))
+FLUSH_INTERVAL_S = float(os.getenv("STATS_FLUSH_INTERVAL_S", "2"))
+# How long shutdown waits for the buffer to drain
+DRAIN_TIMEOUT_S = float(os.getenv("STATS_DRAIN_TIMEOUT_S", "10"))
+SPILL_PATH = Path(
+    os.getenv(
+        "STATS_SPILL_PATH",
+        str(Path(__file__).resolve().parents[2] / "logs" / "stats_spill.jsonl"),
+    )
+)
+REQUEST_TIMEOUT_S = 5
+
+_queue: "queue.Queue[Optional[dict]]" = queue.Queue(maxsize=BUFFER_SIZE)
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_spill_lock = threading.Lock()
+# Set by shutdown(): later events go straight to the spill file (no new worker at exit)
+_closed = False
+
+# Local aggregates: events tracked per type, and client health counters
+_event_counts: Counter = Counter()
+_client_stats = {"queued": 0, "sent": 0, "failed": 0, "spilled": 0, "dropped": 0, "replayed": 0}
+
 
 def track(event_type: str, message: Optional[str] = None):
     """
-    Track a stat event by calling backend API.
-    
+    Track a stat event (buffered, sent to the backend API in the background).
+
     Args:
         event_type: Event name (e.g., "article_processed", "agent_analysis_triggered")
         message: Optional message for logs (e.g., "eurusd: Neo4j timeout")
-    
+
     Usage:
         track("article_processed")
         track("article_rejected_no_topics", "Article ABC123: LLM found no relevant topics")
         track("agent_analysis_completed")
-    
-    Raises:
-        Exception if backend API call fails (fail fast and loud)
+
+    Never blocks and never raises - stats tracking is non-critical.
     """
-    params = {"event_type": event_type}
+    event = {"event_type": event_type, "ts": time.time()}
     if message:
-        params["message"] = message
-    
-    headers = {}
-    if API_KEY:
-        headers["X-API-Key"] = API_KEY
-    
+        event["message"] = message
+    try:
+        if _closed:
+            raise RuntimeError("stats client shut down")
+        _ensure_worker()
+    except Exception:
+        # After shutdown / during interpreter exit a worker can't be started: keep the event for replay
+        _spill([event])
+        return
+    try:
+        _queue.put_nowait(event)
+    except queue.Full:
+        with _stats_lock:
+            _client_stats["dropped"] += 1
+        return
+    with _stats_lock:
+        _event_counts[event_type] += 1
+        _client_stats["queued"] += 1
+
+
+def flush(timeout: float = DRAIN_TIMEOUT_S) -> bool:
+    """
+    Wait until every buffered event has been sent (or spilled).
+    Returns False if the buffer did not drain within timeout.
+    """
+    deadline = time.monotonic() + timeout
+    with _queue.all_tasks_done:
+        while _queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            _queue.all_tasks_done.wait(remaining)
+    return True
+
+
+def get_stats() -> dict:
+    """Local event counts per type plus client counters (sent, failed, spilled, dropped...)."""
+    with _stats_lock:
+        return {
+            "events": dict(_event_counts),
+            **_client_stats,
+            "buffered": _queue.qsize(),
+        }
+
+
+def shutdown(timeout: float = DRAIN_TIMEOUT_S) -> None:
+    """Drain the buffer and stop the background worker. Safe to call more than once."""
+    global _worker, _closed
+    with _worker_lock:
+        _closed = True
+        worker = _worker
+        _worker = None
+    if worker is None:
+        return
+    flush(timeout)
     try:
-        response = requests.post(
-            f"{BACKEND_URL}/api/stats/track",
-            params=params,
-            headers=headers,
-            timeout=5
-        )
-        response.raise_for_status()
+        _queue.put_nowait(None)  # stop sentinel
+    except queue.Full:
+        return
+    worker.join(timeout=1)
+
+
+def _ensure_worker() -> None:
+    global _worker
+    if _worker is not None:
+        return
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_run, name="stats-flush", daemon=True)
+            _worker.start()
+            atexit.register(shutdown)
+
+
+def _run() -> None:
+    session = requests.Session()
+    headers = {"X-API-Key": API_KEY} if API_KEY else {}
+    while True:
+        batch = [_queue.get()]
+        if batch[0] is None:
+            _queue.task_done()
+            break
+        stop = False
+        deadline = time.monotonic() + FLUSH_INTERVAL_S
+        while len(batch) < BATCH_SIZE:
+            try:
+                event = _queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if event is None:
+                stop = True
+                _queue.task_done()
+                break
+            batch.append(event)
+        try:
+            if _send_batch(session, headers, batch):
+                _replay_spill(session, headers)
+        finally:
+            for _ in batch:
+                _queue.task_done()
+        if stop:
+            break
+    session.close()
+
+
+def _post(session: requests.Session, headers: dict, event: dict) -> None:
+    params = {"event_type": event["event_type"]}
+    if event.get("message"):
+        params["message"] = event["message"]
+    response = session.post(
+        f"{BACKEND_URL}/api/stats/track",
+        params=params,
+        headers=headers,
+        timeout=REQUEST_TIMEOUT_S,
+    )
+    response.raise_for_status()
+
+
+def _send_batch(session: requests.Session, headers: dict, batch: list[dict]) -> bool:
+    """Post events in order; on the first failure spill the rest. Returns True if all sent."""
+    for i, event in enumerate(batch):
+        try:
+            _post(session, headers, event)
+        except Exception as e:
+            # Backend is down - do not pay the timeout once per event
+            print(f"⚠️ Stats tracking failed (non-blocking), spilling {len(batch) - i} event(s): {e}", file=sys.stderr)
+            with _stats_lock:
+                _client_stats["sent"] += i
+                _client_stats["failed"] += 1
+            _spill(batch[i:])
+            return False
+    with _stats_lock:
+        _client_stats["sent"] += len(batch)
+    return True
+
+
+def _spill(events: list[dict]) -> None:
+    try:
+        with _spill_lock:
+            SPILL_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(SPILL_PATH, "a", encoding="utf-8") as f:
+                for event in events:
+                    f.write(json.dumps(event) + "\n")
+        with _stats_lock:
+            _client_stats["spilled"] += len(events)
     except Exception as e:
-        # Log but don't crash - stats tracking is non-critical
-        import sys
-        print(f"⚠️ Stats tracking failed (non-blocking): {e}", file=sys.stderr)
+        print(f"⚠️ Stats spill to {SPILL_PATH} failed, {len(events)} event(s) lost: {e}", file=sys.stderr)
+
+
+def _replay_spill(session: requests.Session, headers: dict) -> None:
+    """Backend is reachable again: resend spilled events (failures are re-spilled)."""
+    replay_path = SPILL_PATH.with_suffix(".replaying")
+    with _spill_lock:
+        try:
+            if replay_path.exists():
+                # Left over from a replay that couldn't read it: append newer spills and retry
+                if SPILL_PATH.exists():
+                    with open(replay_path, "a", encoding="utf-8") as out:
+                        out.write(SPILL_PATH.read_text(encoding="utf-8"))
+                    SPILL_PATH.unlink()
+            elif SPILL_PATH.exists():
+                SPILL_PATH.replace(replay_path)
+            else:
+                return
+        except OSError as e:
+            print(f"⚠️ Stats spill replay could not claim {SPILL_PATH}: {e}", file=sys.stderr)
+            return
+    events = []
+    try:
+        with open(replay_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    pass  # Torn line from an interrupted write - skip it, keep the rest
+    except OSError as e:
+        # Leave the file in place; the next replay merges newer spills into it
+        print(f"⚠️ Stats spill replay failed to read {replay_path}: {e}", file=sys.stderr)
+        return
+    replay_path.unlink(missing_ok=True)
+    for start in range(0, len(events), BATCH_SIZE):
+        chunk = events[start:start + BATCH_SIZE]
+        if not _send_batch(session, headers, chunk):
+            _spill(events[start + BATCH_SIZE:])
+            return
+        with _stats_lock:
+            _client_stats["replayed"] += len(chunk)
@@ -13,7 +13,7 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from src.observability.stats_client import track, BACKEND_URL, API_KEY
+from src.observability.stats_client import track, flush, get_stats, BACKEND_URL, API_KEY
 
 
 def test_stats_connection():
@@ -29,6 +29,9 @@ def test_stats_connection():
     print("Test 1: Sending test event...")
     try:
         track("test_event", "Testing stats client connection")
+        flush()
+        if get_stats()["failed"]:
+            raise RuntimeError(f"Backend unreachable, events spilled: {get_stats()}")
         print("✅ SUCCESS: Event tracked successfully!")
     except Exception as e:
         print(f"❌ FAILED: {e}")
@@ -46,6 +49,9 @@ def test_stats_connection():
     print("Test 2: Sending event with message...")
     try:
         track("test_event_with_message", "This is a test message with details")
+        flush()
+        if get_stats()["failed"]:
+            raise RuntimeError(f"Backend unreachable, events spilled: {get_stats()}")
         print("✅ SUCCESS: Event with message tracked!")
     except Exception as e:
         print(f"❌ FAILED: {e}")
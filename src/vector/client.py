@@ -1,23 +1,69 @@
-"""Qdrant client. Simple. Fail fast."""
+"""Qdrant client. Simple. Fail fast.
+
+VECTOR_BACKEND=local swaps Qdrant for the embedded exact-kNN store in
+local_store.py (no server needed, qdrant-client optional) behind the same
+functions below.
+"""
 import os
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
-from qdrant_client import QdrantClient
-from qdrant_client.models import (
-    VectorParams, Distance, PointStruct,
-    Filter, FieldCondition, Range
-)
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timezone
 from utils.app_logging import get_logger
 
+try:
+    from qdrant_client import QdrantClient
+    from qdrant_client.models import (
+        VectorParams, Distance, PointStruct, PointIdsList,
+        SetPayload, SetPayloadOperation,
+        Filter, FieldCondition, MatchAny, Range
+    )
+    QDRANT_AVAILABLE = True
+except ImportError:  # only VECTOR_BACKEND=local works without it
+    QDRANT_AVAILABLE = False
+
 logger = get_logger(__name__)
 
 COLLECTION = "saga_articles"
 VECTOR_SIZE = 384  # BAAI/bge-small-en-v1.5 dimension
 
+# Points per upsert request, and how many requests upsert_many sends at once
+UPSERT_BATCH_SIZE = int(os.getenv("QDRANT_UPSERT_BATCH_SIZE", "128"))
+UPSERT_PARALLEL = int(os.getenv("QDRANT_UPSERT_PARALLEL", "1"))
+
+# Payload fields filtered server-side by search()
+PAYLOAD_INDEXES = {
+    "topics": "keyword",
+    "pub_ts": "float",  # published time, epoch seconds
+    "importance": "integer",
+}
+
+# qdrant (default) | local
+VECTOR_BACKEND = os.getenv("VECTOR_BACKEND", "qdrant").lower()
+
+# Fixed namespace: the same article_id maps to the same point in every process
+POINT_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "saga-graph/articles")
+
 _client = None
+_local_store = None
+_local_lock = threading.Lock()
+
 
+def _local():
+    """Embedded store for VECTOR_BACKEND=local, or None when using Qdrant."""
+    global _local_store
+    if VECTOR_BACKEND != "local":
+        return None
+    if _local_store is None:
+        with _local_lock:
+            if _local_store is None:
+                from .local_store import LocalVectorStore
+                _local_store = LocalVectorStore(VECTOR_SIZE)
+    return _local_store
 
-def get_client() -> QdrantClient:
+
+def get_client() -> "QdrantClient":
     """Get Qdrant client. Creates collection if needed."""
     global _client
     if _client is None:
@@ -63,30 +109,212 @@ def _ensure_collection():
             vectors_config=VectorParams(size=VECTOR_SIZE, distance=Distance.COSINE)
         )
         logger.info(f"Created collection: {COLLECTION}")
+    # Idempotent: existing indexes are left as they are
+    for field, schema in PAYLOAD_INDEXES.items():
+        client.create_payload_index(collection_name=COLLECTION, field_name=field, field_schema=schema)
+
+
+def point_id(article_id: str) -> str:
+    """Stable Qdrant point ID for an article (UUIDv5), so re-indexing overwrites."""
+    return str(uuid.uuid5(POINT_NAMESPACE, article_id))
 
 
 def upsert(article_id: str, vector: List[float], payload: Dict) -> bool:
     """Insert or update article."""
+    return upsert_many([(article_id, vector, payload)]) == 1
+
+
+def upsert_many(
+    items: Iterable[Tuple[str, List[float], Dict]],
+    batch_size: int = UPSERT_BATCH_SIZE,
+    parallel: int = UPSERT_PARALLEL,
+    wait: bool = True,
+) -> int:
+    """
+    Insert or update many articles: (article_id, vector, payload) tuples.
+
+    Sends one request per batch_size points, up to `parallel` requests at a
+    time. wait=False returns once Qdrant has accepted the batches instead of
+    after they are applied. Returns the number of points sent.
+    """
+    local = _local()
+    if local is not None:
+        return local.upsert(
+            (point_id(article_id), vector, {**payload, "article_id": article_id})
+            for article_id, vector, payload in items
+        )
     client = get_client()
-    point_id = abs(hash(article_id)) % (2**63)
-    client.upsert(
+    points = [
+        PointStruct(id=point_id(article_id), vector=vector, payload={**payload, "article_id": article_id})
+        for article_id, vector, payload in items
+    ]
+    batches = [points[i:i + batch_size] for i in range(0, len(points), batch_size)]
+
+    def send(batch: List["PointStruct"]) -> None:
+        client.upsert(collection_name=COLLECTION, points=batch, wait=wait)
+
+    if parallel > 1 and len(batches) > 1:
+        with ThreadPoolExecutor(max_workers=min(parallel, len(batches))) as executor:
+            list(executor.map(send, batches))
+    else:
+        for batch in batches:
+            send(batch)
+    return len(points)
+
+
+def existing_article_ids(article_ids: List[str]) -> set:
+    """Which of these articles already have a point (one request, no vectors or payloads)."""
+    if not article_ids:
+        return set()
+    by_point = {point_id(a): a for a in article_ids}
+    local = _local()
+    if local is not None:
+        return {by_point[pid] for pid in local.retrieve(by_point)}
+    records = get_client().retrieve(
         collection_name=COLLECTION,
-        points=[PointStruct(id=point_id, vector=vector, payload={**payload, "article_id": article_id})]
+        ids=list(by_point),
+        with_payload=False,
+        with_vectors=False,
     )
-    return True
+    return {by_point[str(r.id)] for r in records}
+
+
+def set_payloads(payloads: Dict[str, Dict]) -> int:
+    """Merge payload fields into existing points, keeping vectors (one request)."""
+    if not payloads:
+        return 0
+    local = _local()
+    if local is not None:
+        return local.set_payloads({point_id(a): p for a, p in payloads.items()})
+    get_client().batch_update_points(
+        collection_name=COLLECTION,
+        update_operations=[
+            SetPayloadOperation(set_payload=SetPayload(payload=payload, points=[point_id(article_id)]))
+            for article_id, payload in payloads.items()
+        ],
+    )
+    return len(payloads)
+
+
+def delete_articles(article_ids: List[str]) -> int:
+    """Delete the points of these articles (missing points are ignored)."""
+    if not article_ids:
+        return 0
+    local = _local()
+    if local is not None:
+        local.delete(point_id(a) for a in article_ids)
+        return len(article_ids)
+    get_client().delete(
+        collection_name=COLLECTION,
+        points_selector=PointIdsList(points=[point_id(a) for a in article_ids]),
+    )
+    return len(article_ids)
+
+
+def delete_legacy_points(batch_size: int = 1000) -> int:
+    """
+    Delete points stored under the old integer IDs (abs(hash(article_id))).
+    Those IDs changed per process, so every reindex left another copy behind.
+    """
+    if _local() is not None:
+        return 0  # the local store never had them
+    client = get_client()
+    deleted = 0
+    offset = None
+    while True:
+        records, offset = client.scroll(
+            collection_name=COLLECTION,
+            limit=batch_size,
+            offset=offset,
+            with_payload=False,
+            with_vectors=False,
+        )
+        legacy = [r.id for r in records if isinstance(r.id, int)]
+        if legacy:
+            client.delete(collection_name=COLLECTION, points_selector=PointIdsList(points=legacy))
+            deleted += len(legacy)
+        if offset is None:
+            break
+    if deleted:
+        logger.info(f"Deleted {deleted} legacy integer-ID points")
+    return deleted
+
+
+def to_timestamp(value) -> Optional[float]:
+    """Epoch seconds from a datetime, neo4j DateTime, ISO string or number (None if unparseable)."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if hasattr(value, "to_native"):
+        value = value.to_native()
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return None
+
+
+def build_filter(
+    topic_ids: Optional[List[str]] = None,
+    published_after=None,
+    published_before=None,
+    min_importance: Optional[int] = None,
+) -> Optional["Filter"]:
+    """Qdrant filter for search(); None when no condition is given."""
+    must = []
+    if topic_ids:
+        must.append(FieldCondition(key="topics", match=MatchAny(any=list(topic_ids))))
+    after, before = to_timestamp(published_after), to_timestamp(published_before)
+    if after is not None or before is not None:
+        must.append(FieldCondition(key="pub_ts", range=Range(gte=after, lte=before)))
+    if min_importance is not None:
+        must.append(FieldCondition(key="importance", range=Range(gte=min_importance)))
+    return Filter(must=must) if must else None
 
 
 def search(
     vector: List[float],
     limit: int = 10,
-    min_score: float = 0.5
+    min_score: float = 0.5,
+    topic_ids: Optional[List[str]] = None,
+    published_after=None,
+    published_before=None,
+    min_importance: Optional[int] = None,
 ) -> List[Dict]:
-    """Search similar articles. All indexed articles are Tier 2+ and recent."""
+    """
+    Search similar articles. All indexed articles are Tier 2+ and recent.
+
+    Optional filters run inside Qdrant on indexed payload fields, so `limit`
+    hits come back already restricted:
+        topic_ids: article is about any of these topics
+        published_after / published_before: datetime, ISO string or epoch seconds
+        min_importance: highest ABOUT importance >= this
+    """
+    local = _local()
+    if local is not None:
+        hits = local.search(
+            vector,
+            limit=limit,
+            min_score=min_score,
+            topic_ids=topic_ids,
+            published_after=to_timestamp(published_after),
+            published_before=to_timestamp(published_before),
+            min_importance=min_importance,
+        )
+        return [{**payload, "score": score, "source_type": "local"} for _, score, payload in hits]
+
     client = get_client()
 
     results = client.search(
         collection_name=COLLECTION,
         query_vector=vector,
+        query_filter=build_filter(topic_ids, published_after, published_before, min_importance),
         limit=limit,
         with_payload=True,
         score_threshold=min_score
@@ -97,5 +325,8 @@ def search(
 
 def count() -> int:
     """Count vectors."""
+    local = _local()
+    if local is not None:
+        return local.count()
     client = get_client()
     return client.get_collection(COLLECTION).points_count
@@ -6,9 +6,14 @@ warnings.filterwarnings("ignore", message=".*FlagEmbedding.*deprecated.*")
 warnings.filterwarnings("ignore", message=".*JinaEmbedding.*deprecated.*")
 warnings.filterwarnings("ignore", module="fastembed.*")
 
-from typing import List
+import atexit
+import threading
+from typing import List, Optional
+
+import numpy as np
 from fastembed import TextEmbedding
 from utils.app_logging import get_logger
+from .embedding_cache import EMBEDDING_CACHE_ENABLED, EmbeddingCache
 
 logger = get_logger(__name__)
 
@@ -19,6 +24,8 @@ logger = get_logger(__name__)
 MODEL = "BAAI/bge-small-en-v1.5"
 VECTOR_SIZE = 384
 _model = None
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
 
 
 def _get_model() -> TextEmbedding:
@@ -29,13 +36,37 @@ def _get_model() -> TextEmbedding:
     return _model
 
 
+def _get_cache() -> Optional[EmbeddingCache]:
+    global _cache
+    if not EMBEDDING_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = EmbeddingCache(MODEL, VECTOR_SIZE)
+                atexit.register(_cache.flush)
+    return _cache
+
+
+def _compute(texts: List[str]) -> np.ndarray:
+    return np.asarray(list(_get_model().embed(texts)), dtype=np.float32)
+
+
 def embed(text: str) -> List[float]:
     """Embed single text."""
-    embeddings = list(_get_model().embed([text]))
-    return embeddings[0].tolist()
+    return embed_batch([text])[0]
 
 
 def embed_batch(texts: List[str]) -> List[List[float]]:
-    """Embed batch."""
-    embeddings = list(_get_model().embed(texts))
-    return [e.tolist() for e in embeddings]
+    """Embed batch. Texts already embedded (same model, same content) come from the cache."""
+    if not texts:
+        return []
+    cache = _get_cache()
+    vectors = cache.get_or_compute(texts, _compute) if cache is not None else _compute(texts)
+    return vectors.tolist()
+
+
+def get_cache_stats() -> dict:
+    """Embedding cache size and hit rate (empty if the cache is disabled)."""
+    cache = _get_cache()
+    return cache.stats() if cache is not None else {}
@@ -0,0 +1,183 @@
+"""
+Persistent embedding cache keyed by (model, sha256(text)).
+
+Layout (one directory per model, under EMBEDDING_CACHE_DIR):
+    vectors.f32   memmap float32 [capacity, dim]   - the embeddings
+    keys.u64      memmap uint64  [capacity, 2]     - first 16 bytes of sha256(model \\0 text)
+    ticks.u64     memmap uint64  [capacity]        - last-use counter, 0 = empty slot
+The key -> slot dict is rebuilt from keys.u64 on open. Lookups hash every
+text, then gather all hit rows with one fancy-indexed read; misses are
+written with one fancy-indexed write. When full, the least recently used
+slots are evicted (one argpartition per batch).
+
+Only one process can own a cache directory (advisory flock). Any other
+process that opens it gets an in-memory cache of the same capacity instead
+of risking a corrupted index.
+"""
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from utils.app_logging import get_logger
+
+logger = get_logger(__name__)
+
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE", "1") != "0"
+EMBEDDING_CACHE_DIR = Path(
+    os.getenv(
+        "EMBEDDING_CACHE_DIR",
+        str(Path(__file__).resolve().parents[2] / "data" / "embedding_cache"),
+    )
+)
+# Max cached vectors per model (100k x 384 floats = ~150MB on disk, paged in on demand)
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "100000"))
+
+
+class EmbeddingCache:
+    """Fixed-capacity LRU of embeddings, memory-mapped to disk when possible."""
+
+    def __init__(self, model: str, dim: int, capacity: int = EMBEDDING_CACHE_SIZE,
+                 directory: Optional[Path] = EMBEDDING_CACHE_DIR):
+        self.model = model
+        self.dim = dim
+        self.capacity = capacity
+        self.persistent = False
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._lock_file = None
+        self._tick = 0
+        self._slots: Dict[bytes, int] = {}
+
+        if directory is not None and self._open_files(directory / re.sub(r"[^A-Za-z0-9._-]", "_", model)):
+            self.persistent = True
+        else:
+            self._vectors = np.zeros((capacity, dim), dtype=np.float32)
+            self._keys = np.zeros((capacity, 2), dtype=np.uint64)
+            self._ticks = np.zeros(capacity, dtype=np.uint64)
+
+        used = np.flatnonzero(self._ticks)
+        for slot in used:
+            self._slots[self._keys[slot].tobytes()] = int(slot)
+        if used.size:
+            self._tick = int(self._ticks.max())
+        logger.info(
+            f"Embedding cache: {len(self._slots)}/{capacity} vectors for {model} "
+            f"({'memmap' if self.persistent else 'in-memory'})"
+        )
+
+    def _open_files(self, path: Path) -> bool:
+        try:
+            import fcntl
+            path.mkdir(parents=True, exist_ok=True)
+            self._lock_file = open(path / "lock", "w")
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except (ImportError, OSError) as e:
+            logger.info(f"Embedding cache at {path} unavailable ({e}), using in-memory cache")
+            if self._lock_file is not None:
+                self._lock_file.close()
+                self._lock_file = None
+            return False
+
+        def open_array(name: str, dtype, shape) -> np.memmap:
+            file = path / name
+            expected = int(np.prod(shape)) * np.dtype(dtype).itemsize
+            if file.exists() and file.stat().st_size != expected:
+                # Capacity or dimension changed: start over
+                logger.warning(f"Embedding cache file {file} has the wrong size, recreating")
+                file.unlink()
+            mode = "r+" if file.exists() else "w+"
+            return np.memmap(file, dtype=dtype, mode=mode, shape=shape)
+
+        self._vectors = open_array("vectors.f32", np.float32, (self.capacity, self.dim))
+        self._keys = open_array("keys.u64", np.uint64, (self.capacity, 2))
+        self._ticks = open_array("ticks.u64", np.uint64, (self.capacity,))
+        return True
+
+    def key(self, text: str) -> bytes:
+        return hashlib.sha256(f"{self.model}\0{text}".encode("utf-8")).digest()[:16]
+
+    def get_or_compute(self, texts: Sequence[str], compute: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        """
+        Embeddings for texts as a float32 [len(texts), dim] array. Only cache
+        misses (deduplicated) are passed to compute, in one call.
+        """
+        keys = [self.key(t) for t in texts]
+        out = np.empty((len(texts), self.dim), dtype=np.float32)
+
+        with self._lock:
+            slots = np.fromiter((self._slots.get(k, -1) for k in keys), dtype=np.int64, count=len(keys))
+            hit_rows = np.flatnonzero(slots >= 0)
+            if hit_rows.size:
+                out[hit_rows] = self._vectors[slots[hit_rows]]
+                self._tick += 1
+                self._ticks[slots[hit_rows]] = self._tick
+            self.hits += int(hit_rows.size)
+
+        miss_rows = np.flatnonzero(slots < 0)
+        if not miss_rows.size:
+            return out
+
+        # Deduplicate misses so repeated texts in one batch are embedded once
+        first_row: Dict[bytes, int] = {}
+        for row in miss_rows:
+            first_row.setdefault(keys[row], int(row))
+        unique_rows = list(first_row.values())
+        computed = np.asarray(compute([texts[r] for r in unique_rows]), dtype=np.float32)
+        by_key = {keys[r]: i for i, r in enumerate(unique_rows)}
+        out[miss_rows] = computed[[by_key[keys[r]] for r in miss_rows]]
+
+        with self._lock:
+            self.misses += len(unique_rows)
+            self._store([keys[r] for r in unique_rows], computed)
+        return out
+
+    def _store(self, keys: List[bytes], vectors: np.ndarray) -> None:
+        # Another thread may have stored some of these meanwhile
+        new = [(i, k) for i, k in enumerate(keys) if k not in self._slots]
+        if not new:
+            return
+        new = new[-self.capacity:]
+        free = np.flatnonzero(self._ticks == 0)[:len(new)]
+        if free.size < len(new):
+            # Evict the least recently used slots in one pass
+            need = len(new) - free.size
+            used = np.flatnonzero(self._ticks)
+            victims = used[np.argpartition(self._ticks[used], need - 1)[:need]]
+            for slot in victims:
+                self._slots.pop(self._keys[slot].tobytes(), None)
+            free = np.concatenate([free, victims])
+        rows = np.fromiter((i for i, _ in new), dtype=np.int64, count=len(new))
+        key_array = np.frombuffer(b"".join(k for _, k in new), dtype=np.uint64).reshape(-1, 2)
+        self._tick += 1
+        self._vectors[free] = vectors[rows]
+        self._keys[free] = key_array
+        self._ticks[free] = self._tick
+        for slot, (_, k) in zip(free, new):
+            self._slots[k] = int(slot)
+
+    def flush(self) -> None:
+        """Write dirty memmap pages to disk (no-op for the in-memory cache)."""
+        if self.persistent:
+            with self._lock:
+                self._vectors.flush()
+                self._keys.flush()
+                self._ticks.flush()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "model": self.model,
+                "size": len(self._slots),
+                "capacity": self.capacity,
+                "persistent": self.persistent,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
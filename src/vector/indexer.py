@@ -1,124 +1,296 @@
 """Index Tier 2+ articles into Qdrant."""
 import gc
+import os
 from datetime import datetime, timezone
+from typing import Iterator, List, Optional
 from .embedder import embed, embed_batch
-from .client import upsert, count
+from .client import (
+    upsert, upsert_many, delete_legacy_points, count,
+    existing_article_ids, set_payloads, delete_articles, to_timestamp,
+)
 from src.graph.neo4j_client import run_cypher
 from utils.app_logging import get_logger
 
 logger = get_logger(__name__)
 
 
-def index_article(article_id: str) -> bool:
-    """Index article if any importance score >= 2."""
-    query = """
-    MATCH (a:Article {id: $article_id})-[r:ABOUT]->(t:Topic)
-    WHERE r.importance_risk >= 2
-       OR r.importance_opportunity >= 2
-       OR r.importance_trend >= 2
-       OR r.importance_catalyst >= 2
-    RETURN a.id AS id, a.title AS title, a.summary AS summary,
-           a.content AS content, a.url AS url, a.source AS source,
-           a.published_date AS pub_date, collect(DISTINCT t.id) AS topics
-    LIMIT 1
-    """
-    result = run_cypher(query, {"article_id": article_id})
-    if not result:
-        return False
+# Articles with any importance score >= 2 on any topic are indexed
+_QUALIFIES = """
+    r.importance_risk >= 2
+    OR r.importance_opportunity >= 2
+    OR r.importance_trend >= 2
+    OR r.importance_catalyst >= 2
+"""
+# Highest of the four importance scores on one ABOUT edge
+_IMPORTANCE = """
+    reduce(m = 0, x IN [r.importance_risk, r.importance_opportunity,
+                        r.importance_trend, r.importance_catalyst]
+           | CASE WHEN coalesce(x, 0) > m THEN x ELSE m END)
+"""
+_ARTICLE_FIELDS = """
+    a.id AS id, a.title AS title, a.summary AS summary,
+    a.content AS content, a.url AS url, a.source AS source,
+    coalesce(a.published_at, a.published_date) AS pub_date
+"""
 
-    article = result[0]
+# Articles per Neo4j page during reindex (keyset pagination on a.id)
+REINDEX_PAGE_SIZE = int(os.getenv("VECTOR_REINDEX_PAGE_SIZE", "500"))
+
+
+def _embed_text(article: dict) -> str:
     content = article.get("content") or article.get("summary") or ""
-    if not content:
-        return False
+    return f"{article.get('title', '')}. {article.get('summary', '')}. {content[:1000]}"
 
-    embed_text = f"{article.get('title', '')}. {article.get('summary', '')}. {content[:1000]}"
-    vector = embed(embed_text)
 
-    payload = {
+def _payload(article: dict) -> dict:
+    content = article.get("content") or article.get("summary") or ""
+    return {
         "title": article.get("title"),
         "summary": article.get("summary"),
         "content": content[:2000],
         "url": article.get("url"),
         "source": article.get("source"),
-        "pub_date": str(article.get("pub_date", "")),
+        "pub_date": str(article.get("pub_date") or ""),
+        "pub_ts": to_timestamp(article.get("pub_date")),
         "topics": article.get("topics", []),
+        "importance": article.get("importance"),
         "indexed_at": datetime.now(timezone.utc).isoformat()
     }
 
-    upsert(article_id, vector, payload)
+
+def _apply_links(article: dict) -> dict:
+    """Fold qualifying [{topic, importance}] links into topics + max importance."""
+    links = article.pop("links", None) or []
+    article["topics"] = list(dict.fromkeys(link["topic"] for link in links))
+    article["importance"] = max((link["importance"] for link in links), default=None)
+    return article
+
+
+def index_article(article_id: str) -> bool:
+    """Index article if any importance score >= 2."""
+    query = f"""
+    MATCH (a:Article {{id: $article_id}})-[r:ABOUT]->(t:Topic)
+    WHERE {_QUALIFIES}
+    RETURN {_ARTICLE_FIELDS},
+           collect(DISTINCT t.id) AS topics, max({_IMPORTANCE}) AS importance
+    LIMIT 1
+    """
+    result = run_cypher(query, {"article_id": article_id})
+    if not result:
+        return False
+
+    article = result[0]
+    if not (article.get("content") or article.get("summary")):
+        return False
+
+    upsert(article_id, embed(_embed_text(article)), _payload(article))
     logger.info(f"Indexed {article_id}")
     return True
 
 
-def reindex_all(batch_size: int = 10) -> dict:
-    """Reindex ALL articles with any importance >= 2. Run once after setup.
+def index_articles(article_ids: List[str]) -> int:
+    """Batch form of index_article: one query, one embedding batch, one bulk upsert."""
+    if not article_ids:
+        return 0
+    query = f"""
+    MATCH (a:Article)
+    WHERE a.id IN $ids
+    WITH a, [(a)-[r:ABOUT]->(t:Topic) WHERE {_QUALIFIES} | {{topic: t.id, importance: {_IMPORTANCE}}}] AS links
+    WHERE size(links) > 0
+    RETURN {_ARTICLE_FIELDS}, links
+    """
+    articles = [
+        _apply_links(a) for a in run_cypher(query, {"ids": list(article_ids)}) or []
+        if a.get("content") or a.get("summary")
+    ]
+    if not articles:
+        return 0
+    vectors = embed_batch([_embed_text(a) for a in articles])
+    indexed = upsert_many((a["id"], v, _payload(a)) for a, v in zip(articles, vectors))
+    logger.info(f"Indexed {indexed} articles")
+    return indexed
+
 
-    Uses small batches and gc to stay within 2GB memory limit.
+def iter_indexable_articles(page_size: int = REINDEX_PAGE_SIZE) -> Iterator[List[dict]]:
     """
-    query = """
-    MATCH (a:Article)-[r:ABOUT]->(t:Topic)
-    WHERE r.importance_risk >= 2
-       OR r.importance_opportunity >= 2
-       OR r.importance_trend >= 2
-       OR r.importance_catalyst >= 2
-    WITH a, collect(DISTINCT t.id) AS topics
-    RETURN a.id AS id, a.title AS title, a.summary AS summary,
-           a.content AS content, a.url AS url, a.source AS source,
-           a.published_date AS pub_date, topics
+    Yield pages of articles that qualify for the index, ordered by id.
+
+    Keyset pagination (a.id > last id seen), so each page is one bounded
+    query and only one page is held in memory at a time.
     """
-    articles = run_cypher(query, {})
-    total = len(articles)
-    stats = {"indexed": 0, "skipped": 0, "failed": 0}
+    query = f"""
+    MATCH (a:Article)
+    WHERE a.id > $after
+    WITH a ORDER BY a.id
+    WITH a, [(a)-[r:ABOUT]->(t:Topic) WHERE {_QUALIFIES} | {{topic: t.id, importance: {_IMPORTANCE}}}] AS links
+    WHERE size(links) > 0
+    WITH a, links LIMIT $limit
+    RETURN {_ARTICLE_FIELDS}, links
+    """
+    after = ""
+    while True:
+        page = run_cypher(query, {"after": after, "limit": page_size})
+        if not page:
+            return
+        for article in page:
+            _apply_links(article)
+        yield page
+        if len(page) < page_size:
+            return
+        after = page[-1]["id"]
 
-    logger.info(f"Reindexing {total} articles in batches of {batch_size}")
 
-    for i in range(0, total, batch_size):
-        batch = articles[i:i+batch_size]
-        texts, valid = [], []
+def reindex_all(batch_size: int = 10, page_size: int = REINDEX_PAGE_SIZE, purge_legacy: bool = True) -> dict:
+    """Reindex ALL articles with any importance >= 2. Run once after setup.
 
-        for article in batch:
-            content = article.get("content") or article.get("summary") or ""
-            if not content:
-                stats["skipped"] += 1
-                continue
-            texts.append(f"{article.get('title', '')}. {article.get('summary', '')}. {content[:1000]}")
-            valid.append(article)
+    Streams articles from Neo4j page by page, embeds in small batches and
+    upserts each page in bulk. Point IDs are deterministic, so re-running
+    overwrites instead of duplicating. Stays within a 2GB memory limit.
+    """
+    stats = {"indexed": 0, "skipped": 0, "failed": 0}
+    if purge_legacy:
+        stats["legacy_deleted"] = delete_legacy_points()
 
-        if not texts:
-            continue
+    logger.info(f"Reindexing in pages of {page_size}, embedding batches of {batch_size}")
 
-        try:
-            vectors = embed_batch(texts)
-            for article, vector in zip(valid, vectors):
-                payload = {
-                    "title": article.get("title"),
-                    "summary": article.get("summary"),
-                    "content": (article.get("content") or "")[:2000],
-                    "url": article.get("url"),
-                    "source": article.get("source"),
-                    "pub_date": str(article.get("pub_date", "")),
-                    "topics": article.get("topics", []),
-                    "indexed_at": datetime.now(timezone.utc).isoformat()
-                }
-                upsert(article["id"], vector, payload)
-                stats["indexed"] += 1
-
-            # Progress log every 100 articles
-            if stats["indexed"] % 100 == 0:
-                logger.info(f"Progress: {stats['indexed']}/{total} indexed")
-
-            # Clear memory after each batch
-            del vectors, texts, valid
-            gc.collect()
+    for page in iter_indexable_articles(page_size):
+        points = []
+        for i in range(0, len(page), batch_size):
+            batch = [a for a in page[i:i + batch_size] if a.get("content") or a.get("summary")]
+            stats["skipped"] += min(batch_size, len(page) - i) - len(batch)
+            if not batch:
+                continue
+            try:
+                vectors = embed_batch([_embed_text(a) for a in batch])
+                points.extend((a["id"], v, _payload(a)) for a, v in zip(batch, vectors))
+            except Exception as e:
+                logger.error(f"Embedding batch failed: {e}")
+                stats["failed"] += len(batch)
 
+        try:
+            stats["indexed"] += upsert_many(points)
         except Exception as e:
-            logger.error(f"Batch failed: {e}")
-            stats["failed"] += len(valid)
+            logger.error(f"Upsert failed for page after {page[0]['id']}: {e}")
+            stats["failed"] += len(points)
+
+        logger.info(f"Progress: {stats['indexed']} indexed (through id {page[-1]['id']})")
+
+        # Clear memory after each page
+        del points, page
+        gc.collect()
 
     logger.info(f"Reindex: {stats}")
     return stats
 
 
+# ============================================================================
+# INCREMENTAL SYNC
+# ============================================================================
+# Graph writes that change an article's ABOUT edges (create, re-tier, archive,
+# remove, topic deletion) set a.vector_changed_at. index_changes() walks those
+# articles in (vector_changed_at, id) order from a cursor stored in the graph,
+# so keeping Qdrant in sync costs work proportional to the changes.
+
+# Changed articles per page
+SYNC_PAGE_SIZE = int(os.getenv("VECTOR_SYNC_PAGE_SIZE", "200"))
+# Changes younger than this wait for the next run (their transaction may still be committing)
+SYNC_SAFETY_LAG_S = int(os.getenv("VECTOR_SYNC_SAFETY_LAG_S", "30"))
+_CURSOR_ID = "qdrant_articles"
+_index_ensured = False
+
+
+def _ensure_change_index() -> None:
+    global _index_ensured
+    if not _index_ensured:
+        run_cypher(
+            "CREATE INDEX article_vector_changed_at IF NOT EXISTS "
+            "FOR (a:Article) ON (a.vector_changed_at)"
+        )
+        _index_ensured = True
+
+
+def index_changes(page_size: int = SYNC_PAGE_SIZE, max_pages: Optional[int] = None) -> dict:
+    """
+    Bring Qdrant up to date with ABOUT-edge changes since the last run.
+
+    Per changed article:
+    - newly qualifying (no point yet) -> embed + upsert, batched per page
+    - still qualifying                -> payload-only update (topics, importance)
+    - no longer qualifying            -> point deleted
+    The cursor advances after each page, so a failure is retried next run.
+    """
+    _ensure_change_index()
+    stats = {"indexed": 0, "payload_updated": 0, "deleted": 0, "pages": 0}
+    cursor = run_cypher(
+        "MERGE (c:IndexerCursor {id: $id}) "
+        "RETURN c.changed_at AS changed_at, c.article_id AS article_id",
+        {"id": _CURSOR_ID},
+    )[0]
+    after_at, after_id = cursor["changed_at"], cursor["article_id"] or ""
+
+    query = f"""
+    MATCH (a:Article)
+    WHERE a.vector_changed_at <= datetime() - duration({{seconds: $lag}})
+      AND ($after_at IS NULL
+           OR a.vector_changed_at > $after_at
+           OR (a.vector_changed_at = $after_at AND a.id > $after_id))
+    WITH a ORDER BY a.vector_changed_at, a.id LIMIT $limit
+    RETURN {_ARTICLE_FIELDS}, a.vector_changed_at AS changed_at,
+           [(a)-[r:ABOUT]->(t:Topic) WHERE {_QUALIFIES} | {{topic: t.id, importance: {_IMPORTANCE}}}] AS links
+    """
+    while max_pages is None or stats["pages"] < max_pages:
+        page = run_cypher(query, {
+            "lag": SYNC_SAFETY_LAG_S,
+            "after_at": after_at,
+            "after_id": after_id,
+            "limit": page_size,
+        })
+        if not page:
+            break
+        stats["pages"] += 1
+        for article in page:
+            _apply_links(article)
+
+        qualifying = [a for a in page if a["topics"] and (a.get("content") or a.get("summary"))]
+        keep = {a["id"] for a in qualifying}
+        existing = existing_article_ids(list(keep))
+        new = [a for a in qualifying if a["id"] not in existing]
+        if new:
+            vectors = embed_batch([_embed_text(a) for a in new])
+            stats["indexed"] += upsert_many((a["id"], v, _payload(a)) for a, v in zip(new, vectors))
+        now = datetime.now(timezone.utc).isoformat()
+        stats["payload_updated"] += set_payloads({
+            a["id"]: {
+                "topics": a["topics"],
+                "importance": a["importance"],
+                "pub_ts": to_timestamp(a.get("pub_date")),
+                "indexed_at": now,
+            }
+            for a in qualifying if a["id"] in existing
+        })
+        stats["deleted"] += delete_articles([a["id"] for a in page if a["id"] not in keep])
+
+        after_at, after_id = page[-1]["changed_at"], page[-1]["id"]
+        run_cypher(
+            "MATCH (c:IndexerCursor {id: $id}) SET c.changed_at = $changed_at, c.article_id = $article_id",
+            {"id": _CURSOR_ID, "changed_at": after_at, "article_id": after_id},
+        )
+        if len(page) < page_size:
+            break
+
+    if stats["pages"]:
+        logger.info(f"Vector sync: {stats}")
+    return stats
+
+
+def forget_articles(article_ids: List[str]) -> None:
+    """Drop points of articles deleted from the graph (best effort - Qdrant may be down)."""
+    try:
+        delete_articles(article_ids)
+    except Exception as e:
+        logger.warning(f"Could not delete {len(article_ids)} article point(s) from Qdrant: {e}")
+
+
 if __name__ == "__main__":
     from utils.env_loader import load_env
     load_env()
@@ -0,0 +1,348 @@
+"""
+Embedded vector store: exact cosine kNN over a memory-mapped NumPy matrix.
+
+Stands in for Qdrant when VECTOR_BACKEND=local (CI, benchmarks, laptops
+without a Qdrant server); src/vector/client.py routes upsert/search/count
+and the other point operations here. No dependencies beyond numpy.
+
+Layout under VECTOR_LOCAL_PATH (":memory:" keeps everything in RAM):
+    vectors.f32   float32 [capacity, dim], unit-normalized rows, grown by doubling
+    ops.jsonl     append-only sidecar: row/point-id/payload puts, payload sets, deletes;
+                  replayed on open (and compacted when mostly dead entries)
+
+Search:
+- exact: one blocked matrix multiply (SEARCH_BLOCK_ROWS rows at a time) with a
+  running argpartition top-k, so memory stays bounded for large corpora
+- filters (topics / pub_ts / importance) become row masks from column arrays
+  kept next to the matrix, applied before top-k
+- optional IVF (LOCAL_VECTOR_IVF_LISTS > 0): rows are bucketed by a k-means
+  coarse quantizer trained lazily once the corpus reaches IVF_MIN_ROWS; a query
+  scans only the LOCAL_VECTOR_IVF_PROBES nearest buckets (approximate)
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.app_logging import get_logger
+
+logger = get_logger(__name__)
+
+VECTOR_LOCAL_PATH = os.getenv(
+    "VECTOR_LOCAL_PATH",
+    str(Path(__file__).resolve().parents[2] / "data" / "vector_store"),
+)
+IVF_LISTS = int(os.getenv("LOCAL_VECTOR_IVF_LISTS", "0"))
+IVF_PROBES = int(os.getenv("LOCAL_VECTOR_IVF_PROBES", "8"))
+IVF_MIN_ROWS = int(os.getenv("LOCAL_VECTOR_IVF_MIN_ROWS", "50000"))
+SEARCH_BLOCK_ROWS = 65536
+_INITIAL_CAPACITY = 1024
+_KMEANS_ITERATIONS = 10
+
+
+class LocalVectorStore:
+    """Single-collection cosine store with Qdrant-like point operations."""
+
+    def __init__(self, dim: int, path: str = VECTOR_LOCAL_PATH, ivf_lists: int = IVF_LISTS):
+        self.dim = dim
+        self.ivf_lists = ivf_lists
+        self._lock = threading.RLock()
+        self._dir = None if path == ":memory:" else Path(path)
+        self._rows: Dict[str, int] = {}  # point id -> row
+        self._ids: List[Optional[str]] = []  # row -> point id (None = free)
+        self._payloads: List[Optional[dict]] = []
+        self._free: List[int] = []
+        self._topic_rows: Dict[str, set] = {}
+        self._capacity = 0
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+        self._live = np.zeros(0, dtype=bool)
+        self._pub_ts = np.zeros(0, dtype=np.float64)
+        self._importance = np.zeros(0, dtype=np.int64)
+        self._centroids: Optional[np.ndarray] = None
+        self._assign: Optional[np.ndarray] = None
+        self._ivf_rows_at_train = 0
+        self._log = None
+
+        if self._dir is not None:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            self._open()
+        else:
+            self._grow(_INITIAL_CAPACITY)
+        logger.info(
+            f"Local vector store: {len(self._rows)} points, dim={dim}, "
+            f"{'in-memory' if self._dir is None else self._dir}"
+        )
+
+    # ------------------------------------------------------------- storage
+    def _grow(self, capacity: int) -> None:
+        old = self._capacity
+        if self._dir is None:
+            vectors = np.zeros((capacity, self.dim), dtype=np.float32)
+            vectors[:old] = self._vectors[:old]
+        else:
+            file = self._dir / "vectors.f32"
+            if isinstance(self._vectors, np.memmap):
+                self._vectors.flush()
+            self._vectors = None
+            with open(file, "ab") as f:
+                f.truncate(capacity * self.dim * 4)
+            vectors = np.memmap(file, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+        self._vectors = vectors
+        self._live = np.concatenate([self._live, np.zeros(capacity - old, dtype=bool)])
+        self._pub_ts = np.concatenate([self._pub_ts, np.full(capacity - old, np.nan)])
+        self._importance = np.concatenate([self._importance, np.full(capacity - old, -1, dtype=np.int64)])
+        self._ids.extend([None] * (capacity - old))
+        self._payloads.extend([None] * (capacity - old))
+        self._free.extend(range(capacity - 1, old - 1, -1))
+        if self._assign is not None:
+            self._assign = np.concatenate([self._assign, np.full(capacity - old, -1, dtype=np.int64)])
+        self._capacity = capacity
+
+    def _open(self) -> None:
+        file = self._dir / "vectors.f32"
+        rows_on_disk = file.stat().st_size // (self.dim * 4) if file.exists() else 0
+        self._grow(max(_INITIAL_CAPACITY, rows_on_disk))
+        log_path = self._dir / "ops.jsonl"
+        entries = 0
+        if log_path.exists():
+            with open(log_path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    entries += 1
+                    op = json.loads(line)
+                    if op["op"] == "put":
+                        self._place(op["id"], op["row"], op["payload"])
+                    elif op["op"] == "set":
+                        self._merge_payload(op["id"], op["payload"])
+                    elif op["op"] == "del":
+                        self._remove(op["id"])
+        self._free = np.flatnonzero(~self._live)[::-1].tolist()
+        self._log = open(log_path, "a", encoding="utf-8")
+        if entries > 2 * max(len(self._rows), 1000):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite the sidecar with one put per live point."""
+        log_path = self._dir / "ops.jsonl"
+        tmp = log_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for pid, row in self._rows.items():
+                f.write(json.dumps({"op": "put", "id": pid, "row": row, "payload": self._payloads[row]}) + "\n")
+        self._log.close()
+        tmp.replace(log_path)
+        self._log = open(log_path, "a", encoding="utf-8")
+        logger.info(f"Local vector store sidecar compacted to {len(self._rows)} entries")
+
+    def _append(self, ops: List[dict]) -> None:
+        if self._log is not None and ops:
+            self._log.write("".join(json.dumps(op) + "\n" for op in ops))
+            self._log.flush()
+
+    # ------------------------------------------------------------ row index
+    def _index_payload(self, row: int, payload: dict) -> None:
+        ts = payload.get("pub_ts")
+        self._pub_ts[row] = float(ts) if ts is not None else np.nan
+        importance = payload.get("importance")
+        self._importance[row] = int(importance) if importance is not None else -1
+        for topic in payload.get("topics") or []:
+            self._topic_rows.setdefault(topic, set()).add(row)
+
+    def _unindex_payload(self, row: int) -> None:
+        for topic in (self._payloads[row] or {}).get("topics") or []:
+            rows = self._topic_rows.get(topic)
+            if rows is not None:
+                rows.discard(row)
+
+    def _place(self, pid: str, row: int, payload: dict) -> None:
+        if row >= self._capacity:
+            self._grow(max(row + 1, self._capacity * 2))
+        old = self._rows.get(pid)
+        if old is not None and old != row:
+            self._remove(pid)
+        if self._ids[row] is not None:
+            self._unindex_payload(row)
+            self._rows.pop(self._ids[row], None)
+        self._rows[pid] = row
+        self._ids[row] = pid
+        self._payloads[row] = payload
+        self._live[row] = True
+        self._index_payload(row, payload)
+
+    def _merge_payload(self, pid: str, payload: dict) -> None:
+        row = self._rows.get(pid)
+        if row is None:
+            return
+        self._unindex_payload(row)
+        self._payloads[row] = {**self._payloads[row], **payload}
+        self._index_payload(row, self._payloads[row])
+
+    def _remove(self, pid: str) -> None:
+        row = self._rows.pop(pid, None)
+        if row is None:
+            return
+        self._unindex_payload(row)
+        self._ids[row] = None
+        self._payloads[row] = None
+        self._live[row] = False
+        self._pub_ts[row] = np.nan
+        self._importance[row] = -1
+        self._free.append(row)
+
+    # --------------------------------------------------------------- points
+    def upsert(self, points: Iterable[Tuple[str, Sequence[float], dict]]) -> int:
+        """Insert or overwrite points: (point_id, vector, payload). Returns the count."""
+        points = list(points)
+        if not points:
+            return 0
+        vectors = np.asarray([p[1] for p in points], dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms == 0, 1, norms)
+        with self._lock:
+            ops, rows = [], []
+            for pid, _, payload in points:
+                row = self._rows.get(pid)
+                if row is None:
+                    if not self._free:
+                        self._grow(self._capacity * 2)
+                    row = self._free.pop()
+                self._place(pid, row, payload)
+                rows.append(row)
+                ops.append({"op": "put", "id": pid, "row": row, "payload": payload})
+            self._vectors[rows] = vectors
+            if self._assign is not None:
+                self._assign[rows] = self._nearest_centroid(vectors)
+            if isinstance(self._vectors, np.memmap):
+                self._vectors.flush()
+            self._append(ops)
+        return len(points)
+
+    def retrieve(self, point_ids: Iterable[str]) -> List[str]:
+        """Which of these point ids exist."""
+        with self._lock:
+            return [pid for pid in point_ids if pid in self._rows]
+
+    def set_payloads(self, payloads: Dict[str, dict]) -> int:
+        """Merge payload fields into existing points."""
+        with self._lock:
+            ops = []
+            for pid, payload in payloads.items():
+                if pid in self._rows:
+                    self._merge_payload(pid, payload)
+                    ops.append({"op": "set", "id": pid, "payload": payload})
+            self._append(ops)
+            return len(ops)
+
+    def delete(self, point_ids: Iterable[str]) -> int:
+        with self._lock:
+            ops = []
+            for pid in point_ids:
+                if pid in self._rows:
+                    self._remove(pid)
+                    ops.append({"op": "del", "id": pid})
+            self._append(ops)
+            return len(ops)
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._rows)
+
+    # --------------------------------------------------------------- search
+    def _filter_mask(
+        self,
+        topic_ids: Optional[Sequence[str]],
+        after: Optional[float],
+        before: Optional[float],
+        min_importance: Optional[int],
+    ) -> np.ndarray:
+        mask = self._live.copy()
+        if topic_ids:
+            topic_mask = np.zeros(self._capacity, dtype=bool)
+            for topic in topic_ids:
+                rows = self._topic_rows.get(topic)
+                if rows:
+                    topic_mask[list(rows)] = True
+            mask &= topic_mask
+        with np.errstate(invalid="ignore"):
+            if after is not None:
+                mask &= self._pub_ts >= after
+            if before is not None:
+                mask &= self._pub_ts <= before
+        if min_importance is not None:
+            mask &= self._importance >= min_importance
+        return mask
+
+    def search(
+        self,
+        vector: Sequence[float],
+        limit: int = 10,
+        min_score: Optional[float] = None,
+        topic_ids: Optional[Sequence[str]] = None,
+        published_after: Optional[float] = None,
+        published_before: Optional[float] = None,
+        min_importance: Optional[int] = None,
+    ) -> List[Tuple[str, float, dict]]:
+        """Top-limit (point_id, cosine score, payload), best first."""
+        query = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+        query /= norm
+        with self._lock:
+            mask = self._filter_mask(topic_ids, published_after, published_before, min_importance)
+            if self._ivf_ready():
+                probes = np.argsort(self._centroids @ query)[::-1][:IVF_PROBES]
+                mask &= np.isin(self._assign, probes)
+            candidates = np.flatnonzero(mask)
+            best_rows = np.empty(0, dtype=np.int64)
+            best_scores = np.empty(0, dtype=np.float32)
+            for start in range(0, candidates.size, SEARCH_BLOCK_ROWS):
+                rows = candidates[start:start + SEARCH_BLOCK_ROWS]
+                scores = self._vectors[rows] @ query
+                rows = np.concatenate([best_rows, rows])
+                scores = np.concatenate([best_scores, scores])
+                if scores.size > limit:
+                    top = np.argpartition(-scores, limit - 1)[:limit]
+                    rows, scores = rows[top], scores[top]
+                best_rows, best_scores = rows, scores
+            order = np.argsort(-best_scores)
+            return [
+                (self._ids[best_rows[i]], float(best_scores[i]), dict(self._payloads[best_rows[i]]))
+                for i in order
+                if min_score is None or best_scores[i] >= min_score
+            ]
+
+    # ------------------------------------------------------------------ IVF
+    def _ivf_ready(self) -> bool:
+        if self.ivf_lists <= 0 or len(self._rows) < IVF_MIN_ROWS:
+            return False
+        # Retrain once the corpus has grown by half since the last training
+        if self._assign is None or len(self._rows) > 1.5 * self._ivf_rows_at_train:
+            self._train_ivf()
+        return True
+
+    def _train_ivf(self) -> None:
+        live = np.flatnonzero(self._live)
+        rng = np.random.default_rng(0)
+        sample = self._vectors[rng.choice(live, size=min(live.size, self.ivf_lists * 256), replace=False)]
+        centroids = sample[rng.choice(sample.shape[0], size=self.ivf_lists, replace=False)].copy()
+        for _ in range(_KMEANS_ITERATIONS):
+            nearest = np.argmax(sample @ centroids.T, axis=1)
+            for k in range(self.ivf_lists):
+                members = sample[nearest == k]
+                if members.size:
+                    c = members.mean(axis=0)
+                    centroids[k] = c / (np.linalg.norm(c) or 1)
+        self._centroids = centroids
+        self._assign = np.full(self._capacity, -1, dtype=np.int64)
+        for start in range(0, live.size, SEARCH_BLOCK_ROWS):
+            rows = live[start:start + SEARCH_BLOCK_ROWS]
+            self._assign[rows] = self._nearest_centroid(self._vectors[rows])
+        self._ivf_rows_at_train = len(self._rows)
+        logger.info(f"Local vector store: IVF trained, {self.ivf_lists} lists over {live.size} points")
+
+    def _nearest_centroid(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(vectors @ self._centroids.T, axis=1)
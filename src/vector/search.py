@@ -1,6 +1,11 @@
 """Vector search. Local Qdrant + Perigon in parallel."""
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict
+from typing import Any, Callable, Dict, List, Optional
 from .embedder import embed
 from .client import search as qdrant_search
 from src.clients.perigon.news_api_client import NewsApiClient
@@ -9,19 +14,180 @@ from utils.app_logging import get_logger
 
 logger = get_logger(__name__)
 
+# ============================================================================
+# SEARCH CACHE
+# ============================================================================
+# Chat users and agents repeat near-identical queries within minutes.
+# Layers: normalized query -> statement (skips the LLM call),
+#         statement -> vector (embedder's persistent embedding cache),
+#         (statement, limit, include_perigon) -> results (short TTL).
+# Concurrent identical requests for a missing entry share one computation.
+SEARCH_STATEMENT_CACHE_TTL_S = float(os.getenv("SEARCH_STATEMENT_CACHE_TTL_S", "3600"))
+SEARCH_RESULT_CACHE_TTL_S = float(os.getenv("SEARCH_RESULT_CACHE_TTL_S", "300"))
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "1000"))
+
+_cache_lock = threading.Lock()
+_statement_cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+_result_cache: "OrderedDict[tuple, tuple[float, List[Dict]]]" = OrderedDict()
+_cache_stats = {
+    "statement_hits": 0, "statement_misses": 0,
+    "result_hits": 0, "result_misses": 0,
+    "coalesced": 0,
+}
+_in_flight: Dict[Any, "_Flight"] = {}
+_perigon_client = None
+_perigon_lock = threading.Lock()
+
+
+class _Flight:
+    """One in-progress computation that identical callers wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def _cache_get(cache: OrderedDict, key: Any, ttl: float, kind: str) -> Any:
+    with _cache_lock:
+        entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            cache.move_to_end(key)
+            _cache_stats[f"{kind}_hits"] += 1
+            return entry[1]
+        if entry is not None:
+            del cache[key]
+        _cache_stats[f"{kind}_misses"] += 1
+        return None
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any) -> None:
+    with _cache_lock:
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        while len(cache) > SEARCH_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def _single_flight(key: Any, fn: Callable[[], Any]) -> Any:
+    """Run fn once per key at a time; concurrent callers with the same key get its result."""
+    with _cache_lock:
+        flight = _in_flight.get(key)
+        leader = flight is None
+        if leader:
+            flight = _in_flight[key] = _Flight()
+        else:
+            _cache_stats["coalesced"] += 1
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+    try:
+        flight.value = fn()
+        return flight.value
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _cache_lock:
+            _in_flight.pop(key, None)
+        flight.done.set()
+
+
+def _normalize(query: str) -> str:
+    return re.sub(r"\s+", " ", query).strip().lower()
+
+
+def _get_statement(query: str) -> str:
+    key = _normalize(query)
+    statement = _cache_get(_statement_cache, key, SEARCH_STATEMENT_CACHE_TTL_S, "statement")
+    if statement is None:
+        statement = _single_flight(("statement", key), lambda: convert_query_to_statement(query))
+        _cache_put(_statement_cache, key, statement)
+    return statement
+
+
+def _get_perigon_client() -> NewsApiClient:
+    global _perigon_client
+    if _perigon_client is None:
+        with _perigon_lock:
+            if _perigon_client is None:
+                _perigon_client = NewsApiClient()
+    return _perigon_client
+
+
+def get_search_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters per cache layer, coalesced requests and current sizes."""
+    from .embedder import get_cache_stats
+    with _cache_lock:
+        return {
+            **_cache_stats,
+            "statements_cached": len(_statement_cache),
+            "results_cached": len(_result_cache),
+            "in_flight": len(_in_flight),
+            "embedding": get_cache_stats(),
+        }
+
+
+def clear_search_cache() -> None:
+    """Drop cached statements and results (e.g. after a bulk reindex)."""
+    with _cache_lock:
+        _statement_cache.clear()
+        _result_cache.clear()
+
 
 def search_articles(
     query: str,
     limit: int = 10,
-    include_perigon: bool = True
+    include_perigon: bool = True,
+    topic_ids: Optional[List[str]] = None,
+    published_after: Optional[float] = None,
+    published_before: Optional[float] = None,
+    min_importance: Optional[int] = None,
 ) -> List[Dict]:
-    """Search Qdrant + Perigon in parallel, dedupe, return best results."""
-    statement = convert_query_to_statement(query)
+    """
+    Search Qdrant + Perigon in parallel, dedupe, return best results (cached, see above).
+
+    topic_ids / published_after / published_before (epoch seconds or ISO) /
+    min_importance filter the local search inside Qdrant. Perigon cannot apply
+    them, so it is skipped whenever a filter is given.
+    """
+    statement = _get_statement(query)
+    filters = {
+        "topic_ids": tuple(sorted(topic_ids)) if topic_ids else None,
+        "published_after": published_after,
+        "published_before": published_before,
+        "min_importance": min_importance,
+    }
+    if any(v is not None for v in filters.values()):
+        include_perigon = False
+    key = (statement, limit, include_perigon, tuple(filters.items()))
+    results = _cache_get(_result_cache, key, SEARCH_RESULT_CACHE_TTL_S, "result")
+    if results is None:
+        results = _single_flight(
+            ("results", key), lambda: _search_uncached(statement, limit, include_perigon, filters)
+        )
+        if results:  # an empty list usually means both backends failed - retry next time
+            _cache_put(_result_cache, key, results)
+    # Callers may annotate results; keep the cached copies clean
+    return [dict(r) for r in results]
+
+
+def _search_uncached(statement: str, limit: int, include_perigon: bool, filters: Dict[str, Any]) -> List[Dict]:
     vector = embed(statement)
 
     def search_local():
         try:
-            results = qdrant_search(vector=vector, limit=limit)
+            topic_ids = filters.get("topic_ids")
+            results = qdrant_search(
+                vector=vector,
+                limit=limit,
+                topic_ids=list(topic_ids) if topic_ids else None,
+                published_after=filters.get("published_after"),
+                published_before=filters.get("published_before"),
+                min_importance=filters.get("min_importance"),
+            )
             logger.info(f"Qdrant: {len(results)} results")
             return results
         except Exception as e:
@@ -30,7 +196,7 @@ def search_articles(
 
     def search_perigon():
         try:
-            client = NewsApiClient()
+            client = _get_perigon_client()
             response = client.vector_search(statement, max_results=limit)
             articles = response.get("articles", [])
             for a in articles:
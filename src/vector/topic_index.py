@@ -0,0 +1,221 @@
+"""In-memory topic embedding index. Shortlists candidate topics for an article.
+
+find_topic_mapping used to get every topic in its prompt. This index embeds
+each topic (name, type, analysis snippet) with the same fastembed model as the
+article index, and ranks topics by cosine similarity with one matrix product,
+so the LLM only sees the top-K candidates.
+
+Kept in sync incrementally: create_topic -> refresh_topic, remove_topic -> drop_topic,
+and a rewrite (analysis_rewriter_with_agents) -> refresh_topic in the writing process.
+Other processes pick rewritten topics up every TOPIC_INDEX_REFRESH_S by
+re-embedding topics whose last_analyzed moved since the last check.
+"""
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .embedder import embed, embed_batch, VECTOR_SIZE
+from src.graph.neo4j_client import run_cypher
+from utils.app_logging import get_logger
+
+logger = get_logger(__name__)
+
+# How many candidate topics the LLM sees per article
+TOP_K = int(os.getenv("TOPIC_PREFILTER_TOP_K", "40"))
+# Set to "false" to always send the full topic list
+ENABLED = os.getenv("TOPIC_PREFILTER_ENABLED", "true").lower() == "true"
+SNIPPET_CHARS = 300
+# How often get_topic_index() re-embeds topics rewritten since the last check
+REFRESH_INTERVAL_S = float(os.getenv("TOPIC_INDEX_REFRESH_S", "900"))
+# Slack for clock skew between this process and the graph's datetime()
+_REFRESH_SLACK_S = 120
+
+_CHANGED_QUERY = """
+MATCH (t:Topic)
+WHERE t.last_analyzed >= datetime({epochMillis: $since_ms})
+RETURN t.id AS id
+"""
+
+_TOPIC_QUERY = """
+MATCH (t:Topic)
+WHERE $ids IS NULL OR t.id IN $ids
+RETURN t.id AS id, t.name AS name, t.type AS type,
+       COALESCE(
+           substring(t.house_view, 0, $chars),
+           substring(t.current_analysis, 0, $chars),
+           substring(t.medium_analysis, 0, $chars),
+           substring(t.fundamental_analysis, 0, $chars),
+           ""
+       ) AS snippet
+"""
+
+
+def _topic_text(row: Dict) -> str:
+    name = row.get("name") or row.get("id") or ""
+    topic_type = row.get("type") or ""
+    header = f"{name} ({topic_type})" if topic_type else name
+    snippet = row.get("snippet") or ""
+    return f"{header}. {snippet}".strip()
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class TopicIndex:
+    """Row-normalized float32 matrix of topic embeddings + id list. Thread-safe."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._ids: List[str] = []
+        self._pos: Dict[str, int] = {}
+        self._matrix = np.zeros((0, VECTOR_SIZE), dtype=np.float32)
+        self.built = False
+        self.checked_at = 0.0  # epoch of the last build / refresh_changed
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, topic_id: str) -> bool:
+        return topic_id in self._pos
+
+    def build(self) -> int:
+        """(Re)build from all topics in the graph. Returns topic count."""
+        started = time.time()
+        rows = run_cypher(_TOPIC_QUERY, {"ids": None, "chars": SNIPPET_CHARS})
+        rows = [r for r in rows if r.get("id")]
+        vectors = embed_batch([_topic_text(r) for r in rows]) if rows else []
+        matrix = _normalize(np.asarray(vectors, dtype=np.float32).reshape(-1, VECTOR_SIZE))
+        with self._lock:
+            self._ids = [r["id"] for r in rows]
+            self._pos = {tid: i for i, tid in enumerate(self._ids)}
+            self._matrix = matrix
+            self.built = True
+            self.checked_at = started
+        logger.info(f"Topic index built: {len(rows)} topics")
+        return len(rows)
+
+    def upsert(self, topic_ids: List[str]) -> None:
+        """Re-embed the given topics from the graph (add new ones, replace changed ones)."""
+        rows = run_cypher(_TOPIC_QUERY, {"ids": list(topic_ids), "chars": SNIPPET_CHARS})
+        rows = [r for r in rows if r.get("id")]
+        if not rows:
+            return
+        vectors = _normalize(
+            np.asarray(embed_batch([_topic_text(r) for r in rows]), dtype=np.float32)
+        )
+        with self._lock:
+            new_rows = []
+            for row, vec in zip(rows, vectors):
+                pos = self._pos.get(row["id"])
+                if pos is None:
+                    self._pos[row["id"]] = len(self._ids) + len(new_rows)
+                    new_rows.append(vec)
+                    self._ids.append(row["id"])
+                else:
+                    self._matrix[pos] = vec
+            if new_rows:
+                self._matrix = np.vstack([self._matrix, np.stack(new_rows)])
+
+    def refresh_changed(self) -> int:
+        """Re-embed topics analyzed since the last check (rewrites in other processes)."""
+        started = time.time()
+        since_ms = int((self.checked_at - _REFRESH_SLACK_S) * 1000)
+        ids = [r["id"] for r in run_cypher(_CHANGED_QUERY, {"since_ms": since_ms}) or [] if r.get("id")]
+        if ids:
+            self.upsert(ids)
+            logger.info(f"Topic index refreshed: {len(ids)} rewritten topics")
+        self.checked_at = started
+        return len(ids)
+
+    def remove(self, topic_id: str) -> None:
+        with self._lock:
+            pos = self._pos.pop(topic_id, None)
+            if pos is None:
+                return
+            self._matrix = np.delete(self._matrix, pos, axis=0)
+            del self._ids[pos]
+            self._pos = {tid: i for i, tid in enumerate(self._ids)}
+
+    def top_k(self, text: str, k: int = TOP_K, among: Optional[set] = None) -> List[str]:
+        """Topic IDs most similar to text, best first (optionally only those in `among`)."""
+        query = np.asarray(embed(text), dtype=np.float32)
+        query /= np.linalg.norm(query) or 1.0
+        with self._lock:
+            if not self._ids:
+                return []
+            scores = self._matrix @ query
+            ids = list(self._ids)
+        if among is not None:
+            mask = np.fromiter((tid in among for tid in ids), dtype=bool, count=len(ids))
+            scores = np.where(mask, scores, -np.inf)
+            k = min(k, int(mask.sum()))
+        k = min(k, len(ids))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [ids[i] for i in top]
+
+
+_index: Optional[TopicIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_topic_index() -> TopicIndex:
+    """Process-wide topic index, built from the graph on first use."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            index = TopicIndex()
+            index.build()
+            _index = index
+        elif time.time() - _index.checked_at > REFRESH_INTERVAL_S:
+            try:
+                _index.refresh_changed()
+            except Exception as e:
+                logger.warning(f"Topic index refresh failed: {e}")
+    return _index
+
+
+def refresh_topic(topic_id: str) -> None:
+    """Embed a created/updated topic (no-op until the index has been built)."""
+    if _index is None:
+        return
+    try:
+        _index.upsert([topic_id])
+    except Exception as e:
+        logger.warning(f"Topic index refresh failed for {topic_id}: {e}")
+
+
+def drop_topic(topic_id: str) -> None:
+    """Remove a deleted topic from the index (no-op until built)."""
+    if _index is not None:
+        _index.remove(topic_id)
+
+
+def shortlist_topic_ids(article_text: str, topic_ids: List[str], k: int = TOP_K) -> List[str]:
+    """
+    Keep the k topics most similar to the article, preserving the input order.
+
+    Returns topic_ids unchanged when prefiltering is disabled, the list is
+    already small, or the embedding index is unavailable (fail open).
+    """
+    if not ENABLED or len(topic_ids) <= k:
+        return list(topic_ids)
+    try:
+        index = get_topic_index()
+        # Topics the index has not seen yet (created elsewhere) are embedded now
+        missing = [tid for tid in topic_ids if tid not in index]
+        if missing:
+            index.upsert(missing)
+        keep = set(index.top_k(article_text, k, among=set(topic_ids)))
+    except Exception as e:
+        logger.warning(f"Topic prefilter unavailable, using full topic list: {e}")
+        return list(topic_ids)
+    return [tid for tid in topic_ids if tid in keep]
@@ -0,0 +1,97 @@
+"""
+Test the embedded vector store (VECTOR_BACKEND=local): upsert, filtered
+search, delete, and reopening a store from disk.
+"""
+import os
+import sys
+import tempfile
+
+# Add project root to path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.vector.local_store import LocalVectorStore
+
+DIM = 4
+
+POINTS = [
+    ("a1", [1.0, 0.0, 0.0, 0.0], {"topics": ["fed"], "pub_ts": 100.0, "importance": 3}),
+    ("a2", [0.9, 0.1, 0.0, 0.0], {"topics": ["fed", "ecb"], "pub_ts": 200.0, "importance": 2}),
+    ("a3", [0.0, 1.0, 0.0, 0.0], {"topics": ["ecb"], "pub_ts": 300.0, "importance": 1}),
+    ("a4", [0.0, 0.0, 1.0, 0.0], {"topics": ["oil"], "pub_ts": 400.0}),
+]
+QUERY = [1.0, 0.0, 0.0, 0.0]
+
+
+def _ids(results):
+    return [pid for pid, _, _ in results]
+
+
+def test_upsert_and_search():
+    store = LocalVectorStore(DIM, path=":memory:")
+    assert store.upsert(POINTS) == 4
+    assert store.count() == 4
+
+    results = store.search(QUERY, limit=2)
+    assert _ids(results) == ["a1", "a2"]
+    assert abs(results[0][1] - 1.0) < 1e-6
+    assert results[0][2]["topics"] == ["fed"]
+
+    # Overwrite keeps one point per id and re-indexes its payload
+    store.upsert([("a3", [1.0, 0.0, 0.0, 0.0], {"topics": ["oil"], "pub_ts": 300.0, "importance": 1})])
+    assert store.count() == 4
+    assert _ids(store.search(QUERY, limit=4, topic_ids=["ecb"])) == ["a2"]
+
+
+def test_filtered_search():
+    store = LocalVectorStore(DIM, path=":memory:")
+    store.upsert(POINTS)
+
+    assert _ids(store.search(QUERY, limit=10, topic_ids=["ecb"])) == ["a2", "a3"]
+    assert _ids(store.search(QUERY, limit=10, published_after=150.0, published_before=350.0)) == ["a2", "a3"]
+    assert _ids(store.search(QUERY, limit=10, min_importance=2)) == ["a1", "a2"]
+    assert _ids(store.search(QUERY, limit=10, min_score=0.5)) == ["a1", "a2"]
+    assert store.search([0.0, 0.0, 0.0, 0.0], limit=10) == []
+
+    store.set_payloads({"a4": {"topics": ["fed"], "importance": 3}})
+    assert _ids(store.search(QUERY, limit=10, topic_ids=["fed"], min_importance=3)) == ["a1", "a4"]
+
+
+def test_delete():
+    store = LocalVectorStore(DIM, path=":memory:")
+    store.upsert(POINTS)
+
+    assert store.delete(["a1", "missing"]) == 1
+    assert store.count() == 3
+    assert store.retrieve(["a1", "a2"]) == ["a2"]
+    assert "a1" not in _ids(store.search(QUERY, limit=10))
+    assert _ids(store.search(QUERY, limit=10, topic_ids=["fed"])) == ["a2"]
+
+    # Freed rows are reused
+    store.upsert([("a5", [1.0, 0.0, 0.0, 0.0], {"topics": ["fed"]})])
+    assert store.count() == 4
+    assert _ids(store.search(QUERY, limit=1)) == ["a5"]
+
+
+def test_reopen():
+    with tempfile.TemporaryDirectory() as path:
+        store = LocalVectorStore(DIM, path=path)
+        store.upsert(POINTS)
+        store.set_payloads({"a3": {"importance": 3}})
+        store.delete(["a1"])
+        expected = store.search(QUERY, limit=10)
+
+        reopened = LocalVectorStore(DIM, path=path)
+        assert reopened.count() == 3
+        assert reopened.retrieve(["a1", "a2", "a3", "a4"]) == ["a2", "a3", "a4"]
+        assert _ids(reopened.search(QUERY, limit=10)) == _ids(expected)
+        assert _ids(reopened.search(QUERY, limit=10, min_importance=3)) == ["a3"]
+        assert _ids(reopened.search(QUERY, limit=10, topic_ids=["fed"])) == ["a2"]
+
+
+if __name__ == "__main__":
+    test_upsert_and_search()
+    test_filtered_search()
+    test_delete()
+    test_reopen()
+    print("✅ Local vector store tests passed")